@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+"""
+Bench - Time the scripts/ tools phase by phase on synthetic ecosystems.
+
+For each scale (number of projects) a deterministic ecosystem is generated
+with generate_ecosystem.py, then every tool is run cold (tool caches removed,
+file pages dropped from the OS cache where supported) and warm (immediately
+again). Wall and CPU time are recorded per phase and written as JSON.
+
+Runs fully offline: validate_project's Discord alerts are replaced with a
+no-op, and the scaffold package is stubbed when it is not installed.
+
+`bench.py compare` is the regression gate. It repeats each warm run, then
+compares median wall/CPU time (noise-aware, using MAD), peak memory, files
+read and bytes read against benchmarks/baselines.json, and exits 1 on
+regression.
+
+Usage:
+    python benchmarks/bench.py run
+    python benchmarks/bench.py run --scales 10 100 --tools warden_audit --output bench.json
+    python benchmarks/bench.py compare
+    python benchmarks/bench.py compare --update-baseline
+"""
+
+import argparse
+import builtins
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from dedup import DEDUP  # noqa: E402
+from index_catalog import CATALOG  # noqa: E402
+from generate_ecosystem import EcosystemConfig, generate_ecosystem  # noqa: E402
+
+DEFAULT_SCALES = [10, 100, 1000]
+BASELINES = BENCH_DIR / "baselines.json"
+# Gate scenarios: small enough to repeat on every change
+COMPARE_SCALES = [10, 100]
+COMPARE_REPEAT = 5
+
+# Regression thresholds. Timings must exceed the baseline median by more than
+# MAD_SIGMAS robust standard deviations AND by TIME_FLOOR (relative) and
+# TIME_FLOOR_S (absolute); deterministic counters use COUNTER_TOLERANCE.
+MAD_SIGMAS = 3.0
+TIME_FLOOR = 0.10
+TIME_FLOOR_S = 0.005
+MEMORY_TOLERANCE = 0.10
+COUNTER_TOLERANCE = 0.02
+# Tool caches written next to the scanned trees; removed for cold runs
+TOOL_CACHES = [".skills-manifest.json", ".validate-cache.json", ".drift-index.json"]
+
+
+class PhaseTimer:
+    """Collect wall and CPU time per named phase."""
+
+    def __init__(self):
+        self.phases: dict[str, dict[str, float]] = {}
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        # Each phase stands for a fresh process: drop run-scoped memos
+        DEDUP.clear()
+        CATALOG.clear()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            totals = self.phases.setdefault(name, {"wall_s": 0.0, "cpu_s": 0.0})
+            totals["wall_s"] += time.perf_counter() - wall
+            totals["cpu_s"] += time.process_time() - cpu
+
+
+class CountingFile:
+    """File proxy that counts bytes read through it."""
+
+    def __init__(self, f, counter: "IOCounter"):
+        self._f = f
+        self._counter = counter
+
+    def _count(self, data):
+        self._counter.bytes_read += len(data) if data else 0
+        return data
+
+    def read(self, *args):
+        return self._count(self._f.read(*args))
+
+    def readline(self, *args):
+        return self._count(self._f.readline(*args))
+
+    def readlines(self, *args):
+        lines = self._f.readlines(*args)
+        self._counter.bytes_read += sum(len(line) for line in lines)
+        return lines
+
+    def readinto(self, buffer):
+        n = self._f.readinto(buffer)
+        self._counter.bytes_read += n or 0
+        return n
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self._count(next(self._f))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return self._f.__exit__(*exc)
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+
+class IOCounter:
+    """Count files opened for reading and bytes read while active.
+
+    Patches io.open (used by pathlib) and builtins.open. Reads done by
+    subprocesses such as ripgrep are not counted.
+    """
+
+    def __init__(self):
+        self.files_read = 0
+        self.bytes_read = 0
+
+    @contextlib.contextmanager
+    def active(self):
+        real_open = io.open
+
+        def counting_open(file, mode='r', *args, **kwargs):
+            f = real_open(file, mode, *args, **kwargs)
+            if 'r' in mode and '+' not in mode:
+                self.files_read += 1
+                return CountingFile(f, self)
+            return f
+
+        io.open = builtins.open = counting_open
+        try:
+            yield self
+        finally:
+            io.open = builtins.open = real_open
+
+
+def import_validate_project():
+    """Import validate_project with the Discord alert path stubbed out."""
+    try:
+        import scaffold  # noqa: F401
+    except ImportError:
+        # Minimal stand-ins for the scaffold package validate_project imports
+        stubs = {
+            "scaffold": types.ModuleType("scaffold"),
+            "scaffold.utils": types.ModuleType("scaffold.utils"),
+            "scaffold.alerts": types.ModuleType("scaffold.alerts"),
+            "scaffold.constants": types.ModuleType("scaffold.constants"),
+        }
+        stubs["scaffold.utils"].safe_slug = lambda name: name.lower().replace(" ", "-")
+        stubs["scaffold.alerts"].send_discord_alert = lambda message: None
+        stubs["scaffold.constants"].PROTECTED_PROJECTS = set()
+        sys.modules.update(stubs)
+
+    import validate_project
+    validate_project.send_discord_alert = lambda message: None  # Never reach the network
+    return validate_project
+
+
+def bench_warden_audit(root: Path, timer: PhaseTimer) -> None:
+    import warden_audit
+
+    with timer.phase("discovery"):
+        indexes = [
+            p for p in root.rglob('00_Index_*.md')
+            if not any(part in p.parts for part in ['templates', 'venv', '.git'])
+        ]
+    with timer.phase("tiering"):
+        for index_path in indexes:
+            warden_audit.is_tier_1_project(index_path)
+    with timer.phase("doc_ratio"):
+        for index_path in indexes:
+            warden_audit.check_doc_ratio(index_path.parent)
+    with timer.phase("dangerous_scan"):
+        for index_path in indexes:
+            warden_audit.check_dangerous_functions(index_path.parent)
+    with timer.phase("dangerous_scan_fast"):
+        for index_path in indexes:
+            warden_audit.check_dangerous_functions_fast(index_path.parent)
+    with timer.phase("total"):
+        warden_audit.run_audit(root)
+
+
+def bench_validate_project(root: Path, timer: PhaseTimer) -> None:
+    validate_project = import_validate_project()
+    validate_project.PROJECTS_ROOT = root
+
+    with timer.phase("discovery"):
+        projects = validate_project.find_projects(root)
+    with timer.phase("index"):
+        for project in projects:
+            has_index, index_path = validate_project.has_index_file(project)
+            if has_index:
+                validate_project.validate_index_content(index_path)
+    with timer.phase("dna"):
+        for project in projects:
+            validate_project.validate_dna_integrity(project)
+    with timer.phase("total"):
+        for project in projects:
+            validate_project.validate_project(project, verbose=False)
+
+
+def bench_detect_skill_candidates(root: Path, timer: PhaseTimer) -> None:
+    import detect_skill_candidates as dsc
+
+    with timer.phase("discovery"):
+        dsc.find_projects(root)
+    with timer.phase("known_skills"):
+        skills = dsc.load_known_skills(root / "_library")
+    with timer.phase("skill_usage"):
+        dsc.detect_skill_usage(root, skills)
+    with timer.phase("instruction_patterns"):
+        patterns = dsc.detect_instruction_patterns(root)
+    with timer.phase("candidates"):
+        dsc.find_repeated_patterns(patterns)
+    with timer.phase("feedback"):
+        dsc.collect_skill_feedback(root)
+
+
+def bench_validate_skills(root: Path, timer: PhaseTimer) -> None:
+    import skill_manifest
+    import validate_skills
+
+    library = root / "_library"
+    cache = validate_skills.load_validation_cache(library)
+    with timer.phase("manifest"):
+        skill_manifest.load_manifest(library)
+    with timer.phase("validate"):
+        for tree in ["claude-skills", "cursor-rules", "antigravity-rules"]:
+            validate_skills.validate_tree(library, tree, cache=cache)
+    skill_manifest.write_json_atomic(
+        library / validate_skills.VALIDATION_CACHE,
+        {"version": validate_skills.VALIDATOR_VERSION, "results": cache},
+    )
+
+
+TOOLS = {
+    "warden_audit": bench_warden_audit,
+    "validate_project": bench_validate_project,
+    "detect_skill_candidates": bench_detect_skill_candidates,
+    "validate_skills": bench_validate_skills,
+}
+
+
+def make_cold(root: Path) -> None:
+    """Remove tool caches and drop file pages from the OS cache (best effort)."""
+    for dirpath, _, files in os.walk(root):
+        for name in files:
+            path = Path(dirpath) / name
+            if name in TOOL_CACHES:
+                path.unlink()
+                continue
+            if hasattr(os, "posix_fadvise"):
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                    try:
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                    finally:
+                        os.close(fd)
+                except OSError:
+                    pass
+
+
+def ensure_ecosystem(workdir: Path, projects: int, seed: int) -> Path:
+    """Generate (once) the ecosystem for one scale."""
+    root = workdir / f"eco-{projects}-seed{seed}"
+    if not (root / ".complete").exists():
+        generate_ecosystem(root, EcosystemConfig(projects=projects, seed=seed))
+        (root / ".complete").write_text("")
+    return root
+
+
+def run_tool(tool: str, root: Path) -> dict[str, dict[str, float]]:
+    """Run one tool's benchmark with its output silenced."""
+    timer = PhaseTimer()
+    logging.disable(logging.CRITICAL)
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            TOOLS[tool](root, timer)
+    finally:
+        logging.disable(logging.NOTSET)
+    return timer.phases
+
+
+def run_benchmarks(scales: list[int], tools: list[str], workdir: Path, seed: int) -> dict:
+    """Run every tool at every scale, cold then warm."""
+    results = []
+    for projects in scales:
+        root = ensure_ecosystem(workdir, projects, seed)
+        for tool in tools:
+            make_cold(root)
+            for cache in ("cold", "warm"):
+                print(f"  {tool:25} {projects:5} projects  {cache}", file=sys.stderr)
+                for phase, totals in run_tool(tool, root).items():
+                    results.append({
+                        "tool": tool,
+                        "phase": phase,
+                        "projects": projects,
+                        "cache": cache,
+                        **{k: round(v, 6) for k, v in totals.items()},
+                    })
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "scales": scales,
+        },
+        "results": results,
+    }
+
+
+def measure_tool(tool: str, root: Path, repeat: int) -> dict:
+    """Warm-cache metrics for one tool: repeated timings, then one counted run."""
+    run_tool(tool, root)  # Warm caches
+
+    wall, cpu = [], []
+    for _ in range(repeat):
+        phases = run_tool(tool, root)
+        wall.append(sum(p["wall_s"] for p in phases.values()))
+        cpu.append(sum(p["cpu_s"] for p in phases.values()))
+
+    # Memory and I/O are deterministic; one instrumented run is enough
+    counter = IOCounter()
+    tracemalloc.start()
+    try:
+        with counter.active():
+            run_tool(tool, root)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "wall_s": summarize(wall),
+        "cpu_s": summarize(cpu),
+        "peak_kib": round(peak / 1024),
+        "files_read": counter.files_read,
+        "bytes_read": counter.bytes_read,
+    }
+
+
+def summarize(samples: list[float]) -> dict:
+    """Median and median absolute deviation of timing samples."""
+    median = statistics.median(samples)
+    return {
+        "median": round(median, 6),
+        "mad": round(statistics.median(abs(s - median) for s in samples), 6),
+        "samples": len(samples),
+    }
+
+
+def compare_metrics(baseline: dict, current: dict) -> list[str]:
+    """Regressions of ``current`` against ``baseline`` for one scenario."""
+    regressions = []
+
+    for metric in ("wall_s", "cpu_s"):
+        base, new = baseline[metric], current[metric]
+        # 1.4826 * MAD estimates the standard deviation of normal noise
+        noise = 1.4826 * (base["mad"] ** 2 + new["mad"] ** 2) ** 0.5
+        allowed = max(MAD_SIGMAS * noise, TIME_FLOOR * base["median"], TIME_FLOOR_S)
+        if new["median"] - base["median"] > allowed:
+            regressions.append(
+                f"{metric}: {base['median']:.4f}s -> {new['median']:.4f}s (allowed +{allowed:.4f}s)"
+            )
+
+    for metric, tolerance in (
+        ("peak_kib", MEMORY_TOLERANCE),
+        ("files_read", COUNTER_TOLERANCE),
+        ("bytes_read", COUNTER_TOLERANCE),
+    ):
+        base, new = baseline[metric], current[metric]
+        if new > base * (1 + tolerance) and new - base > 1:
+            regressions.append(f"{metric}: {base} -> {new} (allowed +{tolerance:.0%})")
+
+    return regressions
+
+
+def run_compare(tools: list[str], workdir: Path, seed: int, repeat: int, update: bool) -> int:
+    """Measure every gate scenario and compare with (or update) the baselines."""
+    try:
+        baselines = json.loads(BASELINES.read_text())
+    except (OSError, ValueError):
+        baselines = {"meta": {}, "scenarios": {}}
+
+    machine = f"{platform.machine()} {platform.python_implementation()} {platform.python_version()}"
+    if not update and baselines["meta"].get("machine") not in (None, machine):
+        print(f"⚠️  Baselines were recorded on {baselines['meta']['machine']}; timings may not be comparable",
+              file=sys.stderr)
+
+    failed = 0
+    for projects in COMPARE_SCALES:
+        root = ensure_ecosystem(workdir, projects, seed)
+        for tool in tools:
+            scenario = f"{tool}@{projects}"
+            current = measure_tool(tool, root, repeat)
+
+            if update:
+                baselines["scenarios"][scenario] = current
+                print(f"  {scenario:35} baseline recorded")
+                continue
+
+            baseline = baselines["scenarios"].get(scenario)
+            if baseline is None:
+                print(f"  {scenario:35} no baseline (run with --update-baseline)")
+                continue
+
+            regressions = compare_metrics(baseline, current)
+            if regressions:
+                failed += 1
+                print(f"❌ {scenario}")
+                for regression in regressions:
+                    print(f"     {regression}")
+            else:
+                print(f"✅ {scenario:35} wall {current['wall_s']['median']:.4f}s "
+                      f"(baseline {baseline['wall_s']['median']:.4f}s)")
+
+    if update:
+        baselines["meta"] = {"machine": machine, "seed": seed, "repeat": repeat}
+        BASELINES.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaselines written to {BASELINES}")
+        return 0
+
+    print(f"\n{'❌' if failed else '✅'} {failed} scenario(s) regressed")
+    return 1 if failed else 0
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the scripts/ tools on synthetic ecosystems")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Time every tool and phase")
+    run.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES,
+                     help="Project counts to benchmark (default: 10 100 1000)")
+    run.add_argument('--tools', nargs='+', choices=sorted(TOOLS), default=list(TOOLS),
+                     help="Tools to benchmark (default: all)")
+    run.add_argument('--workdir', type=Path, default=Path(tempfile.gettempdir()) / "agent-skills-bench",
+                     help="Where generated ecosystems are kept between runs")
+    run.add_argument('--seed', type=int, default=42, help="Generator seed (default: 42)")
+    run.add_argument('--output', type=Path, help="Write results JSON here (default: stdout)")
+
+    compare = sub.add_parser("compare", help="Fail on regressions against stored baselines")
+    compare.add_argument('--tools', nargs='+', choices=sorted(TOOLS), default=list(TOOLS),
+                         help="Tools to compare (default: all)")
+    compare.add_argument('--workdir', type=Path, default=Path(tempfile.gettempdir()) / "agent-skills-bench",
+                         help="Where generated ecosystems are kept between runs")
+    compare.add_argument('--seed', type=int, default=42, help="Generator seed (default: 42)")
+    compare.add_argument('--repeat', type=int, default=COMPARE_REPEAT,
+                         help=f"Timed runs per scenario (default: {COMPARE_REPEAT})")
+    compare.add_argument('--update-baseline', action='store_true',
+                         help="Record current metrics as the new baselines")
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        return run_compare(args.tools, args.workdir, args.seed, args.repeat, args.update_baseline)
+
+    if args.command == "run":
+        report = run_benchmarks(args.scales, args.tools, args.workdir, args.seed)
+        output = json.dumps(report, indent=2)
+        if args.output:
+            args.output.write_text(output + "\n")
+        else:
+            print(output)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
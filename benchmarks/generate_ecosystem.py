@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Generate Ecosystem - Deterministic synthetic project roots for benchmarks.
+
+Builds a projects root shaped like the real ecosystem the scripts/ tools
+scan: project folders with 00_Index_*.md files, code and docs at some
+nesting depth, node_modules bulk, instruction files, and planted findings
+(dangerous calls, absolute paths, secrets, placeholders). A synthetic skills
+library is written to <root>/_library for validate_skills.
+
+The same arguments and seed always produce byte-identical trees.
+
+Usage:
+    python benchmarks/generate_ecosystem.py /tmp/eco --projects 100
+    python benchmarks/generate_ecosystem.py /tmp/eco --projects 10 --planted 3 --seed 7
+"""
+
+import argparse
+import random
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+# Finding fragments are split so this file never matches the scanners itself
+PLANTED_FINDINGS = [
+    ("py", "import os\nos.re" + "move('build/output.txt')\n"),
+    ("py", "import shutil\nshutil.rm" + "tree('build')\n"),
+    ("sh", "#!/bin/bash\nr" + "m -rf ./build\n"),
+    ("py", "DATA_DIR = '/Us" + "ers/alice/projects/data'\n"),
+    ("md", "Open the file at /Us" + "ers/bob/notes.md to continue.\n"),
+    ("py", "API_KEY = 'sk" + "-" + "a1B2c3D4" * 5 + "'\n"),
+    ("md", "Project name: {" + "{PROJECT_NAME}" + "}\n"),
+]
+
+# 00_Index_*.md variants: tier 1 code, tier 2 docs, broken frontmatter, none
+INDEX_VARIANTS = ["code", "docs", "invalid", "missing"]
+
+WORDS = (
+    "agent skill playbook review debug verify ensure check project module "
+    "handler config pipeline report schema cache index search render token "
+    "always never commit deploy follow template checklist workflow"
+).split()
+
+
+@dataclass
+class EcosystemConfig:
+    """Shape of a synthetic ecosystem."""
+    projects: int = 10
+    files_per_project: int = 20
+    lines_per_file: int = 60
+    depth: int = 3
+    node_modules_files: int = 20
+    planted: int = 1
+    skills: int = 20
+    seed: int = 42
+
+
+def sentence(rng: random.Random, words: int = 10) -> str:
+    """A deterministic pseudo-sentence."""
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def index_content(name: str, variant: str, rng: random.Random) -> str:
+    """Render a 00_Index file for one variant."""
+    if variant == "invalid":
+        return f"# {name}\n\nNo frontmatter here.\n"
+    tags = "  - map/project\n  - p/" + name + "\n"
+    if variant == "code":
+        tags += "  - type/code\n  - tech/python\n"
+    body = "\n".join(sentence(rng) for _ in range(4))
+    return (
+        f"---\ntags:\n{tags}status: #status/active\n---\n\n"
+        f"# {name}\n\n{body}\n\n"
+        "## Key Components\n\n- src/: application code\n\n"
+        "## Status\n\nActive.\n\n"
+        "## Skill Feedback\n\n"
+        f"- pr-review: {sentence(rng, 6)}\n\n"
+        "## New patterns emerging\n\n"
+        f"- {sentence(rng, 3)}: {sentence(rng, 5)}\n"
+    )
+
+
+def code_content(suffix: str, lines: int, rng: random.Random) -> str:
+    """Render a code or markdown file of roughly ``lines`` lines."""
+    if suffix == "md":
+        return "\n".join(
+            f"## {sentence(rng, 3)}" if i % 12 == 0 else sentence(rng) for i in range(lines)
+        ) + "\n"
+    comment = "#" if suffix in ("py", "sh") else "//"
+    return "\n".join(
+        f"{comment} {sentence(rng)}" if i % 5 == 0 else f"value_{i} = {rng.randint(0, 10**6)}"
+        for i in range(lines)
+    ) + "\n"
+
+
+def generate_project(root: Path, index: int, config: EcosystemConfig, rng: random.Random) -> None:
+    """Write one synthetic project."""
+    name = f"project-{index:04d}"
+    project = root / name
+    variant = INDEX_VARIANTS[index % len(INDEX_VARIANTS)]
+
+    # Mandatory scaffolding
+    for filename in ("README.md", "TODO.md", ".gitignore", ".cursorignore"):
+        write(project / filename, f"{sentence(rng)}\n")
+    (project / ".git").mkdir(parents=True, exist_ok=True)
+    (project / "Documents").mkdir(exist_ok=True)
+    if variant != "missing":
+        write(project / f"00_Index_{name}.md", index_content(name, variant, rng))
+
+    # Instruction files with shared and project-specific phrasing
+    write(project / "CLAUDE.md", "\n".join([
+        "Follow the playbook at agent-skills-library/playbooks/pr-review/.",
+        "Always verify the build before you push changes upstream.",
+        sentence(rng),
+    ]) + "\n")
+    write(project / "AGENTS.md", f"When asked to review, use the checklist.\n{sentence(rng)}\n")
+    write(project / ".cursorrules", f"AI assistant guidance: {sentence(rng)}\n")
+
+    # Code and docs spread across nested directories
+    suffixes = ["py", "py", "js", "ts", "sh", "md"]
+    for i in range(config.files_per_project):
+        suffix = suffixes[i % len(suffixes)]
+        depth = rng.randint(0, config.depth)
+        directory = project.joinpath("src", *[f"pkg{d}" for d in range(depth)])
+        lines = max(1, int(rng.gauss(config.lines_per_file, config.lines_per_file / 4)))
+        write(directory / f"module_{i:03d}.{suffix}", code_content(suffix, lines, rng))
+
+    # Vendored bulk every scanner should skip
+    for i in range(config.node_modules_files):
+        write(project / "node_modules" / f"dep{i % 5}" / f"index{i}.js", code_content("js", 40, rng))
+
+    # Planted findings at random depths
+    for i in range(config.planted):
+        suffix, snippet = PLANTED_FINDINGS[rng.randrange(len(PLANTED_FINDINGS))]
+        write(project / "src" / f"planted_{i:02d}.{suffix}", snippet)
+
+
+def generate_library(root: Path, config: EcosystemConfig, rng: random.Random) -> None:
+    """Write a synthetic skills library with all four trees."""
+    library = root / "_library"
+    for i in range(config.skills):
+        name = f"skill-{i:03d}"
+        follow = f"**Follow:** `agent-skills-library/playbooks/{name}/`\n"
+        write(library / "playbooks" / name / "README.md",
+              f"# {name} Playbook\n\n## Purpose\n\n{sentence(rng)}\n\n## Steps\n\n{sentence(rng)}\n")
+        write(library / "claude-skills" / name / "SKILL.md",
+              f"---\nname: {name}\ndescription: {sentence(rng)}\n---\n\n# {name}\n\n{follow}")
+        write(library / "cursor-rules" / name / "RULE.md", f"# {name} (Cursor Rule)\n\n{follow}")
+        write(library / "antigravity-rules" / name / "RULE.md",
+              f"---\nname: {name}\ndescription: {sentence(rng)}\n---\n\n# {name}\n\n{follow}")
+
+
+def generate_ecosystem(root: Path, config: EcosystemConfig) -> Path:
+    """Generate a full synthetic ecosystem under ``root``."""
+    rng = random.Random(config.seed)
+    root.mkdir(parents=True, exist_ok=True)
+    for index in range(config.projects):
+        generate_project(root, index, config, rng)
+    generate_library(root, config, rng)
+    return root
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic project root for benchmarks")
+    parser.add_argument('root', type=Path, help="Directory to create (must not exist)")
+    parser.add_argument('--projects', type=int, default=10, help="Number of projects (default: 10)")
+    parser.add_argument('--files', type=int, default=20, help="Code/doc files per project (default: 20)")
+    parser.add_argument('--lines', type=int, default=60, help="Mean lines per file (default: 60)")
+    parser.add_argument('--depth', type=int, default=3, help="Max directory nesting (default: 3)")
+    parser.add_argument('--node-modules', type=int, default=20, help="node_modules files per project (default: 20)")
+    parser.add_argument('--planted', type=int, default=1, help="Planted findings per project (default: 1)")
+    parser.add_argument('--skills', type=int, default=20, help="Skills in the synthetic library (default: 20)")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args()
+
+    if args.root.exists():
+        print(f"Error: {args.root} already exists")
+        return 1
+
+    config = EcosystemConfig(
+        projects=args.projects,
+        files_per_project=args.files,
+        lines_per_file=args.lines,
+        depth=args.depth,
+        node_modules_files=args.node_modules,
+        planted=args.planted,
+        skills=args.skills,
+        seed=args.seed,
+    )
+    generate_ecosystem(args.root, config)
+    print(f"Generated {args.projects} projects in: {args.root}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
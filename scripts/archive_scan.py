@@ -0,0 +1,134 @@
+"""
+Archive Scan - Stream members of committed archives through the scanners.
+
+A directory walk never sees secrets or absolute paths inside a committed
+.zip or .tar.gz. ARCHIVES reads zip and tar (.gz/.bz2/.xz) members in
+memory with zipfile/tarfile, without extracting anything to disk, so the
+shared ruleset can match them like ordinary files. Findings are reported as
+archive.zip!inner/path:line.
+
+Two limits bound the work. Members larger than max_member_bytes are
+skipped, as are binary members. Once budget_bytes of member content has
+been read in a run, the remaining members are skipped. Both show up as
+files_skipped.* in --profile output. Nested archives are not opened.
+
+    from archive_scan import ARCHIVES, is_archive
+
+    ARCHIVES.enable()
+    for inner, text in ARCHIVES.members(path, accept=lambda name: name.endswith(".md")):
+        ...
+"""
+
+import os
+import tarfile
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Callable, Iterator
+
+from instrumentation import PROFILER
+
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+MAX_MEMBER_BYTES = 1024 * 1024
+BUDGET_BYTES = 64 * 1024 * 1024
+# A NUL byte in the first block marks a member as binary
+BINARY_SNIFF_BYTES = 8192
+
+
+def is_archive(name: str) -> bool:
+    """Whether a file name has an archive suffix ARCHIVES can open."""
+    return name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def member_path(inner: str) -> PurePosixPath:
+    """An archive member's name as a path, for file_context() and suffix checks."""
+    return PurePosixPath(inner)
+
+
+class ArchiveReader:
+    """Streams text members out of zip and tar archives within a run-wide byte budget."""
+
+    def __init__(self):
+        self.enabled = False
+        self.max_member_bytes = MAX_MEMBER_BYTES
+        self.budget_bytes = BUDGET_BYTES
+        self.remaining = BUDGET_BYTES
+
+    def enable(self, max_member_bytes: int = MAX_MEMBER_BYTES, budget_bytes: int = BUDGET_BYTES) -> None:
+        self.enabled = True
+        self.max_member_bytes = max_member_bytes
+        self.budget_bytes = budget_bytes
+        self.remaining = budget_bytes
+
+    def reset_budget(self) -> None:
+        """Start a new budget, for long-running callers that scan in rounds."""
+        self.remaining = self.budget_bytes
+
+    def members(self, path: Path, accept: Callable[[str], bool] | None = None) -> Iterator[tuple[str, str]]:
+        """Yield (member name, text) for each admitted text member of an archive.
+
+        ``accept`` filters member names before anything is read. Corrupt or
+        unreadable archives raise (zipfile.BadZipFile, tarfile.TarError,
+        OSError, ...) after any members already yielded.
+        """
+        if os.fspath(path).lower().endswith(".zip"):
+            yield from self._zip_members(path, accept)
+        else:
+            yield from self._tar_members(path, accept)
+
+    def _zip_members(self, path: Path, accept) -> Iterator[tuple[str, str]]:
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                if info.flag_bits & 0x1:
+                    PROFILER.skip("archive_encrypted")
+                    continue
+                if not self._admit(info.filename, info.file_size, accept):
+                    continue
+                with archive.open(info) as member:
+                    text = self._read(member)
+                if text is not None:
+                    yield info.filename, text
+
+    def _tar_members(self, path: Path, accept) -> Iterator[tuple[str, str]]:
+        # Stream mode: one sequential pass, no seeking back through the compressed stream
+        with tarfile.open(path, mode="r|*") as archive:
+            for info in archive:
+                if not info.isfile() or not self._admit(info.name, info.size, accept):
+                    continue
+                member = archive.extractfile(info)
+                if member is None:
+                    continue
+                text = self._read(member)
+                if text is not None:
+                    yield info.name, text
+
+    def _admit(self, inner: str, size: int, accept) -> bool:
+        """Whether a member passes the caller's filter, the size limit and the budget."""
+        if accept is not None and not accept(inner):
+            PROFILER.skip("archive_member_type")
+            return False
+        if size > self.max_member_bytes:
+            PROFILER.skip("archive_member_too_large")
+            return False
+        if size > self.remaining:
+            PROFILER.skip("archive_budget")
+            return False
+        return True
+
+    def _read(self, member) -> str | None:
+        """Read an admitted member, never more than the limit its header claimed."""
+        data = member.read(self.max_member_bytes + 1)
+        if len(data) > self.max_member_bytes:
+            PROFILER.skip("archive_member_too_large")  # Header understated the size
+            return None
+        self.remaining -= len(data)
+        PROFILER.count("archive_members_read")
+        PROFILER.count("archive_bytes_read", len(data))
+        if b"\0" in data[:BINARY_SNIFF_BYTES]:
+            PROFILER.skip("archive_binary")
+            return None
+        return data.decode("utf-8", errors="ignore")
+
+
+ARCHIVES = ArchiveReader()
@@ -0,0 +1,164 @@
+"""
+AST Scan - Precise dangerous-call detection for Python files.
+
+The ruleset's regexes flag os.remove or an rm command wherever the text
+appears, including comments, docstrings and string literals. This tier parses
+.py files and reports only real calls: os.remove, os.unlink, shutil.rmtree,
+subprocess invocations whose argv starts with rm, and shell strings that run
+rm (os.system, subprocess with a command string). Aliased imports are
+resolved (import shutil as sh; from os import remove as rm_file).
+
+Only files containing one of PREFILTER's substrings, or rm as a word
+(RM_WORD), are parsed, and results are cached by content hash in a JSON file,
+so a warm pre-commit run parses only files that changed.
+
+Findings are (rule_id, line) pairs using the ids in governance_rules.json.
+"""
+
+import ast
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from instrumentation import PROFILER
+from skill_manifest import write_json_atomic
+
+AST_CACHE = ".ast-cache.json"
+AST_CACHE_VERSION = 1
+MAX_CACHE_ENTRIES = 50000
+
+# Substrings every detectable removal call contains, aliased or not
+PREFILTER = ("remove", "unlink", "rmtree")
+# What every rm invocation contains: ["rm"], ["/bin/rm"], "rm -rf x", "cd x && rm -rf y"
+RM_WORD = re.compile(r"\brm\b")
+
+REMOVAL_CALLS = {
+    "os.remove": "os-remove",
+    "os.unlink": "os-unlink",
+    "shutil.rmtree": "shutil-rmtree",
+}
+SUBPROCESS_CALLS = {
+    "subprocess.run", "subprocess.call", "subprocess.Popen",
+    "subprocess.check_call", "subprocess.check_output",
+}
+SHELL_CALLS = {"os.system", "os.popen"} | SUBPROCESS_CALLS
+SHELL_RM = re.compile(r"(^|[;&|]\s*)rm\s")
+
+
+def _qualified_name(node: ast.AST, aliases: dict[str, str]) -> str | None:
+    """Dotted name of a call target with import aliases resolved."""
+    if isinstance(node, ast.Name):
+        return aliases.get(node.id, node.id)
+    if isinstance(node, ast.Attribute):
+        base = _qualified_name(node.value, aliases)
+        return f"{base}.{node.attr}" if base else None
+    return None
+
+
+def _leading_text(node: ast.AST) -> str | None:
+    """Constant prefix of a str or f-string argument."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr) and node.values:
+        first = node.values[0]
+        if isinstance(first, ast.Constant) and isinstance(first.value, str):
+            return first.value
+    return None
+
+
+def _runs_rm(call: ast.Call) -> str | None:
+    """Rule id if a process-spawning call runs rm, else None."""
+    if not call.args:
+        return None
+    command = call.args[0]
+    if isinstance(command, (ast.List, ast.Tuple)) and command.elts:
+        program = _leading_text(command.elts[0])
+        if program is not None and program.rsplit("/", 1)[-1] == "rm":
+            return "subprocess-rm"
+        return None
+    text = _leading_text(command)
+    if text is not None and SHELL_RM.search(text.lstrip()):
+        return "rm-command"
+    return None
+
+
+def find_dangerous_calls(source: str) -> list[tuple[str, int]] | None:
+    """Dangerous calls in Python source as (rule_id, line); None if it does not parse."""
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return None
+
+    # Import aliases anywhere in the module (function-level imports included)
+    aliases: dict[str, str] = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    aliases[alias.asname] = alias.name
+                else:
+                    root = alias.name.split(".", 1)[0]
+                    aliases[root] = root
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            for alias in node.names:
+                aliases[alias.asname or alias.name] = f"{node.module}.{alias.name}"
+
+    calls = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        name = _qualified_name(node.func, aliases)
+        if name in REMOVAL_CALLS:
+            calls.append((REMOVAL_CALLS[name], node.lineno))
+        elif name in SHELL_CALLS:
+            rule_id = _runs_rm(node)
+            if rule_id:
+                calls.append((rule_id, node.lineno))
+    return sorted(set(calls), key=lambda call: (call[1], call[0]))
+
+
+class AstCache:
+    """find_dangerous_calls() results cached by content hash, most recent last."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self.entries: dict[str, list | None] = {}
+        self.dirty = False
+        if path is not None:
+            try:
+                data = json.loads(path.read_text())
+                if data.get("version") == AST_CACHE_VERSION:
+                    self.entries = dict(data["entries"])
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+    def calls(self, source: str) -> list[tuple[str, int]] | None:
+        """Dangerous calls for a source text, parsing only on a cache miss."""
+        key = hashlib.sha256(source.encode("utf-8", "surrogatepass")).hexdigest()
+        if key in self.entries:
+            PROFILER.count("ast_cache_hits")
+            cached = self.entries.pop(key)
+            self.entries[key] = cached  # Refresh recency
+            return None if cached is None else [tuple(call) for call in cached]
+
+        PROFILER.count("ast_cache_misses")
+        with PROFILER.phase("ast_parse"):
+            calls = find_dangerous_calls(source)
+        self.entries[key] = None if calls is None else [list(call) for call in calls]
+        self.dirty = True
+        return calls
+
+    def save(self) -> None:
+        """Write the cache back, keeping the most recently used entries."""
+        if self.path is None or not self.dirty:
+            return
+        # A list of pairs, so recency order survives the round trip
+        entries = list(self.entries.items())[-MAX_CACHE_ENTRIES:]
+        write_json_atomic(self.path, {"version": AST_CACHE_VERSION, "entries": entries})
+        self.dirty = False
+
+
+def needs_parse(source: str) -> bool:
+    """Whether a file could contain a detectable call (cheap substring prefilter)."""
+    return any(needle in source for needle in PREFILTER) or RM_WORD.search(source) is not None
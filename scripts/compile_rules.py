@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Compile Rules - Build a playbook's rule files into one indexed bundle.
+
+playbooks/vercel-react-best-practices/rules/ holds one markdown file per
+rule, with title/impact/impactDescription/tags frontmatter, plus
+_sections.md (section order, impact and description) and metadata.json.
+Agents used to open the rule files one by one. This script compiles them
+into two artifacts next to rules/:
+
+- AGENTS.md: metadata.json's abstract, a table of contents, then every rule
+  grouped by section (the filename prefix, in _sections.md order), sorted by
+  title within a section and numbered 1.1, 1.2, ...
+- rules-index.json: every rule's frontmatter, section, number and line range
+  in AGENTS.md, plus rule ids by impact and by tag. An agent filters rules
+  from the index and reads just the lines it needs from the bundle.
+
+Builds are incremental. .rules-build.json keeps each rule file's content
+hash with its parsed frontmatter and rendered body, and only rules whose
+hash changed are parsed and rendered again. Numbering, the table of
+contents and the index are assembled from the cached parts on every run,
+and an output file is written only when its content changed.
+
+Usage:
+    python scripts/compile_rules.py                     # Build or refresh the bundle
+    python scripts/compile_rules.py --check             # Exit 1 if the bundle is out of date
+    python scripts/compile_rules.py --rebuild           # Ignore the build cache
+    python scripts/compile_rules.py --impact CRITICAL   # Then list matching rules from the index
+    python scripts/compile_rules.py --tag hooks
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+from skill_manifest import TITLE_PATTERN, parse_frontmatter, write_json_atomic
+
+# ANSI colors
+GREEN = "\033[92m"
+RED = "\033[91m"
+RESET = "\033[0m"
+BOLD = "\033[1m"
+
+DEFAULT_PLAYBOOK = Path("playbooks") / "vercel-react-best-practices"
+RULES_DIR = "rules"
+SECTIONS_FILE = "_sections.md"
+METADATA_FILE = "metadata.json"
+BUNDLE_NAME = "AGENTS.md"
+INDEX_NAME = "rules-index.json"
+BUILD_CACHE = ".rules-build.json"
+BUILD_CACHE_VERSION = 1
+INDEX_VERSION = 1
+
+# Highest first, as listed in the playbook README
+IMPACT_LEVELS = ["CRITICAL", "HIGH", "MEDIUM-HIGH", "MEDIUM", "LOW-MEDIUM", "LOW"]
+REQUIRED_FIELDS = ("title", "impact")
+
+# "## 1. Eliminating Waterfalls (async)" and the bold fields under it
+SECTION_HEADING = re.compile(r"^##\s+(\d+)\.\s+(.+?)\s+\(([\w-]+)\)\s*$")
+SECTION_FIELD = re.compile(r"^\*\*(Impact|Description):\*\*\s*(.*?)\s*$")
+# A rule's own impact line, replaced by the one rendered from its frontmatter
+IMPACT_LINE = re.compile(r"^\*\*Impact:.*\*\*\s*$")
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def anchor(heading: str) -> str:
+    """GitHub's anchor for a markdown heading."""
+    slug = re.sub(r"[^\w\- ]", "", heading.strip().lower())
+    return slug.replace(" ", "-")
+
+
+def parse_sections(content: str) -> list[dict]:
+    """Sections from _sections.md, in file order."""
+    sections = []
+    for line in content.splitlines():
+        heading = SECTION_HEADING.match(line)
+        if heading:
+            number, title, prefix = heading.groups()
+            sections.append({"number": int(number), "title": title, "id": prefix,
+                             "impact": "", "description": ""})
+            continue
+        field = SECTION_FIELD.match(line)
+        if field and sections:
+            sections[-1][field.group(1).lower()] = field.group(2)
+    return sections
+
+
+def render_rule(name: str, content: str) -> tuple[dict | None, list[str]]:
+    """Parse one rule file into its frontmatter fields and rendered body.
+
+    The body drops the file's own '## Title' heading and **Impact:** line;
+    the bundle renders both from the frontmatter with the rule's number.
+
+    Returns: (rule or None, errors)
+    """
+    frontmatter, errors = parse_frontmatter(content)
+    if frontmatter is None:
+        return None, errors
+    fields = {key: value.strip().strip("'\"") for key, value in frontmatter.items()}
+    errors = [f"Missing required field: {key}" for key in REQUIRED_FIELDS if not fields.get(key)]
+    if fields.get("impact") and fields["impact"] not in IMPACT_LEVELS:
+        errors.append(f"Unknown impact: {fields['impact']} (expected one of {', '.join(IMPACT_LEVELS)})")
+    if errors:
+        return None, errors
+
+    lines = content.splitlines()
+    # Skip the frontmatter: up to and including the second '---'
+    body = lines[[i for i, line in enumerate(lines) if line.strip() == "---"][1] + 1:]
+    while body and not body[0].strip():
+        body.pop(0)
+    if body and body[0].startswith("## "):
+        body.pop(0)
+        while body and not body[0].strip():
+            body.pop(0)
+        if body and IMPACT_LINE.match(body[0]):
+            body.pop(0)
+
+    rule = {
+        "title": fields["title"],
+        "impact": fields["impact"],
+        "impactDescription": fields.get("impactDescription", ""),
+        "tags": [tag.strip() for tag in fields.get("tags", "").split(",") if tag.strip()],
+        "section": name.split("-", 1)[0],
+        "body": "\n".join(body).strip(),
+    }
+    return rule, []
+
+
+def load_build_cache(playbook: Path) -> dict:
+    """Load the build cache, starting fresh if missing or from another version."""
+    try:
+        cache = json.loads((playbook / BUILD_CACHE).read_text())
+    except (OSError, ValueError):
+        cache = {}
+    if cache.get("version") != BUILD_CACHE_VERSION:
+        cache = {"version": BUILD_CACHE_VERSION, "rules": {}}
+    return cache
+
+
+def collect_rules(playbook: Path, cache: dict) -> tuple[dict[str, dict], list[str], list[str]]:
+    """Every rule file's parsed rule, re-rendering only files whose hash changed.
+
+    Updates ``cache`` in place.
+
+    Returns: (rule name -> rule with its sha256, names re-rendered, errors)
+    """
+    rules, rendered, errors = {}, [], []
+    cached = cache["rules"]
+    for path in sorted((playbook / RULES_DIR).glob("*.md")):
+        if path.name.startswith("_"):
+            continue  # _sections.md, _template.md
+        name = path.stem
+        data = path.read_bytes()
+        sha256 = content_hash(data)
+        entry = cached.get(name)
+        if entry is None or entry["sha256"] != sha256:
+            rule, rule_errors = render_rule(name, data.decode("utf-8", errors="replace"))
+            if rule is None:
+                errors.extend(f"{RULES_DIR}/{path.name}: {error}" for error in rule_errors)
+                cached.pop(name, None)
+                continue
+            entry = cached[name] = {"sha256": sha256, "rule": rule}
+            rendered.append(name)
+        rules[name] = {**entry["rule"], "sha256": sha256}
+    for name in set(cached) - set(rules):
+        del cached[name]
+    return rules, rendered, errors
+
+
+def assemble(playbook: Path, sections: list[dict], metadata: dict, rules: dict[str, dict]) -> tuple[str, dict]:
+    """Number the rules and build the bundle text and its index."""
+    by_section = {section["id"]: [] for section in sections}
+    for name, rule in rules.items():
+        by_section[rule["section"]].append(name)
+    for names in by_section.values():
+        names.sort(key=lambda name: (rules[name]["title"].lower(), name))
+
+    readme_title = None
+    readme = playbook / "README.md"
+    if readme.exists():
+        readme_title = TITLE_PATTERN.search(readme.read_text(encoding="utf-8", errors="ignore"))
+    title = readme_title.group(1).strip() if readme_title else playbook.name
+
+    lines = [f"# {title}", ""]
+    if metadata.get("version"):
+        lines += [f"**Version {metadata['version']}**  "]
+    lines += [f"{value}  " for value in (metadata.get("organization"), metadata.get("date")) if value]
+    lines += [
+        "",
+        f"> Generated by scripts/compile_rules.py from {RULES_DIR}/. Edit the rule files, not this file.",
+        f"> {INDEX_NAME} lists every rule's impact, tags and line range here.",
+        "",
+        "---",
+        "",
+    ]
+    if metadata.get("abstract"):
+        lines += ["## Abstract", "", metadata["abstract"], "", "---", ""]
+
+    numbers = {}
+    lines += ["## Table of Contents", ""]
+    for section in sections:
+        heading = f"{section['number']}. {section['title']}"
+        lines.append(f"{section['number']}. [{section['title']}](#{anchor(heading)}) — **{section['impact']}**")
+        for position, name in enumerate(by_section[section["id"]], 1):
+            number = numbers[name] = f"{section['number']}.{position}"
+            rule_heading = f"{number} {rules[name]['title']}"
+            lines.append(f"   - {number} [{rules[name]['title']}](#{anchor(rule_heading)})")
+    lines += ["", "---", ""]
+
+    ranges = {}
+    for section in sections:
+        lines += [f"## {section['number']}. {section['title']}", "", f"**Impact: {section['impact']}**", ""]
+        if section["description"]:
+            lines += [section["description"], ""]
+        for name in by_section[section["id"]]:
+            rule = rules[name]
+            start = len(lines) + 1
+            impact = rule["impact"]
+            if rule["impactDescription"]:
+                impact += f" ({rule['impactDescription']})"
+            lines += [f"### {numbers[name]} {rule['title']}", "", f"**Impact: {impact}**", ""]
+            if rule["body"]:
+                lines += rule["body"].split("\n") + [""]
+            ranges[name] = [start, len(lines) - 1]
+        lines += ["---", ""]
+
+    if metadata.get("references"):
+        lines += ["## References", ""]
+        lines += [f"{i}. [{url}]({url})" for i, url in enumerate(metadata["references"], 1)]
+        lines.append("")
+
+    order = [name for section in sections for name in by_section[section["id"]]]
+    index = {
+        "version": INDEX_VERSION,
+        "bundle": BUNDLE_NAME,
+        "sections": [{**section, "rules": by_section[section["id"]]} for section in sections],
+        "rules": {
+            name: {
+                "number": numbers[name],
+                "title": rules[name]["title"],
+                "impact": rules[name]["impact"],
+                "impactDescription": rules[name]["impactDescription"],
+                "tags": rules[name]["tags"],
+                "section": rules[name]["section"],
+                "file": f"{RULES_DIR}/{name}.md",
+                "sha256": rules[name]["sha256"],
+                "lines": ranges[name],
+            }
+            for name in order
+        },
+        "by_impact": {
+            level: [name for name in order if rules[name]["impact"] == level]
+            for level in IMPACT_LEVELS
+        },
+        "by_tag": {},
+    }
+    for name in order:
+        for tag in rules[name]["tags"]:
+            index["by_tag"].setdefault(tag, []).append(name)
+    return "\n".join(lines), index
+
+
+def compile_playbook(playbook: Path, rebuild: bool = False) -> tuple[dict[str, str], list[str], list[str]]:
+    """Build the bundle and index text for a playbook from its rules.
+
+    Saves the build cache.
+
+    Returns: (output file name -> text, rule names re-rendered, errors)
+    """
+    cache = {"version": BUILD_CACHE_VERSION, "rules": {}} if rebuild else load_build_cache(playbook)
+    sections = parse_sections((playbook / RULES_DIR / SECTIONS_FILE).read_text(encoding="utf-8"))
+    metadata_path = playbook / METADATA_FILE
+    metadata = json.loads(metadata_path.read_text()) if metadata_path.exists() else {}
+
+    rules, rendered, errors = collect_rules(playbook, cache)
+    write_json_atomic(playbook / BUILD_CACHE, cache)
+
+    known = {section["id"] for section in sections}
+    errors += [
+        f"{RULES_DIR}/{name}.md: Unknown section prefix '{rule['section']}' (not in {SECTIONS_FILE})"
+        for name, rule in rules.items() if rule["section"] not in known
+    ]
+    if errors:
+        return {}, rendered, errors
+
+    bundle, index = assemble(playbook, sections, metadata, rules)
+    outputs = {BUNDLE_NAME: bundle, INDEX_NAME: json.dumps(index, indent=1) + "\n"}
+    return outputs, rendered, []
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """Write ``text`` via a temp file unless the file already holds it."""
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except OSError:
+        pass
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+    return True
+
+
+def list_rules(index: dict, impact: str | None, tag: str | None) -> None:
+    """Print the rules matching an impact and/or tag, from the index alone."""
+    names = list(index["rules"])
+    if impact:
+        matching = set(index["by_impact"].get(impact.upper(), []))
+        names = [name for name in names if name in matching]
+    if tag:
+        matching = set(index["by_tag"].get(tag, []))
+        names = [name for name in names if name in matching]
+    for name in names:
+        rule = index["rules"][name]
+        start, end = rule["lines"]
+        print(f"  {rule['number']:5} {name:40} {rule['impact']:12} {index['bundle']}:{start}-{end}")
+    print(f"\n  {len(names)} of {len(index['rules'])} rules")
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Compile a playbook's rule files into one indexed bundle")
+    parser.add_argument(
+        '--library-root',
+        type=Path,
+        default=Path(__file__).parent.parent,
+        help="Skills library root (default: this repository)"
+    )
+    parser.add_argument(
+        '--playbook',
+        type=Path,
+        default=DEFAULT_PLAYBOOK,
+        help=f"Playbook directory holding {RULES_DIR}/, relative to the library root (default: {DEFAULT_PLAYBOOK})"
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help="Write nothing; exit 1 if the bundle or index is out of date"
+    )
+    parser.add_argument(
+        '--rebuild',
+        action='store_true',
+        help="Ignore the build cache and re-render every rule"
+    )
+    parser.add_argument('--impact', help="List the rules with this impact (e.g. CRITICAL)")
+    parser.add_argument('--tag', help="List the rules with this tag")
+    args = parser.parse_args()
+
+    playbook = args.library_root / args.playbook
+    if not (playbook / RULES_DIR / SECTIONS_FILE).exists():
+        print(f"{RED}Error: No {RULES_DIR}/{SECTIONS_FILE} in playbook: {playbook}{RESET}")
+        return 1
+
+    outputs, rendered, errors = compile_playbook(playbook, rebuild=args.rebuild)
+    if errors:
+        for error in errors:
+            print(f"{RED}✗ {error}{RESET}")
+        return 1
+
+    if args.check:
+        stale = [name for name, text in outputs.items()
+                 if not (playbook / name).exists() or (playbook / name).read_text(encoding="utf-8") != text]
+        for name in stale:
+            print(f"{RED}✗ {playbook / name} is out of date; run scripts/compile_rules.py{RESET}")
+        if not stale:
+            print(f"{GREEN}✓ {BUNDLE_NAME} and {INDEX_NAME} are up to date{RESET}")
+        return 1 if stale else 0
+
+    written = [name for name, text in outputs.items() if write_if_changed(playbook / name, text)]
+    if args.impact or args.tag:
+        list_rules(json.loads(outputs[INDEX_NAME]), args.impact, args.tag)
+        return 0
+
+    rule_count = len(json.loads(outputs[INDEX_NAME])["rules"])
+    print(f"\n{BOLD}Rules Bundle{RESET} ({playbook})")
+    print(f"  {'rules':12} {rule_count} ({len(rendered)} re-rendered)")
+    for name in outputs:
+        status = f"{GREEN}written{RESET}" if name in written else "unchanged"
+        print(f"  {name:12} {status}")
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
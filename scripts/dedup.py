@@ -0,0 +1,190 @@
+"""
+Dedup - Run-scoped deduplication of identical files for scripts/.
+
+The ecosystem holds many byte-identical files: vendored copies of this
+library, copied AGENTS.md and .cursorrules templates, hardlinked and
+symlinked trees. DEDUP memoises a scanner's per-file result so each distinct
+file is scanned once per run:
+
+1. By (device, inode, size, mtime) - a hardlink or a symlinked file is
+   recognised from one stat() without reading it.
+2. By content hash (blake2b) - a copy is recognised after one read, before
+   any matching.
+
+Results must not depend on the path; callers put anything path-dependent
+(file context, allowlisted names) into the namespace and re-attribute the
+result to each path themselves.
+
+FileSource lets several checks share one read of a file during one walk.
+
+walk_tree() is os.walk() with a loop guard. Like os.walk it does not
+descend into symlinked directories, so no file is walked twice.
+
+    from dedup import DEDUP, walk_tree
+
+    for root, dirs, files in walk_tree(project):
+        ...
+        issues = DEDUP.cached(path, ("warden", context), read, scan)
+"""
+
+import hashlib
+import os
+import struct
+from pathlib import Path
+
+from instrumentation import PROFILER
+
+_MISSING = object()
+# (dev, ino, size, mtime_ns) packed into one bytes key: a quarter of a tuple's footprint
+_IDENTITY = struct.Struct("<QQQq")
+
+
+class RunDedup:
+    """Scanner results memoised by inode and by content hash for one run.
+
+    The inode layer maps each physical file to its content digest once; the
+    content layer maps (namespace, digest) to a result. Memory is one small
+    entry per distinct file plus one per distinct (namespace, content).
+    """
+
+    def __init__(self):
+        self.enabled = True
+        # packed (dev, ino, size, mtime_ns) -> digest; a rewritten file gets a new key
+        self._digests: dict[bytes, bytes] = {}
+        # namespace -> {digest: result}; one dict per namespace keeps keys small
+        self._results: dict[tuple, dict[bytes, object]] = {}
+        # Equal hashable results are stored once (most files yield the same empty result)
+        self._shared: dict[object, object] = {}
+
+    def cached(self, path: Path, namespace: tuple, read, compute):
+        """compute(read()) for ``path``, reused for the same inode or content.
+
+        ``read`` returns the file content (str or bytes); ``compute`` turns it
+        into a path-independent result, ideally an immutable tuple so equal
+        results can be shared. Errors from either propagate.
+        """
+        if not self.enabled:
+            return compute(read())
+        try:
+            st = os.stat(path)
+        except OSError:
+            return compute(read())
+
+        results = self._results.get(namespace)
+        if results is None:
+            results = self._results[namespace] = {}
+        identity = _IDENTITY.pack(st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+        digest = self._digests.get(identity)
+        if digest is not None:
+            result = results.get(digest, _MISSING)
+            if result is not _MISSING:
+                PROFILER.count("inode_cache_hits")
+                return result
+        PROFILER.count("inode_cache_misses")
+
+        data = read()
+        raw = data.encode("utf-8", "surrogatepass") if isinstance(data, str) else data
+        digest = self._digests[identity] = hashlib.blake2b(raw, digest_size=16).digest()
+
+        result = results.get(digest, _MISSING)
+        if result is not _MISSING:
+            PROFILER.count("content_cache_hits")
+            return result
+        PROFILER.count("content_cache_misses")
+        result = compute(data)
+        try:
+            result = self._shared.setdefault(result, result)
+        except TypeError:
+            pass  # Unhashable results are kept as they are
+        results[digest] = result
+        return result
+
+    def clear(self) -> None:
+        """Forget every memoised result."""
+        self._digests.clear()
+        self._results.clear()
+        self._shared.clear()
+
+
+class FileSource:
+    """One file read once and decoded on demand, for several checks in one walk.
+
+    text(errors) matches open(path, errors=errors).read(): UTF-8 with
+    universal newlines. A strict decode error is raised to every caller that
+    asks for strict text, just as each separate read would have raised it.
+    ``data``, when given, is the file's content already read by the caller.
+    """
+
+    def __init__(self, path: Path, data: bytes | None = None):
+        self.path = path
+        self._data = data
+        self._text: dict[str, str] = {}
+
+    def read_bytes(self) -> bytes:
+        if self._data is None:
+            self._data = PROFILER.read(self.path.read_bytes())
+        return self._data
+
+    def text(self, errors: str = "strict") -> str:
+        text = self._text.get(errors)
+        if text is None:
+            text = self.read_bytes().decode("utf-8", errors)
+            text = self._text[errors] = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+
+def walk_tree(top: Path):
+    """os.walk(top) with a loop guard.
+
+    Yields (dirpath, dirnames, filenames) top-down; prune dirnames in place
+    as with os.walk. As with os.walk, symlinked directories are listed in
+    dirnames but not descended into: a link inside the root reaches files
+    the walk already visits through their real path, and following it would
+    scan and report them twice. A directory that is already on the current
+    path (a bind-mount loop) is not walked again.
+    """
+    top = os.fspath(top)
+    try:
+        st = os.stat(top)
+    except OSError:
+        return
+    stack = [(top, frozenset({(st.st_dev, st.st_ino)}))]
+
+    while stack:
+        dirpath, ancestors = stack.pop()
+        try:
+            entries = list(os.scandir(dirpath))
+        except OSError:
+            continue
+
+        dirnames, filenames, links = [], [], set()
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir and entry.is_symlink():
+                links.add(entry.name)
+            (dirnames if is_dir else filenames).append(entry.name)
+
+        yield dirpath, dirnames, filenames
+
+        children = []
+        for name in dirnames:
+            if name in links:
+                PROFILER.skip("symlinked_dir")
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            key = (st.st_dev, st.st_ino)
+            if key in ancestors:
+                PROFILER.count("directory_loops")
+                continue
+            children.append((path, ancestors | {key}))
+        stack.extend(reversed(children))
+
+
+DEDUP = RunDedup()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Detect Drift - Find adapters that fell out of sync with their playbook.
+
+Every adapter (claude-skills/*/SKILL.md, cursor-rules/*/RULE.md,
+antigravity-rules/*/RULE.md) points at a playbook with **Follow:** (or
+**Canonical playbook:**). This script keeps a content-addressed index of each
+adapter and the hashes of the playbook sections it depends on. When a
+playbook changes, only that playbook is re-sectioned and only the adapters
+that follow it are checked, so a run costs time proportional to what changed.
+
+An adapter is stale when a section it depends on changed after the adapter
+was last edited. Editing the adapter marks it in sync again; --accept does the
+same without an edit.
+
+The index is the reviewed baseline, so it is committed with the library: a
+fresh clone or a CI run compares against it rather than against itself. An
+adapter missing from the index has nothing to be compared with; it is
+recorded as in sync with the playbook as it is now, reported as unbaselined,
+and fails the run until the updated index is committed.
+
+Usage:
+    python scripts/detect_drift.py
+    python scripts/detect_drift.py --json
+    python scripts/detect_drift.py --accept cursor-rules/pr-review
+    python scripts/detect_drift.py --accept-all
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+from skill_manifest import load_manifest, write_json_atomic
+
+# ANSI colors
+GREEN = "\033[92m"
+RED = "\033[91m"
+YELLOW = "\033[93m"
+CYAN = "\033[96m"
+RESET = "\033[0m"
+BOLD = "\033[1m"
+
+DRIFT_INDEX = ".drift-index.json"
+DRIFT_INDEX_VERSION = 1
+
+ADAPTER_TREES = ["claude-skills", "cursor-rules", "antigravity-rules"]
+# **Follow:** targets are written relative to the projects root
+LIBRARY_PREFIX = "agent-skills-library/"
+SECTION_PATTERN = re.compile(r"^##\s+(.+?)\s*$")
+
+
+def split_sections(content: str) -> dict[str, str]:
+    """Hash each '## ' section of a markdown file; the preamble is keyed ''."""
+    sections: dict[str, list[str]] = {"": []}
+    current = ""
+    for line in content.splitlines():
+        match = SECTION_PATTERN.match(line)
+        if match:
+            current = match.group(1).lower()
+            sections.setdefault(current, [])
+            continue
+        sections[current].append(line.rstrip())
+
+    return {
+        heading: hashlib.sha256("\n".join(lines).strip().encode()).hexdigest()
+        for heading, lines in sections.items()
+    }
+
+
+def resolve_playbook(follow: str | None) -> str | None:
+    """Map a **Follow:** target to the playbook file path inside the library."""
+    if not follow or not follow.startswith(LIBRARY_PREFIX):
+        return None
+    target = follow[len(LIBRARY_PREFIX):]
+    if not target.endswith(".md"):
+        target = target.rstrip("/") + "/README.md"
+    return target
+
+
+def referenced_sections(adapter_content: str, playbook_sections: dict[str, str]) -> list[str]:
+    """Playbook sections an adapter depends on.
+
+    Sections the adapter mirrors by heading; if it mirrors none, it depends on
+    the whole playbook.
+    """
+    adapter_headings = set(split_sections(adapter_content))
+    shared = sorted(h for h in playbook_sections if h and h in adapter_headings)
+    return shared or sorted(playbook_sections)
+
+
+def load_drift_index(library_root: Path) -> dict:
+    """Load the drift index, starting fresh if missing or from another version."""
+    try:
+        index = json.loads((library_root / DRIFT_INDEX).read_text())
+    except (OSError, ValueError):
+        index = {}
+    if index.get("version") != DRIFT_INDEX_VERSION:
+        index = {"version": DRIFT_INDEX_VERSION, "playbooks": {}, "adapters": {}}
+    return index
+
+
+def update_drift_index(library_root: Path, index: dict, manifest: dict) -> tuple[set[str], list[str], list[str]]:
+    """Bring the index up to date with the manifest.
+
+    Returns the playbooks whose content changed since the last run, the
+    adapters whose **Follow:** target does not exist, and the adapters the
+    index had no baseline for.
+    """
+    playbook_entries = {
+        entry["path"]: entry
+        for entry in manifest["trees"]["playbooks"].values()
+        if entry["path"]
+    }
+
+    # Re-section only playbooks whose hash changed
+    changed_playbooks = set()
+    for path, entry in playbook_entries.items():
+        known = index["playbooks"].get(path)
+        if known and known["sha256"] == entry["sha256"]:
+            continue
+        content = (library_root / path).read_text(encoding="utf-8", errors="ignore")
+        index["playbooks"][path] = {"sha256": entry["sha256"], "sections": split_sections(content)}
+        if known:
+            changed_playbooks.add(path)
+    for path in set(index["playbooks"]) - set(playbook_entries):
+        del index["playbooks"][path]
+
+    # Record new or edited adapters against the current playbook sections
+    broken = []
+    unbaselined = []
+    seen = set()
+    for tree in ADAPTER_TREES:
+        for name, entry in manifest["trees"][tree].items():
+            playbook = resolve_playbook(entry.get("follow")) if entry["path"] else None
+            if playbook is None:
+                continue
+            key = f"{tree}/{name}"
+            seen.add(key)
+            if playbook not in index["playbooks"]:
+                broken.append(key)
+                index["adapters"].pop(key, None)
+                continue
+
+            known = index["adapters"].get(key)
+            if known and known["sha256"] == entry["sha256"] and known["playbook"] == playbook:
+                continue
+            # New or edited adapter: in sync with the playbook as it is now
+            if known is None:
+                unbaselined.append(key)
+            content = (library_root / entry["path"]).read_text(encoding="utf-8", errors="ignore")
+            sections = index["playbooks"][playbook]["sections"]
+            index["adapters"][key] = {
+                "sha256": entry["sha256"],
+                "playbook": playbook,
+                "sections": {h: sections[h] for h in referenced_sections(content, sections)},
+                "stale": [],
+            }
+    for key in set(index["adapters"]) - seen:
+        del index["adapters"][key]
+
+    return changed_playbooks, broken, unbaselined
+
+
+def find_stale_adapters(index: dict, changed_playbooks: set[str]) -> dict[str, list[str]]:
+    """Mark adapters of changed playbooks stale and return every stale adapter."""
+    if changed_playbooks:
+        # Reverse lookup limited to the playbooks that changed
+        for record in index["adapters"].values():
+            if record["playbook"] not in changed_playbooks:
+                continue
+            current = index["playbooks"][record["playbook"]]["sections"]
+            record["stale"] = sorted(
+                heading or "(preamble)"
+                for heading, digest in record["sections"].items()
+                if current.get(heading) != digest
+            )
+
+    return {key: record["stale"] for key, record in index["adapters"].items() if record["stale"]}
+
+
+def accept_adapters(index: dict, keys: list[str]) -> list[str]:
+    """Re-baseline adapters against their playbook's current sections."""
+    unknown = []
+    for key in keys:
+        record = index["adapters"].get(key)
+        if record is None:
+            unknown.append(key)
+            continue
+        current = index["playbooks"][record["playbook"]]["sections"]
+        record["sections"] = {h: current[h] for h in record["sections"] if h in current} or dict(current)
+        record["stale"] = []
+    return unknown
+
+
+def print_report(stale: dict[str, list[str]], broken: list[str], unbaselined: list[str], index: dict) -> None:
+    """Print drift report."""
+    print(f"\n{BOLD}Adapter Drift Report{RESET}")
+    print("=" * 60)
+    print(f"Adapters tracked: {len(index['adapters'])}")
+    print("=" * 60)
+
+    if broken:
+        print(f"\n{BOLD}{CYAN}🔗 Broken **Follow:** Targets{RESET}\n")
+        for key in broken:
+            print(f"  {RED}• {key}{RESET}")
+
+    if unbaselined:
+        print(f"\n{BOLD}{CYAN}🆕 Adapters Without a Baseline{RESET}\n")
+        for key in unbaselined:
+            print(f"  {YELLOW}• {key}{RESET} → {index['adapters'][key]['playbook']}")
+        print(f"\n  Recorded against the current playbook; commit {DRIFT_INDEX} once reviewed.")
+
+    print(f"\n{BOLD}{CYAN}🕰  Stale Adapters{RESET}\n")
+    if stale:
+        for key, sections in stale.items():
+            print(f"  {YELLOW}• {key}{RESET} → {index['adapters'][key]['playbook']}")
+            print(f"    Changed sections: {', '.join(sections)}")
+        print(f"\n  Update the adapters, or run with --accept <tree/name> once reviewed.")
+    else:
+        print(f"  {GREEN}All adapters are in sync with their playbooks{RESET}")
+    print()
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Detect adapters that drifted from their playbook")
+    parser.add_argument(
+        '--library-root',
+        type=Path,
+        default=Path(__file__).parent.parent,
+        help="Skills library root (default: this repository)"
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help="Output as JSON instead of text report"
+    )
+    parser.add_argument(
+        '--accept',
+        nargs='+',
+        default=[],
+        metavar='TREE/NAME',
+        help="Mark adapters as reviewed against the current playbook"
+    )
+    parser.add_argument(
+        '--accept-all',
+        action='store_true',
+        help="Mark every stale adapter as reviewed"
+    )
+    args = parser.parse_args()
+
+    manifest = load_manifest(args.library_root)
+    index = load_drift_index(args.library_root)
+    changed, broken, unbaselined = update_drift_index(args.library_root, index, manifest)
+    stale = find_stale_adapters(index, changed)
+
+    accepted = list(stale) if args.accept_all else args.accept
+    if accepted:
+        unknown = accept_adapters(index, accepted)
+        for key in unknown:
+            print(f"{RED}Error: Unknown adapter: {key}{RESET}")
+        stale = {k: v for k, v in stale.items() if k not in accepted}
+
+    write_json_atomic(args.library_root / DRIFT_INDEX, index)
+
+    if args.json:
+        print(json.dumps({
+            "stale": {key: {"playbook": index["adapters"][key]["playbook"], "sections": sections}
+                      for key, sections in stale.items()},
+            "broken": broken,
+            "unbaselined": unbaselined,
+        }, indent=2))
+    else:
+        print_report(stale, broken, unbaselined, index)
+
+    return 0 if not stale and not broken and not unbaselined else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
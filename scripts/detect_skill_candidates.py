@@ -11,19 +11,35 @@ Usage:
     python scripts/detect_skill_candidates.py
     python scripts/detect_skill_candidates.py --projects-root ~/projects
     python scripts/detect_skill_candidates.py --output-json
+    python scripts/detect_skill_candidates.py --output-ndjson
+    python scripts/detect_skill_candidates.py --mine-phrases
 
 Specification: https://agentskills.io/specification
 """
 
 import argparse
+import heapq
 import json
 import os
 import re
 import sys
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
+from dedup import DEDUP
+from index_catalog import CATALOG, IMPROVEMENT
+from instrumentation import (
+    MEMPROFILER,
+    PROFILER,
+    RULE_COSTS,
+    add_memprofile_argument,
+    add_profile_argument,
+    add_rule_costs_argument,
+)
+from records import Evidence, Match, Reference
+from skill_manifest import load_manifest, skill_names
+
 # ANSI colors
 GREEN = "\033[92m"
 RED = "\033[91m"
@@ -39,7 +55,7 @@ class SkillUsage:
     """Track where a skill is used."""
     skill_name: str
     projects: list[str] = field(default_factory=list)
-    references: list[dict] = field(default_factory=list)  # {project, file, line}
+    references: list[Reference] = field(default_factory=list)
 
 
 @dataclass
@@ -57,7 +73,7 @@ class SkillCandidate:
     pattern: str
     description: str
     projects: list[str] = field(default_factory=list)
-    evidence: list[dict] = field(default_factory=list)  # {project, file, context}
+    evidence: list[Evidence] = field(default_factory=list)
     confidence: str = "🔵 Candidate"  # 🔵 Candidate, 🟡 Emerging, 🟢 Proven
 
 
@@ -81,6 +97,14 @@ INSTRUCTION_PATTERNS = [
     (r'when asked to', "AI trigger phrase"),
 ]
 
+# Phrase mining (--mine-phrases): tokens and filler words for n-grams
+PHRASE_TOKEN_RE = re.compile(r"[a-z][a-z0-9'-]*")
+PHRASE_STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'if',
+    'in', 'is', 'it', 'of', 'on', 'or', 'so', 'that', 'the', 'this', 'to',
+    'with', 'you', 'your',
+}
+
 # Files to scan for instruction patterns
 INSTRUCTION_FILES = [
     '.cursorrules',
@@ -90,7 +114,7 @@ INSTRUCTION_FILES = [
     '.claude/skills/*/SKILL.md',
 ]
 
-# Known skills to track usage
+# Fallback skills to track when the library manifest is unavailable
 KNOWN_SKILLS = [
     'pr-review',
     'debugging-routine',
@@ -104,6 +128,15 @@ KNOWN_SKILLS = [
 ]
 
 
+def load_known_skills(library_root: Path) -> list[str]:
+    """Skill names from the library manifest, falling back to KNOWN_SKILLS."""
+    try:
+        names = skill_names(load_manifest(library_root))
+    except OSError:
+        names = []
+    return names or list(KNOWN_SKILLS)
+
+
 def find_projects(projects_root: Path) -> list[Path]:
     """Find all project directories."""
     projects = []
@@ -121,30 +154,42 @@ def find_projects(projects_root: Path) -> list[Path]:
     return sorted(projects)
 
 
-def scan_file_for_patterns(file_path: Path) -> list[dict]:
+def read_file(file_path: Path):
+    """Reader for DEDUP.cached(): the file's text, counted by the profiler."""
+    return lambda: PROFILER.read(file_path.read_text(encoding='utf-8', errors='ignore'))
+
+
+def scan_file_for_patterns(file_path: Path) -> list[Match]:
     """Scan a file for instruction patterns."""
-    matches = []
     
+    def scan(content: str) -> tuple:
+        hits = []
+        lines = content.split('\n')
+        PROFILER.count("regex_evals", len(lines) * len(INSTRUCTION_PATTERNS))
+        searches = [
+            (RULE_COSTS.searcher(f"instruction:{description}", re.compile(pattern, re.IGNORECASE)), pattern, description)
+            for pattern, description in INSTRUCTION_PATTERNS
+        ]
+        for line_num, line in enumerate(lines, 1):
+            for search, pattern, description in searches:
+                if search(line):
+                    hits.append((line_num, pattern, description, line.strip()[:100]))
+        return tuple(hits)
+    
+    # Copied templates (AGENTS.md, .cursorrules) are scanned once per run
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        hits = DEDUP.cached(file_path, ("instruction_patterns",), read_file(file_path), scan)
     except Exception:
-        return matches
-    
-    for line_num, line in enumerate(content.split('\n'), 1):
-        for pattern, description in INSTRUCTION_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
-                matches.append({
-                    'file': str(file_path),
-                    'line': line_num,
-                    'pattern': pattern,
-                    'description': description,
-                    'context': line.strip()[:100],
-                })
+        PROFILER.skip("unreadable")
+        return []
     
-    return matches
+    return [
+        Match(file_path, line_num, pattern, description, context)
+        for line_num, pattern, description, context in hits
+    ]
 
 
-def scan_project_for_skill_usage(project: Path, skill_name: str) -> list[dict]:
+def scan_project_for_skill_usage(project: Path, skill_name: str) -> list[Reference]:
     """Find references to a specific skill in a project."""
     references = []
     
@@ -169,44 +214,51 @@ def scan_project_for_skill_usage(project: Path, skill_name: str) -> list[dict]:
                 if skill_file.exists():
                     files_to_check.append(skill_file)
     
+    # Look for skill name references (bounded so 'pr' does not match 'pr-review')
+    name = re.escape(skill_name)
+    patterns = [
+        rf'playbooks/{name}(?![\w-])',
+        rf'claude-skills/{name}(?![\w-])',
+        rf'cursor-rules/{name}(?![\w-])',
+        rf'(?<![\w-]){name}/README',
+        rf'(?<![\w-]){name}/SKILL',
+        rf'(?<![\w-]){name}/RULE',
+    ]
+    
+    def scan(content: str) -> tuple:
+        hits = []
+        lines = content.split('\n')
+        PROFILER.count("regex_evals", len(lines) * len(patterns))
+        for line_num, line in enumerate(lines, 1):
+            for pattern in patterns:
+                if re.search(pattern, line, re.IGNORECASE):
+                    hits.append((line_num, line.strip()[:80]))
+                    break  # Only count once per line
+        return tuple(hits)
+    
     for file_path in files_to_check:
+        PROFILER.count("files_visited")
         if not file_path.exists():
+            PROFILER.skip("missing")
             continue
         
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            hits = DEDUP.cached(file_path, ("skill_refs", skill_name), read_file(file_path), scan)
         except Exception:
+            PROFILER.skip("unreadable")
             continue
         
-        # Look for skill name references
-        patterns = [
-            rf'playbooks/{skill_name}',
-            rf'claude-skills/{skill_name}',
-            rf'cursor-rules/{skill_name}',
-            rf'{skill_name}/README',
-            rf'{skill_name}/SKILL',
-            rf'{skill_name}/RULE',
-        ]
-        
-        for line_num, line in enumerate(content.split('\n'), 1):
-            for pattern in patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    references.append({
-                        'project': project.name,
-                        'file': str(file_path.relative_to(project)),
-                        'line': line_num,
-                        'context': line.strip()[:80],
-                    })
-                    break  # Only count once per line
+        for line_num, context in hits:
+            references.append(Reference(project.name, file_path.relative_to(project), line_num, context))
     
     return references
 
 
-def detect_skill_usage(projects_root: Path) -> dict[str, SkillUsage]:
+def detect_skill_usage(projects_root: Path, skills: list[str] | None = None) -> dict[str, SkillUsage]:
     """Detect which projects use which skills."""
     usage = {}
     
-    for skill_name in KNOWN_SKILLS:
+    for skill_name in skills or KNOWN_SKILLS:
         skill_usage = SkillUsage(skill_name=skill_name)
         
         for project in find_projects(projects_root):
@@ -220,124 +272,245 @@ def detect_skill_usage(projects_root: Path) -> dict[str, SkillUsage]:
     return usage
 
 
+def iter_project_feedback(project: Path):
+    """Yield SkillFeedback items from one project's 00_Index files."""
+    # Find 00_Index files
+    for index_file in project.glob("00_Index_*.md"):
+        try:
+            record = CATALOG.get(index_file)
+        except Exception:
+            PROFILER.skip("unreadable")
+            continue
+        
+        for feedback_type, name, text in record.feedback:
+            if feedback_type == IMPROVEMENT:
+                # Format: "- skill-name: feedback text"
+                if text and text not in ["[What could be better? Edge cases found?]", ""]:
+                    yield SkillFeedback(
+                        skill_name=name,
+                        project=project.name,
+                        feedback=text,
+                        feedback_type="improvement"
+                    )
+            
+            else:
+                # Format: "- Pattern description: Could this become a skill?"
+                if name and name not in ["[Pattern description]", ""]:
+                    if text not in ["[Could this become a skill? Used in other projects?]", ""]:
+                        yield SkillFeedback(
+                            skill_name=name,
+                            project=project.name,
+                            feedback=text,
+                            feedback_type="new_pattern"
+                        )
+
 def collect_skill_feedback(projects_root: Path) -> list[SkillFeedback]:
     """Collect skill feedback from 00_Index files in projects."""
     feedback_list = []
     
     for project in find_projects(projects_root):
-        # Find 00_Index files
-        for index_file in project.glob("00_Index_*.md"):
-            try:
-                content = index_file.read_text(encoding='utf-8', errors='ignore')
-            except Exception:
-                continue
-            
-            # Parse feedback sections
-            in_skill_feedback = False
-            in_new_patterns = False
-            current_skill = None
-            
-            for line in content.split('\n'):
-                line = line.strip()
-                
-                # Detect section starts
-                if "Improvements suggested" in line or "Skill Feedback" in line:
-                    in_skill_feedback = True
-                    in_new_patterns = False
-                    continue
-                elif "New patterns emerging" in line or "patterns emerging" in line:
-                    in_new_patterns = True
-                    in_skill_feedback = False
-                    continue
-                elif line.startswith("## ") or line.startswith("---"):
-                    # New section, reset
-                    in_skill_feedback = False
-                    in_new_patterns = False
-                    continue
-                
-                # Parse bullet points
-                if line.startswith("- ") and in_skill_feedback:
-                    # Format: "- skill-name: feedback text"
-                    if ":" in line:
-                        parts = line[2:].split(":", 1)
-                        skill_name = parts[0].strip()
-                        feedback_text = parts[1].strip() if len(parts) > 1 else ""
-                        if feedback_text and feedback_text not in ["[What could be better? Edge cases found?]", ""]:
-                            feedback_list.append(SkillFeedback(
-                                skill_name=skill_name,
-                                project=project.name,
-                                feedback=feedback_text,
-                                feedback_type="improvement"
-                            ))
-                
-                elif line.startswith("- ") and in_new_patterns:
-                    # Format: "- Pattern description: Could this become a skill?"
-                    if ":" in line:
-                        parts = line[2:].split(":", 1)
-                        pattern = parts[0].strip()
-                        notes = parts[1].strip() if len(parts) > 1 else ""
-                        if pattern and pattern not in ["[Pattern description]", ""]:
-                            if notes not in ["[Could this become a skill? Used in other projects?]", ""]:
-                                feedback_list.append(SkillFeedback(
-                                    skill_name=pattern,
-                                    project=project.name,
-                                    feedback=notes,
-                                    feedback_type="new_pattern"
-                                ))
+        feedback_list.extend(iter_project_feedback(project))
     
     return feedback_list
 
 
-def detect_instruction_patterns(projects_root: Path) -> dict[str, list[dict]]:
+def iter_instruction_files(project: Path):
+    """Yield the instruction files (INSTRUCTION_FILES) present in a project."""
+    for file_pattern in INSTRUCTION_FILES:
+        if '*' in file_pattern:
+            # Glob pattern
+            base, glob = file_pattern.rsplit('/', 1)
+            search_dir = project / base
+            if search_dir.exists():
+                yield from search_dir.glob(glob)
+        else:
+            file_path = project / file_pattern
+            if file_path.exists():
+                yield file_path
+
+
+def scan_project_for_patterns(project: Path) -> list[Match]:
+    """Scan all of a project's instruction files for instruction patterns."""
+    matches = []
+    for file_path in iter_instruction_files(project):
+        matches.extend(scan_file_for_patterns(file_path))
+    return matches
+
+
+def detect_instruction_patterns(projects_root: Path) -> dict[str, list[Match]]:
     """Find repeated instruction patterns across projects."""
-    patterns_by_project: dict[str, list[dict]] = defaultdict(list)
+    patterns_by_project: dict[str, list[Match]] = {}
     
     for project in find_projects(projects_root):
-        for file_pattern in INSTRUCTION_FILES:
-            if '*' in file_pattern:
-                # Glob pattern
-                base, glob = file_pattern.rsplit('/', 1)
-                search_dir = project / base
-                if search_dir.exists():
-                    for file_path in search_dir.glob(glob):
-                        matches = scan_file_for_patterns(file_path)
-                        if matches:
-                            patterns_by_project[project.name].extend(matches)
-            else:
-                file_path = project / file_pattern
-                if file_path.exists():
-                    matches = scan_file_for_patterns(file_path)
-                    if matches:
-                        patterns_by_project[project.name].extend(matches)
+        matches = scan_project_for_patterns(project)
+        if matches:
+            patterns_by_project[project.name] = matches
+    
+    return patterns_by_project
+
+
+class SpaceSaving:
+    """Space-Saving heavy-hitter summary with a fixed number of counters.
+
+    Memory is bounded by ``capacity`` no matter how many distinct items are
+    offered. Counts are upper bounds; ``count - error`` is a guaranteed
+    lower bound on the true frequency.
+
+    With a ``source``, an item is counted once per source: sources are
+    offered one after another, and each counter remembers the last source
+    that counted it. An evicted item re-counted from the same source only
+    adds to its error, so the lower bound still holds.
+    """
+
+    def __init__(self, capacity: int, sample_limit: int = 5):
+        self.capacity = capacity
+        self.sample_limit = sample_limit
+        self.counts: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+        self.samples: dict[str, list[Evidence]] = {}
+        self.sources: dict[str, str] = {}
+        self._heap: list[tuple[int, str]] = []  # lazy min-heap of (count, item)
+
+    def counted(self, item: str, source: str) -> bool:
+        """Whether ``item`` is tracked and was last counted from ``source``."""
+        return self.sources.get(item) == source
+
+    def add(self, item: str, sample: Evidence, source: str | None = None) -> None:
+        """Count one occurrence of ``item``, keeping ``sample`` as evidence."""
+        if source is not None:
+            if self.sources.get(item) == source:
+                return
+            self.sources[item] = source
+        if item in self.counts:
+            self.counts[item] += 1
+            if len(self.samples[item]) < self.sample_limit:
+                self.samples[item].append(sample)
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = 1
+            self.errors[item] = 0
+            self.samples[item] = [sample]
+        else:
+            # Evict the current minimum; the newcomer inherits its count as error
+            floor, evicted = self._pop_min()
+            del self.counts[evicted], self.errors[evicted], self.samples[evicted]
+            if evicted in self.sources:
+                del self.sources[evicted]
+            self.counts[item] = floor + 1
+            self.errors[item] = floor
+            self.samples[item] = [sample]
+        self._push(item)
+
+    def _push(self, item: str) -> None:
+        heapq.heappush(self._heap, (self.counts[item], item))
+        # Stale entries accumulate on every increment; rebuild to stay bounded
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(count, key) for key, count in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> tuple[int, str]:
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                return count, item
+
+    def top(self, k: int) -> list[tuple[str, int, int]]:
+        """Return up to ``k`` (item, count, error) tuples, most frequent first."""
+        ranked = sorted(self.counts.items(), key=lambda x: (-x[1], x[0]))
+        return [(item, count, self.errors[item]) for item, count in ranked[:k]]
+
+
+def iter_phrases(line: str, size: int):
+    """Yield the lowercase token n-grams of one line."""
+    tokens = PHRASE_TOKEN_RE.findall(line.lower())
+    for i in range(len(tokens) - size + 1):
+        ngram = tokens[i:i + size]
+        # Skip phrases made only of filler words ("and the to the")
+        if sum(1 for t in ngram if t not in PHRASE_STOPWORDS) >= 2:
+            yield ' '.join(ngram)
+
+
+def mine_instruction_phrases(
+    projects_root: Path,
+    phrase_length: int = 4,
+    capacity: int = 500,
+    top_k: int = 20,
+) -> list[SkillCandidate]:
+    """Find repeated instruction phrases not covered by INSTRUCTION_PATTERNS.
+
+    Every instruction file is streamed line by line. Each phrase is counted
+    once per project, so the Space-Saving summary ranks phrases by the number
+    of distinct projects using them, with memory fixed by ``capacity``.
+    """
+    summary = SpaceSaving(capacity)
+    compiled = [re.compile(pattern, re.IGNORECASE) for pattern, _ in INSTRUCTION_PATTERNS]
+    
+    for project in find_projects(projects_root):
+        source = sys.intern(project.name)
+        for file_path in iter_instruction_files(project):
+            try:
+                with file_path.open('r', encoding='utf-8', errors='ignore') as f:
+                    for line in f:
+                        # Lines already explained by a known pattern are not news
+                        if any(p.search(line) for p in compiled):
+                            continue
+                        sample = None  # One record for all the line's new phrases
+                        for phrase in iter_phrases(line, phrase_length):
+                            if not summary.counted(phrase, source):
+                                sample = sample or Evidence(source, file_path, line.strip()[:100])
+                                summary.add(phrase, sample, source)
+            except Exception:
+                continue
     
-    return dict(patterns_by_project)
+    candidates = []
+    for phrase, count, error in summary.top(top_k):
+        # Only report phrases guaranteed to appear in 2+ projects
+        guaranteed = count - error
+        if guaranteed < 2:
+            continue
+        evidence = summary.samples[phrase]
+        confidence = "🟢 Proven" if guaranteed >= 3 else "🟡 Emerging"
+        candidates.append(SkillCandidate(
+            pattern=f'Phrase: "{phrase}"',
+            description=f"Phrase found in {guaranteed}+ projects",
+            projects=[e.project for e in evidence],
+            evidence=evidence,
+            confidence=confidence,
+        ))
+    
+    return candidates
+
 
+def find_repeated_patterns(patterns_by_project) -> list[SkillCandidate]:
+    """Find patterns that appear in multiple projects (skill candidates).
 
-def find_repeated_patterns(patterns_by_project: dict[str, list[dict]]) -> list[SkillCandidate]:
-    """Find patterns that appear in multiple projects (skill candidates)."""
-    # Group by pattern description
-    pattern_occurrences: dict[str, list[dict]] = defaultdict(list)
+    Accepts the dict from detect_instruction_patterns or any iterable of
+    (project, matches) pairs, so streaming callers need not hold every match.
+    """
+    if isinstance(patterns_by_project, dict):
+        patterns_by_project = patterns_by_project.items()
     
-    for project, matches in patterns_by_project.items():
+    # Group by pattern description, keeping only project names and 5 examples
+    pattern_projects: dict[str, dict[str, None]] = defaultdict(dict)  # ordered set
+    pattern_evidence: dict[str, list[Evidence]] = defaultdict(list)
+    
+    for project, matches in patterns_by_project:
         for match in matches:
-            key = match['description']
-            pattern_occurrences[key].append({
-                'project': project,
-                'file': match['file'],
-                'context': match['context'],
-            })
+            key = match.description
+            pattern_projects[key][project] = None
+            if len(pattern_evidence[key]) < 5:  # Limit evidence
+                pattern_evidence[key].append(Evidence(project, match.file, match.context))
     
     # Find patterns in 2+ projects
     candidates = []
-    for description, occurrences in pattern_occurrences.items():
-        projects = list(set(o['project'] for o in occurrences))
+    for description, project_set in pattern_projects.items():
+        projects = list(project_set)
         if len(projects) >= 2:
             confidence = "🟢 Proven" if len(projects) >= 3 else "🟡 Emerging"
             candidates.append(SkillCandidate(
                 pattern=description,
                 description=f"Pattern found in {len(projects)} projects",
                 projects=projects,
-                evidence=occurrences[:5],  # Limit evidence
+                evidence=pattern_evidence[description],
                 confidence=confidence,
             ))
     
@@ -361,7 +534,7 @@ def generate_report(
                 name: {
                     'projects': usage.projects,
                     'project_count': len(usage.projects),
-                    'references': usage.references,
+                    'references': [asdict(ref) for ref in usage.references],
                 }
                 for name, usage in skill_usage.items()
             },
@@ -371,7 +544,7 @@ def generate_report(
                     'description': c.description,
                     'projects': c.projects,
                     'confidence': c.confidence,
-                    'evidence': c.evidence,
+                    'evidence': [asdict(e) for e in c.evidence],
                 }
                 for c in candidates
             ],
@@ -394,6 +567,7 @@ def generate_report(
                 ],
             },
         }
+        MEMPROFILER.track("report", report)
         print(json.dumps(report, indent=2))
         return
     
@@ -446,7 +620,7 @@ def generate_report(
             print(f"  {color}{candidate.confidence}: {candidate.pattern}{RESET}")
             print(f"    Found in: {', '.join(candidate.projects[:5])}")
             if candidate.evidence:
-                print(f"    Example: \"{candidate.evidence[0]['context'][:60]}...\"")
+                print(f"    Example: \"{candidate.evidence[0].context[:60]}...\"")
             print()
     else:
         print(f"  {GREEN}No new patterns detected{RESET}")
@@ -486,6 +660,84 @@ def generate_report(
     print()
 
 
+def write_ndjson_report(
+    projects_root: Path,
+    out=sys.stdout,
+    skills: list[str] | None = None,
+    mine_phrases: bool = False,
+    phrase_length: int = 4,
+    phrase_capacity: int = 500,
+) -> None:
+    """Stream the detection report as newline-delimited JSON.
+
+    Projects are visited once. Each reference and feedback item is written as
+    soon as it is found; candidates follow once every project has been seen,
+    then a final summary record. Only per-skill project counts and the bounded
+    candidate tallies are held in memory.
+    """
+    def emit(record: dict) -> None:
+        out.write(json.dumps(record) + '\n')
+        out.flush()
+    
+    skills = skills or KNOWN_SKILLS
+    skill_projects = {name: 0 for name in skills}
+    reference_count = 0
+    improvement_count = 0
+    new_pattern_count = 0
+    
+    def iter_matches():
+        nonlocal reference_count, improvement_count, new_pattern_count
+        for project in find_projects(projects_root):
+            for skill_name in skills:
+                refs = scan_project_for_skill_usage(project, skill_name)
+                if refs:
+                    skill_projects[skill_name] += 1
+                for ref in refs:
+                    reference_count += 1
+                    emit({'type': 'reference', 'skill': skill_name, **asdict(ref)})
+            
+            for fb in iter_project_feedback(project):
+                if fb.feedback_type == "improvement":
+                    improvement_count += 1
+                    emit({'type': 'feedback', 'kind': 'improvement', 'skill': fb.skill_name,
+                          'project': fb.project, 'feedback': fb.feedback})
+                else:
+                    new_pattern_count += 1
+                    emit({'type': 'feedback', 'kind': 'new_pattern', 'pattern': fb.skill_name,
+                          'project': fb.project, 'notes': fb.feedback})
+            
+            yield project.name, scan_project_for_patterns(project)
+    
+    candidates = find_repeated_patterns(iter_matches())
+    if mine_phrases:
+        candidates.extend(mine_instruction_phrases(
+            projects_root,
+            phrase_length=phrase_length,
+            capacity=phrase_capacity,
+        ))
+    for c in candidates:
+        emit({
+            'type': 'candidate',
+            'pattern': c.pattern,
+            'description': c.description,
+            'projects': c.projects,
+            'confidence': c.confidence,
+            'evidence': [asdict(e) for e in c.evidence],
+        })
+    
+    emit({
+        'type': 'summary',
+        'skills_tracked': len(skill_projects),
+        'skills_in_use': sum(1 for n in skill_projects.values() if n),
+        'skill_project_counts': skill_projects,
+        'promotion_candidates': [s for s, n in skill_projects.items() if n == 2],
+        'references': reference_count,
+        'candidates': len(candidates),
+        'improvement_suggestions': improvement_count,
+        'new_pattern_proposals': new_pattern_count,
+    })
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -497,35 +749,105 @@ def main() -> int:
         default=Path.home() / 'projects',
         help="Root directory containing projects (default: ~/projects)"
     )
+    parser.add_argument(
+        '--library-root',
+        type=Path,
+        default=Path(__file__).parent.parent,
+        help="Skills library whose manifest lists the skills to track (default: this repository)"
+    )
     parser.add_argument(
         '--output-json',
         action='store_true',
         help="Output as JSON instead of text report"
     )
+    parser.add_argument(
+        '--output-ndjson',
+        action='store_true',
+        help="Stream one JSON record per line as results are found"
+    )
+    parser.add_argument(
+        '--mine-phrases',
+        action='store_true',
+        help="Also mine repeated instruction phrases not covered by known patterns"
+    )
+    parser.add_argument(
+        '--phrase-length',
+        type=int,
+        default=4,
+        help="Words per mined phrase (default: 4)"
+    )
+    parser.add_argument(
+        '--phrase-capacity',
+        type=int,
+        default=500,
+        help="Max phrases tracked while mining; bounds memory (default: 500)"
+    )
     
+    add_profile_argument(parser)
+    add_memprofile_argument(parser)
+    add_rule_costs_argument(parser)
     args = parser.parse_args()
     
+    if args.profile:
+        PROFILER.enable(args.profile)
+    if args.memprofile:
+        MEMPROFILER.enable(args.memprofile)
+    if args.rule_costs:
+        RULE_COSTS.enable()
+    
     if not args.projects_root.exists():
         print(f"{RED}Error: Projects root not found: {args.projects_root}{RESET}")
         return 1
     
+    with PROFILER.phase("known_skills"):
+        skills = load_known_skills(args.library_root)
+    
+    if args.output_ndjson:
+        with PROFILER.phase("ndjson_report"):
+            write_ndjson_report(
+                args.projects_root,
+                skills=skills,
+                mine_phrases=args.mine_phrases,
+                phrase_length=args.phrase_length,
+                phrase_capacity=args.phrase_capacity,
+            )
+        return 0
+    
     if not args.output_json:
         print(f"Scanning projects in: {args.projects_root}")
     
     # Detect skill usage
-    skill_usage = detect_skill_usage(args.projects_root)
+    with PROFILER.phase("skill_usage"):
+        skill_usage = detect_skill_usage(args.projects_root, skills)
+    MEMPROFILER.track("SkillUsage.references", [u.references for u in skill_usage.values()])
     
     # Detect instruction patterns
-    patterns = detect_instruction_patterns(args.projects_root)
+    with PROFILER.phase("instruction_patterns"):
+        patterns = detect_instruction_patterns(args.projects_root)
+    MEMPROFILER.track("patterns_by_project", patterns)
     
     # Find repeated patterns (skill candidates)
-    candidates = find_repeated_patterns(patterns)
+    with PROFILER.phase("candidates"):
+        candidates = find_repeated_patterns(patterns)
+    MEMPROFILER.track("candidates", candidates)
+    
+    # Mine phrases no predefined pattern covers
+    if args.mine_phrases:
+        with PROFILER.phase("phrase_mining"):
+            candidates.extend(mine_instruction_phrases(
+                args.projects_root,
+                phrase_length=args.phrase_length,
+                capacity=args.phrase_capacity,
+            ))
     
     # Collect skill feedback from 00_Index files
-    feedback = collect_skill_feedback(args.projects_root)
+    with PROFILER.phase("feedback"):
+        feedback = collect_skill_feedback(args.projects_root)
+    MEMPROFILER.track("feedback", feedback)
     
     # Generate report
-    generate_report(skill_usage, candidates, feedback, args.output_json)
+    with PROFILER.phase("reporting"):
+        generate_report(skill_usage, candidates, feedback, args.output_json)
     
     return 0
 
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Governance Check - Every governance check from one walk, in one interpreter.
+
+Hooks and CI used to run validate_project.py --all, warden_audit.py --fast
+and validate_skills.py one after another. That meant three interpreter
+startups, and each of them walked and read the same ecosystem files. This
+script imports the three tools as modules and walks the projects root once.
+Each file is read at most once, and the read is shared through a FileSource:
+
+- validate_project: DNA (paths, secrets), safety and placeholder checks,
+- warden_audit: doc-ratio line counts and dangerous-function findings,
+  collected into a WardenIndex as the daemon does.
+
+Each file gets exactly the checks its own tool's walk would give it. A
+directory is pruned only when all three walks would prune it. Index,
+mandatory-file and tiering checks then run per project as before. The
+skill frontmatter checks run on the library through its incremental
+manifest, which only re-reads files whose mtime changed.
+
+Each tool prints its usual report and keeps its exit-code semantics. The
+summary lists every tool's exit code, and the run fails if any tool failed.
+Warden findings come out in sorted order, as with --query.
+
+Usage:
+    python scripts/governance_check.py
+    python scripts/governance_check.py --root ~/projects --rules
+    python scripts/governance_check.py --precise --archives --profile
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import validate_project
+import validate_skills
+import warden_audit
+from archive_scan import ARCHIVES
+from ast_scan import AST_CACHE
+from content_sniff import SNIFFER
+from dedup import FileSource, walk_tree
+from instrumentation import (
+    MEMPROFILER,
+    PROFILER,
+    RULE_COSTS,
+    add_memprofile_argument,
+    add_profile_argument,
+    add_rule_costs_argument,
+)
+from records import Defect
+from ruleset import load_ruleset
+from warden_daemon import PollingWatcher, WardenIndex
+
+# ANSI colors
+GREEN = "\033[92m"
+RED = "\033[91m"
+RESET = "\033[0m"
+BOLD = "\033[1m"
+
+
+class ProjectScan:
+    """DNA and safety errors for one validate_project project, in walk order."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.dna: list[Defect] = []
+        self.safety: list[Defect] = []
+
+
+def dna_walks(parts: tuple) -> bool:
+    """Whether validate_dna_integrity() walks a project-relative directory."""
+    return not any(part in validate_project.DNA_EXCLUDE_DIRS or part.startswith(".") for part in parts)
+
+
+def safety_walks(parts: tuple) -> bool:
+    """Whether scan_safety_and_placeholders() walks a project-relative directory."""
+    return not any(part in validate_project.SAFETY_SKIP_DIRS for part in parts)
+
+
+def warden_walks(parts: tuple) -> bool:
+    """Whether the warden walks a root-relative directory."""
+    return not any(part in warden_audit.SKIP_DIRS for part in parts)
+
+
+def walk_ecosystem(root: Path, projects: list[Path]):
+    """walk_tree(root), then each symlinked project, which that walk lists but does not enter.
+
+    validate_project walks a project from its own path, so it does enter a
+    symlinked project; the warden's walk of root does not.
+
+    Yields: (dirpath, dirnames, filenames, root-relative parts, whether the warden walks it)
+    """
+    top = os.fspath(root)
+    for dirpath, dirnames, filenames in walk_tree(top):
+        rel = os.path.relpath(dirpath, top)
+        yield dirpath, dirnames, filenames, () if rel == os.curdir else tuple(rel.split(os.sep)), True
+    for project in projects:
+        if not project.is_symlink():
+            continue
+        project_top = os.fspath(project)
+        for dirpath, dirnames, filenames in walk_tree(project_top):
+            rel = os.path.relpath(dirpath, project_top)
+            parts = (project.name,) + (() if rel == os.curdir else tuple(rel.split(os.sep)))
+            yield dirpath, dirnames, filenames, parts, False
+
+
+def scan_tree(root: Path, projects: list[Path], index: WardenIndex) -> dict[Path, list[Defect]]:
+    """Walk root once (and each symlinked project), feeding every file to the checks whose walks reach it.
+
+    Returns: validate_project's scanned errors per project (DNA, then safety)
+    """
+    scans = {project.name: ProjectScan(project) for project in projects}
+
+    for dirpath, dirnames, filenames, parts, in_warden_walk in walk_ecosystem(root, projects):
+        scan = scans.get(parts[0]) if parts else None
+        in_project = parts[1:]
+
+        def walked(name: str) -> bool:
+            if in_warden_walk and warden_walks(parts + (name,)):
+                return True
+            if scan is None and not parts:
+                return name in scans  # Project roots, whatever the warden prunes
+            return scan is not None and (dna_walks(in_project + (name,)) or safety_walks(in_project + (name,)))
+
+        dirnames[:] = [d for d in dirnames if walked(d)]
+
+        warden = in_warden_walk and warden_walks(parts)
+        dna = scan is not None and dna_walks(in_project)
+        safety = scan is not None and safety_walks(in_project)
+        skip_placeholders = any(part in validate_project.PLACEHOLDER_SKIP_DIRS for part in in_project)
+        root_path = Path(dirpath)
+
+        for name in filenames:
+            PROFILER.count("files_visited")
+            source = FileSource(root_path / name)
+            if dna:
+                scan.dna.extend(validate_project.check_file_dna(root_path, name, scan.path, source))
+            if safety:
+                scan.safety.extend(validate_project.check_file_safety(
+                    root_path, name, scan.path, skip_placeholders, source))
+            if warden:
+                index.add(dirpath, name, source)
+
+    return {scan.path: scan.dna + scan.safety for scan in scans.values()}
+
+
+def section(title: str) -> None:
+    print(f"\n{BOLD}{'=' * 60}\n{title}\n{'=' * 60}{RESET}\n", flush=True)
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Run validate_project, warden_audit and validate_skills from one walk")
+    parser.add_argument("--root", default=str(validate_project.PROJECTS_ROOT),
+                        help="Projects root to check (default: PROJECTS_ROOT, as validate_project.py)")
+    parser.add_argument("--rules", action="store_true",
+                        help="Also validate cursor-rules and antigravity-rules (validate_skills.py --rules)")
+    parser.add_argument("--precise", action="store_true",
+                        help="Parse .py files and report only real dangerous calls (AST, cached by content hash)")
+    parser.add_argument("--archives", action="store_true",
+                        help="Also scan members of .zip and .tar(.gz/.bz2/.xz) archives, streamed without extraction")
+    parser.add_argument("--no-sniff", action="store_true",
+                        help="Scan every file of a scanned type, even binary, generated, minified or oversized ones")
+    add_profile_argument(parser)
+    add_memprofile_argument(parser)
+    add_rule_costs_argument(parser)
+    args = parser.parse_args()
+
+    if args.profile:
+        PROFILER.enable(args.profile)
+    if args.memprofile:
+        MEMPROFILER.enable(args.memprofile)
+    if args.rule_costs:
+        RULE_COSTS.enable()
+
+    # Relative to the working directory where possible, as warden_audit.py reports it
+    root = Path(args.root).resolve()
+    try:
+        root = root.relative_to(Path.cwd())
+    except ValueError:
+        pass
+
+    if args.precise:
+        load_ruleset().enable_precise(root / AST_CACHE)
+    if args.archives:
+        ARCHIVES.enable()
+    if args.no_sniff:
+        SNIFFER.enabled = False
+
+    with PROFILER.phase("discovery"):
+        projects = validate_project.find_projects(root)
+    index = WardenIndex(root, PollingWatcher())
+    with PROFILER.phase("walk"):
+        scanned = scan_tree(root, projects, index)
+
+    results = {}
+    section("validate_project --all")
+    print("Validating all projects...\n")
+    results["validate_project"] = validate_project.validate_all(projects, scanned)
+
+    section("warden_audit")
+    sys.stdout.flush()
+    results["warden_audit"] = 0 if warden_audit.run_audit(root, index=index) else 1
+    sys.stderr.flush()
+
+    section("validate_skills")
+    library_root = Path(__file__).parent.parent
+    results["validate_skills"] = validate_skills.validate_library(library_root, rules=args.rules)
+
+    section("Summary")
+    for tool, code in results.items():
+        status = f"{GREEN}pass{RESET}" if code == 0 else f"{RED}fail{RESET}"
+        print(f"  {tool:<18} exit {code}  {status}")
+    return 0 if not any(results.values()) else 1
+
+
+if __name__ == "__main__":
+    with PROFILER.phase("total"):
+        code = main()
+    sys.exit(code)
@@ -0,0 +1,191 @@
+"""
+Index Catalog - Each project's 00_Index_*.md parsed once, shared by every tool.
+
+Three tools read the same index files:
+
+- warden_audit.py decides the tier,
+- validate_project.py checks the frontmatter and required sections,
+- detect_skill_candidates.py mines the Skill Feedback and "New patterns
+  emerging" lists.
+
+CATALOG parses each index file into one IndexRecord and answers all three
+from it. Records are keyed by path and stay valid while the file's
+(mtime, size) is unchanged, so a long-running caller (warden --serve,
+governance_check.py) re-parses an index only after it is edited.
+
+    from index_catalog import CATALOG
+
+    record = CATALOG.get(index_path)
+    record.tier_1, record.tags, record.headings, record.feedback
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from instrumentation import PROFILER
+
+TECH_LANGUAGES = {'python', 'javascript', 'java', 'c++', 'ruby', 'php', 'typescript', 'rust', 'go'}
+# Headers and list items naming a language make a project Tier 1 only near the top
+TIER_HEAD_LINES = 50
+
+IMPROVEMENT = "improvement"
+NEW_PATTERN = "new_pattern"
+
+
+@dataclass(frozen=True)
+class IndexRecord:
+    """What the governance tools need from one index file."""
+    path: Path
+    stamp: tuple[int, int]
+    # The file did not decode as UTF-8; the fields below come from a lenient decode
+    decode_error: UnicodeDecodeError | None
+    # Starts with '---'
+    has_frontmatter: bool
+    # Raw text between the first two '---'; None when it is missing or not closed
+    frontmatter: str | None
+    tags: tuple[str, ...]
+    tier_1: bool
+    # (line number in the body, heading line) for each line starting with '#'
+    headings: tuple[tuple[int, str], ...]
+    # Body lines before the first "## Key Components", the summary; None without one
+    summary_lines: int | None
+    # (IMPROVEMENT or NEW_PATTERN, name, text) for each "- name: text" item, as written
+    feedback: tuple[tuple[str, str, str], ...]
+
+
+def parse_tags(frontmatter: str) -> tuple[str, ...]:
+    """The ``tags:`` list of a frontmatter block, block or flow style."""
+    tags = []
+    in_tags = False
+    for line in frontmatter.split('\n'):
+        stripped = line.strip()
+        if in_tags:
+            if stripped.startswith('- '):
+                tags.append(stripped[2:].strip().strip('"\''))
+                continue
+            if not stripped:
+                continue
+            in_tags = False
+        if stripped.startswith('tags:'):
+            value = stripped[5:].strip()
+            if not value:
+                in_tags = True
+            else:
+                tags.extend(tag.strip().strip('"\'') for tag in value.strip('[]').replace(',', ' ').split())
+    return tuple(tag for tag in tags if tag)
+
+
+def is_tier_1(content: str) -> bool:
+    """Whether an index describes a Tier 1 (Full Stack/Code) project."""
+    content_lower = content.lower()
+
+    # 1. Explicit tags
+    if '#type/code' in content_lower or '#type/project' in content_lower:
+        return True
+    if any(f'tech/{lang}' in content_lower for lang in TECH_LANGUAGES):
+        return True
+
+    # 2. Check headers and list items in the first lines
+    for line in content_lower.split('\n', TIER_HEAD_LINES)[:TIER_HEAD_LINES]:
+        line_strip = line.strip()
+        if line_strip.startswith(('#', '- ', '* ')):
+            if any(lang in line_strip for lang in TECH_LANGUAGES):
+                return True
+    return False
+
+
+def parse_feedback(content: str) -> tuple[tuple[str, str, str], ...]:
+    """The "- name: text" items under Skill Feedback and New patterns emerging."""
+    items = []
+    section = None
+
+    for line in content.split('\n'):
+        line = line.strip()
+
+        # Detect section starts
+        if "Improvements suggested" in line or "Skill Feedback" in line:
+            section = IMPROVEMENT
+            continue
+        elif "New patterns emerging" in line or "patterns emerging" in line:
+            section = NEW_PATTERN
+            continue
+        elif line.startswith("## ") or line.startswith("---"):
+            # New section, reset
+            section = None
+            continue
+
+        # Format: "- skill-name: feedback text" / "- Pattern description: notes"
+        if section is not None and line.startswith("- ") and ":" in line:
+            name, text = line[2:].split(":", 1)
+            items.append((section, name.strip(), text.strip()))
+
+    return tuple(items)
+
+
+def parse_index(path: Path, stamp: tuple[int, int], data: bytes) -> IndexRecord:
+    """Parse one index file's bytes into a record."""
+    decode_error = None
+    try:
+        content = data.decode('utf-8')
+    except UnicodeDecodeError as e:
+        decode_error = e
+        content = data.decode('utf-8', errors='ignore')
+    content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+    has_frontmatter = content.startswith('---')
+    frontmatter = None
+    headings = ()
+    summary_lines = None
+    if has_frontmatter:
+        parts = content.split('---', 2)
+        if len(parts) == 3:
+            frontmatter, body = parts[1], parts[2]
+            headings = tuple(
+                (line_number, line)
+                for line_number, line in enumerate(body.split('\n'))
+                if line.startswith('#')
+            )
+            key_components = body.find('## Key Components')
+            if key_components >= 0:
+                summary_lines = body.count('\n', 0, key_components)
+
+    return IndexRecord(
+        path=path,
+        stamp=stamp,
+        decode_error=decode_error,
+        has_frontmatter=has_frontmatter,
+        frontmatter=frontmatter,
+        tags=parse_tags(frontmatter) if frontmatter is not None else (),
+        tier_1=is_tier_1(content),
+        headings=headings,
+        summary_lines=summary_lines,
+        feedback=parse_feedback(content),
+    )
+
+
+class IndexCatalog:
+    """Parsed index files, re-parsed only when their (mtime, size) changes."""
+
+    def __init__(self):
+        self._records: dict[str, IndexRecord] = {}
+
+    def get(self, path: Path) -> IndexRecord:
+        """The record for an index file. Raises OSError if it cannot be read."""
+        key = os.fspath(path)
+        st = os.stat(key)
+        stamp = (st.st_mtime_ns, st.st_size)
+        record = self._records.get(key)
+        if record is not None and record.stamp == stamp:
+            PROFILER.count("index_catalog_hits")
+            return record
+        PROFILER.count("index_catalog_misses")
+        record = self._records[key] = parse_index(Path(path), stamp, PROFILER.read(Path(path).read_bytes()))
+        return record
+
+    def clear(self) -> None:
+        """Forget every parsed record."""
+        self._records.clear()
+
+
+CATALOG = IndexCatalog()
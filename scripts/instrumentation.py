@@ -0,0 +1,667 @@
+"""
+Instrumentation - Shared per-phase timing, I/O counters and tracing for scripts/.
+
+Every tool imports the module-level PROFILER and wraps its phases and hot
+spots. The profiler is disabled by default, and when disabled phase() returns
+a shared no-op context and count() returns immediately, so instrumented code
+costs next to nothing in normal runs.
+
+Enable with --profile (table on stderr) or --profile json:
+
+    from instrumentation import PROFILER
+
+    with PROFILER.phase("discovery"):
+        projects = find_projects(root)
+    PROFILER.count("files_visited")
+    PROFILER.skip("excluded_dir")
+
+TRACER writes Chrome/Perfetto trace events (--trace out.json): one lane per
+worker thread, spans for every profiled phase, explicit spans for projects,
+and file spans kept only when slower than a threshold.
+
+MEMPROFILER (--memprofile) runs tracemalloc around every profiled phase and
+reports peak and retained memory per phase, the top allocation sites still
+live when the highest-peaking phase ends (a snapshot is only taken at phase
+boundaries, so structures freed before then are missing), and the deep size
+of structures registered with MEMPROFILER.track().
+
+METRICS writes an OpenMetrics/Prometheus textfile (--metrics-file) at the end
+of a run: phase durations, I/O counters, cache hit ratios, findings by
+severity and rule, and per-project scan cost.
+
+RULE_COSTS (--rule-costs) times every rule evaluation - ruleset rules,
+index section patterns, placeholder and instruction patterns, the entropy
+secret scan - and reports each rule's time, text scanned and cost per
+matched character. scripts/regex_stress.py is its offline counterpart: it
+stress-tests the same patterns against adversarial inputs.
+"""
+
+import atexit
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from pathlib import Path
+
+PROFILE_FORMATS = ("table", "json")
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+class Profiler:
+    """Wall/CPU time per phase plus named counters for one run."""
+
+    def __init__(self):
+        self.enabled = False
+        self.format = "table"
+        self.phases: dict[str, dict[str, float]] = {}
+        self.counters: dict[str, int] = defaultdict(int)
+
+    def enable(self, fmt: str = "table", report_at_exit: bool = True) -> None:
+        """Start collecting; optionally print the report when the process exits."""
+        self.enabled = True
+        self.format = fmt
+        if report_at_exit:
+            atexit.register(self.report)
+
+    def phase(self, name: str):
+        """Context manager timing one phase (inclusive of nested phases).
+
+        Also emitted as a trace span when TRACER is enabled, and measured by
+        MEMPROFILER when --memprofile is on.
+        """
+        if not self.enabled:
+            if TRACER.enabled:
+                return TRACER.span(name, cat="phase")
+            return _NULL_CONTEXT
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name: str):
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            with TRACER.span(name, cat="phase"), MEMPROFILER.phase(name):
+                yield
+        finally:
+            totals = self.phases.setdefault(name, {"wall_s": 0.0, "cpu_s": 0.0, "calls": 0})
+            totals["wall_s"] += time.perf_counter() - wall
+            totals["cpu_s"] += time.process_time() - cpu
+            totals["calls"] += 1
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Add ``n`` to a named counter."""
+        if self.enabled:
+            self.counters[name] += n
+
+    def skip(self, reason: str) -> None:
+        """Count one file skipped for ``reason``."""
+        if self.enabled:
+            self.counters[f"files_skipped.{reason}"] += 1
+
+    def read(self, data):
+        """Count one file read of ``data`` (str or bytes) and return it."""
+        if self.enabled:
+            self.counters["files_read"] += 1
+            self.counters["bytes_read"] += len(data)
+        return data
+
+    def as_dict(self) -> dict:
+        return {
+            "phases": {
+                name: {"wall_s": round(t["wall_s"], 6), "cpu_s": round(t["cpu_s"], 6), "calls": t["calls"]}
+                for name, t in self.phases.items()
+            },
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def report(self, stream=None) -> None:
+        """Print the collected profile as a table or JSON (stderr by default)."""
+        stream = stream or sys.stderr
+        if self.format == "json":
+            print(json.dumps(self.as_dict(), indent=2), file=stream)
+            return
+
+        print("\n--- Profile ---", file=stream)
+        print(f"{'phase':32} {'wall (s)':>10} {'cpu (s)':>10} {'calls':>8}", file=stream)
+        for name, t in sorted(self.phases.items(), key=lambda x: -x[1]["wall_s"]):
+            print(f"{name:32} {t['wall_s']:10.4f} {t['cpu_s']:10.4f} {t['calls']:8}", file=stream)
+        if self.counters:
+            print(f"\n{'counter':32} {'value':>10}", file=stream)
+            for name, value in sorted(self.counters.items()):
+                print(f"{name:32} {value:10}", file=stream)
+
+
+class Tracer:
+    """Collect Chrome trace-event spans ("X" events) with one lane per thread."""
+
+    def __init__(self):
+        self.enabled = False
+        self.path: Path | None = None
+        self.slow_file_us = 0
+        self.events: list[dict] = []
+        self._lanes: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+
+    def enable(self, path: Path, slow_file_ms: float = 5.0, write_at_exit: bool = True) -> None:
+        """Start tracing; optionally write the trace file when the process exits."""
+        self.enabled = True
+        self.path = Path(path)
+        self.slow_file_us = slow_file_ms * 1000
+        self._start = time.perf_counter()
+        if write_at_exit:
+            atexit.register(self.write)
+
+    def _lane(self) -> int:
+        ident = threading.get_ident()
+        lane = self._lanes.get(ident)
+        if lane is None:
+            with self._lock:
+                lane = self._lanes.setdefault(ident, len(self._lanes) + 1)
+                self.events.append({
+                    "name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": lane,
+                    "args": {"name": "main" if lane == 1 else f"worker-{lane - 1}"},
+                })
+        return lane
+
+    def span(self, name: str, cat: str = "span", **args):
+        """Context manager recording one span on the current thread's lane."""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._record(name, cat, args, min_us=0)
+
+    def file_span(self, path, cat: str = "file"):
+        """Like span(), but only kept when slower than the slow-file threshold."""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._record(str(path), cat, {}, min_us=self.slow_file_us)
+
+    @contextlib.contextmanager
+    def _record(self, name: str, cat: str, args: dict, min_us: float):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            dur = (time.perf_counter() - start) * 1e6
+            if dur >= min_us:
+                event = {
+                    "name": name, "cat": cat, "ph": "X",
+                    "ts": round((start - self._start) * 1e6, 1), "dur": round(dur, 1),
+                    "pid": os.getpid(), "tid": self._lane(),
+                }
+                if args:
+                    event["args"] = args
+                with self._lock:
+                    self.events.append(event)
+
+    def write(self) -> None:
+        """Write the trace as JSON loadable by chrome://tracing or Perfetto."""
+        if self.path is None:
+            return
+        self.path.write_text(json.dumps({"traceEvents": self.events, "displayTimeUnit": "ms"}))
+
+
+class MemProfiler:
+    """tracemalloc peak/retained memory per phase plus deep sizes of tracked structures."""
+
+    def __init__(self):
+        self.enabled = False
+        self.top_n = 10
+        self.phases: dict[str, dict[str, int]] = {}
+        self.structures: dict[str, dict[str, int]] = {}
+        self._stack: list[list[int]] = []
+        self._high_water = 0
+        self._high_water_phase = ""
+        self._snapshot: tracemalloc.Snapshot | None = None
+
+    def enable(self, top_n: int = 10, report_at_exit: bool = True) -> None:
+        """Start tracing allocations; phases come from PROFILER, which is switched on silently."""
+        self.enabled = True
+        self.top_n = top_n
+        tracemalloc.start(1)
+        if not PROFILER.enabled:
+            PROFILER.enable(report_at_exit=False)
+        if report_at_exit:
+            atexit.register(self.report)
+
+    def phase(self, name: str):
+        """Context manager recording one phase's peak and retained memory."""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._measured(name)
+
+    @contextlib.contextmanager
+    def _measured(self, name: str):
+        # tracemalloc has a single peak counter: fold it into the enclosing
+        # phase before resetting it, and fold ours back when we finish.
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            self._stack[-1][1] = max(self._stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        frame = [current, current]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            end, peak = tracemalloc.get_traced_memory()
+            self._stack.pop()
+            peak = max(frame[1], peak)
+            if self._stack:
+                self._stack[-1][1] = max(self._stack[-1][1], peak)
+            totals = self.phases.setdefault(name, {"peak": 0, "retained": 0, "calls": 0})
+            totals["peak"] = max(totals["peak"], peak)
+            totals["retained"] += end - frame[0]
+            totals["calls"] += 1
+            if peak > self._high_water:
+                # Allocation sites still live as the highest-peaking phase ends;
+                # whatever the phase freed before returning is not in it
+                self._high_water = peak
+                self._high_water_phase = name
+                self._snapshot = tracemalloc.take_snapshot().filter_traces([
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+                ])
+
+    def track(self, name: str, obj) -> None:
+        """Record the deep size of a structure (largest seen per name)."""
+        if not self.enabled:
+            return
+        size, count = deep_size(obj)
+        known = self.structures.get(name)
+        if known is None or size > known["bytes"]:
+            self.structures[name] = {"bytes": size, "objects": count}
+
+    def top_sites(self) -> list[dict]:
+        """Top allocation sites (file:line) still live at the end of the high-water phase."""
+        if self._snapshot is None:
+            return []
+        return [
+            {"site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+             "bytes": stat.size, "blocks": stat.count}
+            for stat in self._snapshot.statistics("lineno")[:self.top_n]
+        ]
+
+    def as_dict(self) -> dict:
+        return {
+            "peak_bytes": tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0,
+            "high_water": {"bytes": self._high_water, "phase": self._high_water_phase,
+                           "sites_at_phase_end": self.top_sites()},
+            "phases": self.phases,
+            "structures": dict(sorted(self.structures.items(), key=lambda x: -x[1]["bytes"])),
+        }
+
+    def report(self, stream=None) -> None:
+        """Print the memory profile in PROFILER's format (stderr by default)."""
+        stream = stream or sys.stderr
+        if PROFILER.format == "json":
+            print(json.dumps({"memory": self.as_dict()}, indent=2), file=stream)
+            return
+
+        print("\n--- Memory Profile ---", file=stream)
+        print(f"High-water mark: {_kib(self._high_water)} KiB (in phase '{self._high_water_phase}')", file=stream)
+        print(f"\n{'phase':32} {'peak (KiB)':>12} {'retained (KiB)':>15} {'calls':>8}", file=stream)
+        for name, m in sorted(self.phases.items(), key=lambda x: -x[1]["peak"]):
+            print(f"{name:32} {_kib(m['peak']):>12} {_kib(m['retained']):>15} {m['calls']:8}", file=stream)
+        if self.structures:
+            print(f"\n{'structure':32} {'size (KiB)':>12} {'objects':>10}", file=stream)
+            for name, m in sorted(self.structures.items(), key=lambda x: -x[1]["bytes"]):
+                print(f"{name:32} {_kib(m['bytes']):>12} {m['objects']:10}", file=stream)
+        sites = self.top_sites()
+        if sites:
+            print(f"\nTop allocation sites live at end of peak phase '{self._high_water_phase}':", file=stream)
+            for site in sites:
+                print(f"  {_kib(site['bytes']):>10} KiB {site['blocks']:8} blocks  {site['site']}", file=stream)
+
+
+def deep_size(obj) -> tuple[int, int]:
+    """Bytes and object count reachable from ``obj`` (containers, dataclasses, __slots__)."""
+    seen = set()
+    stack = [obj]
+    size = count = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        count += 1
+        if isinstance(item, (str, bytes, int, float, bool, type(None), Path)):
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        else:
+            if hasattr(item, "__dict__"):
+                stack.append(vars(item))
+            for slot in getattr(type(item), "__slots__", ()):
+                if hasattr(item, slot):
+                    stack.append(getattr(item, slot))
+    return size, count
+
+
+def _kib(n: int) -> str:
+    return f"{n / 1024:.1f}".replace("-0.0", "0.0")
+
+
+class RuleCosts:
+    """Time, text scanned and text matched per rule (regex or scanner) for one run.
+
+    Sizes are in characters of decoded text. A rule's time covers its
+    evaluations only: ruleset literal prefilters that rule it out are free.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        # rule -> [evals, seconds, chars scanned, matches, chars matched]
+        self.rules: dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def enable(self, report_at_exit: bool = True) -> None:
+        """Start collecting; optionally print the report when the process exits."""
+        self.enabled = True
+        if report_at_exit:
+            atexit.register(self.report)
+
+    def record(self, rule: str, seconds: float, scanned: int, matches: int = 0, matched: int = 0) -> None:
+        """Add one evaluation of ``rule`` over ``scanned`` characters."""
+        if not self.enabled:
+            return
+        with self._lock:
+            totals = self.rules.get(rule)
+            if totals is None:
+                totals = self.rules[rule] = [0, 0.0, 0, 0, 0]
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] += scanned
+            totals[3] += matches
+            totals[4] += matched
+
+    def searcher(self, rule: str, pattern):
+        """``pattern.search``, timed under ``rule`` when enabled (free when not)."""
+        if not self.enabled:
+            return pattern.search
+
+        def search(text):
+            start = time.perf_counter()
+            match = pattern.search(text)
+            elapsed = time.perf_counter() - start
+            if match is None:
+                self.record(rule, elapsed, len(text))
+            else:
+                self.record(rule, elapsed, len(text), 1, match.end() - match.start())
+            return match
+        return search
+
+    def as_dict(self) -> dict:
+        costs = {}
+        for rule, (evals, seconds, scanned, matches, matched) in sorted(self.rules.items(), key=lambda x: -x[1][1]):
+            costs[rule] = {
+                "evals": evals, "seconds": round(seconds, 6), "chars_scanned": scanned,
+                "matches": matches, "chars_matched": matched,
+                "us_per_kib_scanned": round(seconds * 1e6 * 1024 / scanned, 3) if scanned else None,
+                "us_per_char_matched": round(seconds * 1e6 / matched, 3) if matched else None,
+            }
+        return costs
+
+    def report(self, stream=None) -> None:
+        """Print cost per rule, most expensive first, in PROFILER's format (stderr by default)."""
+        stream = stream or sys.stderr
+        costs = self.as_dict()
+        if PROFILER.format == "json":
+            print(json.dumps({"rule_costs": costs}, indent=2), file=stream)
+            return
+
+        total = sum(c["seconds"] for c in costs.values()) or 1.0
+        print("\n--- Rule Costs ---", file=stream)
+        print(f"{'rule':36} {'evals':>8} {'time (ms)':>10} {'share':>6} {'scanned (KiB)':>14} "
+              f"{'matches':>8} {'us/KiB':>8} {'us/matched char':>16}", file=stream)
+        for rule, c in costs.items():
+            per_kib = f"{c['us_per_kib_scanned']:.2f}" if c["us_per_kib_scanned"] is not None else "-"
+            per_match = f"{c['us_per_char_matched']:.2f}" if c["us_per_char_matched"] is not None else "-"
+            print(f"{rule[:36]:36} {c['evals']:8} {c['seconds'] * 1000:10.2f} {c['seconds'] / total:6.1%} "
+                  f"{_kib(c['chars_scanned']):>14} {c['matches']:8} {per_kib:>8} {per_match:>16}", file=stream)
+
+
+class Metrics:
+    """Collect run metrics and write them as an OpenMetrics textfile."""
+
+    def __init__(self):
+        self.enabled = False
+        self.path: Path | None = None
+        self.tool = ""
+        self.findings: Counter = Counter()
+        self.projects: dict[str, dict[str, float]] = {}
+        self._start = time.time()
+
+    def enable(self, path: Path, tool: str, write_at_exit: bool = True) -> None:
+        """Start collecting; optionally write the textfile when the process exits.
+
+        Phase timings and counters come from PROFILER, which is switched on
+        silently if --profile was not given.
+        """
+        self.enabled = True
+        self.path = Path(path)
+        self.tool = tool
+        self._start = time.time()
+        if not PROFILER.enabled:
+            PROFILER.enable(report_at_exit=False)
+        if write_at_exit:
+            atexit.register(self.write)
+
+    def finding(self, severity: str, rule: str) -> None:
+        """Count one finding."""
+        if self.enabled:
+            self.findings[(severity, rule)] += 1
+
+    def project(self, name: str):
+        """Context manager measuring one project's scan cost."""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._project(name)
+
+    @contextlib.contextmanager
+    def _project(self, name: str):
+        wall = time.perf_counter()
+        files, size = PROFILER.counters["files_read"], PROFILER.counters["bytes_read"]
+        try:
+            yield
+        finally:
+            self.projects[name] = {
+                "seconds": time.perf_counter() - wall,
+                "files": PROFILER.counters["files_read"] - files,
+                "bytes": PROFILER.counters["bytes_read"] - size,
+            }
+
+    def render(self) -> str:
+        """Render every metric family in OpenMetrics text format."""
+        lines = []
+        tool = {"tool": self.tool}
+
+        def family(name: str, help_text: str, samples: list[tuple[dict, float]], unit: str = "") -> None:
+            if not samples:
+                return
+            lines.append(f"# TYPE {name} gauge")
+            if unit:
+                lines.append(f"# UNIT {name} {unit}")
+            lines.append(f"# HELP {name} {help_text}")
+            for labels, value in samples:
+                lines.append(f"{name}{{{_labels({**tool, **labels})}}} {_number(value)}")
+
+        family("governance_last_run_timestamp_seconds", "Unix time the run finished.",
+               [({}, time.time())], "seconds")
+        family("governance_run_duration_seconds", "Wall time of the whole run.",
+               [({}, time.time() - self._start)], "seconds")
+        family("governance_phase_duration_seconds", "Wall time per phase.",
+               [({"phase": n}, t["wall_s"]) for n, t in sorted(PROFILER.phases.items())], "seconds")
+        family("governance_phase_cpu_seconds", "CPU time per phase.",
+               [({"phase": n}, t["cpu_s"]) for n, t in sorted(PROFILER.phases.items())], "seconds")
+
+        counters = dict(PROFILER.counters)
+        skipped = [({"reason": k.split(".", 1)[1]}, v) for k, v in sorted(counters.items()) if k.startswith("files_skipped.")]
+        plain = [(k, v) for k, v in sorted(counters.items()) if "." not in k]
+        for name, value in plain:
+            family(f"governance_{name}", f"Run counter '{name}'.", [({}, value)])
+        family("governance_files_skipped", "Files skipped, by reason.", skipped)
+
+        # Hit ratio for every <cache>cache_hits / <cache>cache_misses pair
+        ratios = []
+        for name in counters:
+            if name.endswith("cache_hits"):
+                prefix = name[:-len("cache_hits")]
+                hits, misses = counters[name], counters.get(prefix + "cache_misses", 0)
+                if hits + misses:
+                    ratios.append(({"cache": prefix.rstrip("_") or "default"}, hits / (hits + misses)))
+        family("governance_cache_hit_ratio", "Cache hits / lookups.", ratios)
+
+        family("governance_findings", "Findings by severity and rule.",
+               [({"severity": sev, "rule": rule}, n) for (sev, rule), n in sorted(self.findings.items())])
+        costs = sorted(RULE_COSTS.rules.items())
+        family("governance_rule_seconds", "Time spent evaluating each rule (--rule-costs).",
+               [({"rule": r}, c[1]) for r, c in costs], "seconds")
+        family("governance_rule_scanned_chars", "Text each rule was evaluated over (--rule-costs).",
+               [({"rule": r}, c[2]) for r, c in costs])
+        family("governance_rule_matched_chars", "Text each rule matched (--rule-costs).",
+               [({"rule": r}, c[4]) for r, c in costs])
+        family("governance_project_scan_seconds", "Wall time spent scanning each project.",
+               [({"project": p}, c["seconds"]) for p, c in sorted(self.projects.items())], "seconds")
+        family("governance_project_files_read", "Files read while scanning each project.",
+               [({"project": p}, c["files"]) for p, c in sorted(self.projects.items())])
+        family("governance_project_read_bytes", "Bytes read while scanning each project.",
+               [({"project": p}, c["bytes"]) for p, c in sorted(self.projects.items())], "bytes")
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self) -> None:
+        """Write the textfile atomically, as textfile collectors require."""
+        if not self.enabled or self.path is None:
+            return
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(self.render())
+        os.replace(tmp_path, self.path)
+
+
+def _labels(labels: dict) -> str:
+    escaped = (
+        (k, str(v).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n"))
+        for k, v in labels.items()
+    )
+    return ",".join(f'{k}="{v}"' for k, v in escaped)
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+PROFILER = Profiler()
+TRACER = Tracer()
+MEMPROFILER = MemProfiler()
+METRICS = Metrics()
+RULE_COSTS = RuleCosts()
+
+
+def add_profile_argument(parser) -> None:
+    """Add the shared --profile option to an argparse parser."""
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='table',
+        choices=PROFILE_FORMATS,
+        help="Report per-phase timing and I/O counters at exit (table or json)"
+    )
+
+
+def add_memprofile_argument(parser) -> None:
+    """Add the shared --memprofile option to an argparse parser."""
+    parser.add_argument(
+        '--memprofile',
+        nargs='?',
+        const=10,
+        type=int,
+        metavar='TOP',
+        help="Report tracemalloc peak memory per phase and the TOP allocation sites at exit (default: 10)"
+    )
+
+
+def add_rule_costs_argument(parser) -> None:
+    """Add the shared --rule-costs option to an argparse parser."""
+    parser.add_argument(
+        '--rule-costs',
+        action='store_true',
+        help="Report time, text scanned and cost per matched character for every rule at exit"
+    )
+
+
+def add_trace_arguments(parser) -> None:
+    """Add the shared --trace / --trace-slow-ms options to an argparse parser."""
+    parser.add_argument(
+        '--trace',
+        type=Path,
+        metavar='FILE',
+        help="Write Chrome/Perfetto trace events to FILE"
+    )
+    parser.add_argument(
+        '--trace-slow-ms',
+        type=float,
+        default=5.0,
+        help="Trace individual files that take at least this long (default: 5)"
+    )
+
+
+def add_metrics_argument(parser) -> None:
+    """Add the shared --metrics-file option to an argparse parser."""
+    parser.add_argument(
+        '--metrics-file',
+        type=Path,
+        metavar='FILE',
+        help="Write OpenMetrics/Prometheus textfile output to FILE at the end of the run"
+    )
+
+
+def pop_option(argv: list[str], name: str) -> str | None:
+    """Remove ``name VALUE`` / ``name=VALUE`` from a hand-parsed argv."""
+    for i, arg in enumerate(argv):
+        if arg == name and i + 1 < len(argv):
+            value = argv[i + 1]
+            del argv[i:i + 2]
+            return value
+        if arg.startswith(name + '='):
+            del argv[i]
+            return arg.split('=', 1)[1]
+    return None
+
+
+def pop_profile_flag(argv: list[str]) -> str | None:
+    """Remove --profile[=fmt] / --profile fmt from a hand-parsed argv."""
+    for i, arg in enumerate(argv):
+        if arg == '--profile':
+            del argv[i]
+            if i < len(argv) and argv[i] in PROFILE_FORMATS:
+                return argv.pop(i)
+            return 'table'
+        if arg.startswith('--profile='):
+            del argv[i]
+            fmt = arg.split('=', 1)[1]
+            return fmt if fmt in PROFILE_FORMATS else 'table'
+    return None
+
+
+def pop_memprofile_flag(argv: list[str]) -> int | None:
+    """Remove --memprofile[=N] / --memprofile N from a hand-parsed argv."""
+    for i, arg in enumerate(argv):
+        if arg == '--memprofile':
+            del argv[i]
+            if i < len(argv) and argv[i].isdigit():
+                return int(argv.pop(i))
+            return 10
+        if arg.startswith('--memprofile='):
+            del argv[i]
+            value = arg.split('=', 1)[1]
+            return int(value) if value.isdigit() else 10
+    return None
@@ -13,8 +13,8 @@ PROJECT_ROOT="$(dirname "$SCRIPT_DIR")"
 
 cd "$PROJECT_ROOT"
 
-echo "1. Running Warden Security Audit (fast mode)..."
-python ./scripts/warden_audit.py --root . --fast
+echo "1. Running Warden Security Audit (fast mode, or the warden daemon if running)..."
+python ./scripts/warden_audit.py --root . --fast --query
 WARDEN_EXIT=$?
 
 echo ""
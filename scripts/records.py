@@ -0,0 +1,109 @@
+"""
+Records - Compact record types for findings, references and evidence.
+
+A scan of a large projects root holds one object per finding, skill
+reference and evidence item, and most of their fields repeat: the same
+project name, the same file path, the same rule label, thousands of times.
+Tuples of pathlib.Path objects and dicts with string keys spend most of
+their memory on that repetition. Records here are slotted dataclasses
+(no per-instance __dict__), and their paths, project names and rule ids are
+interned, so every repeat shares one string. Paths are kept as str and turned
+into Path objects only when read; messages are formatted only when reported.
+
+- Issue:     one warden finding; unpacks as (Path, pattern, Severity) like
+             the tuple it replaces,
+- Reference: one skill reference found in a project,
+- Match:     one instruction-pattern match in a file,
+- Evidence:  one example line backing a skill candidate,
+- Defect:    one validate_project error, formatted by str().
+
+    from records import Issue, intern_path
+
+    issues.append(Issue(file_path, rule.label, Severity.P0))
+    for file_path, pattern, severity in issues:
+        ...
+"""
+
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+
+def intern_path(path) -> str:
+    """The path as a str shared by every record naming it."""
+    return sys.intern(os.fspath(path))
+
+
+@dataclass(slots=True)
+class Issue:
+    """One warden finding: pattern (rule label or READ_ERROR text) in path."""
+    path: str
+    pattern: str
+    severity: object  # warden_audit.Severity
+
+    def __post_init__(self):
+        self.path = intern_path(self.path)
+        self.pattern = sys.intern(self.pattern)
+
+    def __iter__(self):
+        yield Path(self.path)
+        yield self.pattern
+        yield self.severity
+
+
+@dataclass(slots=True)
+class Reference:
+    """A line of a project file that references a skill."""
+    project: str
+    file: str
+    line: int
+    context: str
+
+    def __post_init__(self):
+        self.project = sys.intern(self.project)
+        self.file = intern_path(self.file)
+
+
+@dataclass(slots=True)
+class Match:
+    """A line of an instruction file matching one of INSTRUCTION_PATTERNS."""
+    file: str
+    line: int
+    pattern: str
+    description: str
+    context: str
+
+    def __post_init__(self):
+        self.file = intern_path(self.file)
+
+
+@dataclass(slots=True)
+class Evidence:
+    """An example line backing a skill candidate."""
+    project: str
+    file: str
+    context: str
+
+    def __post_init__(self):
+        self.project = sys.intern(self.project)
+        self.file = intern_path(self.file)
+
+
+@dataclass(slots=True)
+class Defect:
+    """A validate_project error, formatted from its template when reported.
+
+    The template names any of {path}, {line}, {reason} and {detail}.
+    """
+    template: str
+    path: str = ""
+    line: int = 0
+    reason: str = ""
+    detail: str = ""
+
+    def __post_init__(self):
+        self.path = intern_path(self.path)
+
+    def __str__(self) -> str:
+        return self.template.format(path=self.path, line=self.line, reason=self.reason, detail=self.detail)
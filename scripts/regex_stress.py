@@ -0,0 +1,539 @@
+#!/usr/bin/env python3
+"""
+Regex Stress - Catch catastrophic backtracking before a rule ships.
+
+Python's re module backtracks. A rule like (a+)+b can take exponential time
+on an input that nearly matches, and a finditer over a class run followed by
+a literal (eyJ[...]{10,}\\.) can take quadratic time on a file full of
+partial matches. Either one can turn a 1-second hook into a 60-second one
+on a single unlucky file. This script stress-tests every configured pattern
+offline:
+
+- the governance_rules.json rules (or a candidate rules file, --rules-file),
+- validate_project.py's REQUIRED_SECTION_PATTERNS and PLACEHOLDER_PATTERNS,
+- detect_skill_candidates.py's INSTRUCTION_PATTERNS,
+- secret_scan.py's assignment scan, content_sniff.py's generated marker,
+  and the smaller patterns of skill_manifest.py, detect_drift.py and
+  ast_scan.py.
+
+Adversarial inputs are built from each pattern's parse tree:
+
+- the body of every quantifier pumped n times after a matching prefix, then
+  a character that makes the match fail,
+- every prefix of a match repeated n times (partial matches for finditer),
+- every character the pattern mentions repeated n times.
+
+Each input is timed at doubling lengths, from 16 characters until one
+evaluation takes long enough to measure, or the length reaches the largest
+text the scan meets in practice: a line (content_sniff.MAX_LINE_BYTES), a
+file head (SNIFF_BYTES) or a whole file (MAX_FILE_BYTES, measured up to 1M
+characters). The growth exponent of the last doublings projects the cost
+at that size. A pattern fails when its worst projection exceeds the budget,
+or when it grows cubically or worse. Each pattern runs in its own
+process, so a hang is stopped at --timeout and reported as catastrophic.
+
+Pair with --rule-costs on the tools to see what the patterns cost on real
+trees.
+
+Usage:
+    python scripts/regex_stress.py
+    python scripts/regex_stress.py --rules-file candidate_rules.json --only ruleset:
+    python scripts/regex_stress.py --budget 0.5 --verbose
+"""
+
+import argparse
+import math
+import multiprocessing
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Callable
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+import ast_scan
+import content_sniff
+import detect_drift
+import detect_skill_candidates
+import secret_scan
+import skill_manifest
+import validate_project
+from ruleset import RULES_FILE, load_ruleset
+
+# ANSI colors
+GREEN = "\033[92m"
+RED = "\033[91m"
+YELLOW = "\033[93m"
+RESET = "\033[0m"
+BOLD = "\033[1m"
+
+# Largest text each kind of pattern is evaluated on in one call
+SCOPE_CHARS = {
+    "line": content_sniff.MAX_LINE_BYTES,
+    "head": content_sniff.SNIFF_BYTES,
+    "file": content_sniff.MAX_FILE_BYTES,
+}
+
+MIN_CHARS = 16
+MAX_CHARS = 1024 * 1024
+# Stop growing an input once one evaluation takes this long: growth is measurable
+SIGNAL_SECONDS = 0.01
+# Evaluations faster than this are too noisy to estimate growth from
+NOISE_FLOOR_SECONDS = 0.002
+# Growth exponent from which a pattern is catastrophic whatever the budget
+CATASTROPHIC_EXPONENT = 3.0
+POLYNOMIAL_EXPONENT = 1.5
+
+# Characters that end a near-match: NUL is in no pattern, newline ends lines
+FAIL_SUFFIXES = ("\0", "\n")
+# Candidates for sampling character classes, most readable first
+SAMPLE_CHARS = "aA0 _-./=:\"'xZ9\t#{}[]()!@$%&*+,;<>?\\|`~"
+MAX_ALPHABET = 8
+
+REPEATS = {"MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"}
+CATEGORY_TESTS = {
+    "CATEGORY_DIGIT": str.isdigit,
+    "CATEGORY_SPACE": str.isspace,
+    "CATEGORY_WORD": lambda c: c.isalnum() or c == "_",
+    "CATEGORY_LINEBREAK": lambda c: c == "\n",
+}
+
+
+@dataclass
+class Target:
+    """One configured pattern and the way the tools evaluate it."""
+    name: str
+    pattern: re.Pattern
+    scope: str
+    run: Callable[[str], object]
+
+
+def searching(pattern: re.Pattern) -> Callable[[str], object]:
+    """Evaluate like a per-line or per-head check: first match only."""
+    if isinstance(pattern.pattern, bytes):
+        return lambda text: pattern.search(text.encode("utf-8"))
+    return pattern.search
+
+
+def scanning(pattern: re.Pattern) -> Callable[[str], object]:
+    """Evaluate like a whole-file rule: every match."""
+    def run(text: str) -> None:
+        for _ in pattern.finditer(text):
+            pass
+    return run
+
+
+def configured_patterns(rules_file: Path = RULES_FILE) -> list[Target]:
+    """Every pattern the governance tools evaluate, named as --rule-costs names them."""
+    targets = [
+        Target(f"ruleset:{rule.id}", rule.regex, "file", scanning(rule.regex))
+        for rule in load_ruleset(rules_file).rules
+    ]
+    targets += [
+        Target(f"section:{name}", pattern, "file", searching(pattern))
+        for pattern, name in validate_project.REQUIRED_SECTION_PATTERNS
+    ]
+    targets += [
+        Target(f"placeholder:{reason}", pattern, "line", searching(pattern))
+        for pattern, reason in validate_project.PLACEHOLDER_PATTERNS
+    ]
+    for pattern, description in detect_skill_candidates.INSTRUCTION_PATTERNS:
+        regex = re.compile(pattern, re.IGNORECASE)
+        targets.append(Target(f"instruction:{description}", regex, "line", searching(regex)))
+
+    # The assignment scan is one name regex plus per-name checks; its grammar,
+    # as one regex, drives the inputs and the scan itself is timed
+    assignment = re.compile(
+        "(?:" + "|".join(secret_scan.CREDENTIAL_WORDS) + ")" + secret_scan.NAME_TAIL.pattern
+        + secret_scan.OPERATOR.pattern + secret_scan.VALUE.pattern[:-1] + f"{{{secret_scan.MIN_VALUE_LENGTH},}}"
+    )
+    targets.append(Target("secret-entropy", assignment, "file",
+                          lambda text: sum(1 for _ in secret_scan.iter_entropy_secrets(text))))
+
+    targets += [
+        Target("sniff:generated-marker", content_sniff.GENERATED_MARKER, "head",
+               searching(content_sniff.GENERATED_MARKER)),
+        Target("manifest:follow", skill_manifest.FOLLOW_PATTERN, "head", searching(skill_manifest.FOLLOW_PATTERN)),
+        Target("manifest:title", skill_manifest.TITLE_PATTERN, "head", searching(skill_manifest.TITLE_PATTERN)),
+        Target("drift:section", detect_drift.SECTION_PATTERN, "line", detect_drift.SECTION_PATTERN.match),
+        Target("ast:shell-rm", ast_scan.SHELL_RM, "line", searching(ast_scan.SHELL_RM)),
+    ]
+    return targets
+
+
+# --- Input generation from the parse tree ---
+
+def _member(items: list, char: str) -> bool:
+    """Whether ``char`` is in a parsed character class."""
+    negate = False
+    found = False
+    for op, av in items:
+        op = str(op)
+        if op == "NEGATE":
+            negate = True
+        elif op == "LITERAL":
+            found = found or ord(char) == av
+        elif op == "RANGE":
+            found = found or av[0] <= ord(char) <= av[1]
+        elif op == "CATEGORY":
+            name = str(av)
+            test = CATEGORY_TESTS.get(name.replace("_NOT_", "_"))
+            if test is not None:
+                found = found or (test(char) != ("_NOT_" in name))
+    return found != negate
+
+
+def _char_for(op: str, av) -> str:
+    """A character matching one single-character node."""
+    if op == "LITERAL":
+        return chr(av)
+    if op == "NOT_LITERAL":
+        return next(c for c in SAMPLE_CHARS if ord(c) != av)
+    if op == "IN":
+        return next((c for c in SAMPLE_CHARS if _member(av, c)), "")
+    return "a"  # ANY
+
+
+def sample(items) -> str:
+    """A short string matched by a parsed sequence (minimum repetitions, first alternatives)."""
+    out = []
+    for op, av in items:
+        op = str(op)
+        if op in ("LITERAL", "NOT_LITERAL", "IN", "ANY"):
+            out.append(_char_for(op, av))
+        elif op in REPEATS:
+            out.append(sample(av[2]) * av[0])
+        elif op == "SUBPATTERN":
+            out.append(sample(av[-1]))
+        elif op == "ATOMIC_GROUP":
+            out.append(sample(av))
+        elif op == "BRANCH":
+            out.append(sample(av[1][0]))
+        # AT, ASSERT, ASSERT_NOT, GROUPREF: nothing to add
+    return "".join(out)
+
+
+def _children(op: str, av) -> list:
+    if op in REPEATS:
+        return [av[2]]
+    if op == "SUBPATTERN":
+        return [av[-1]]
+    if op == "ATOMIC_GROUP":
+        return [av]
+    if op == "BRANCH":
+        return list(av[1])
+    return []
+
+
+def pumps(items, prefix: str = "") -> list[tuple[str, str]]:
+    """(prefix, body) for every quantifier that can repeat, with a prefix leading to it."""
+    found = []
+    for i, (op, av) in enumerate(items):
+        op = str(op)
+        before = prefix + sample(items[:i])
+        if op in REPEATS and av[1] > 1:
+            body = sample(av[2]) or _first_char(av[2])
+            if body:
+                found.append((before, body))
+        for child in _children(op, av):
+            found.extend(pumps(child, before))
+    return found
+
+
+def _first_char(items) -> str:
+    """Some character a sequence can start with, for bodies whose minimum is empty."""
+    for op, av in items:
+        op = str(op)
+        if op in ("LITERAL", "NOT_LITERAL", "IN", "ANY"):
+            return _char_for(op, av)
+        for child in _children(op, av):
+            char = _first_char(child)
+            if char:
+                return char
+    return ""
+
+
+def alphabet(items) -> list[str]:
+    """Characters the pattern mentions, first members of its classes included."""
+    chars = []
+    for op, av in items:
+        op = str(op)
+        if op in ("LITERAL", "NOT_LITERAL", "IN", "ANY"):
+            chars.append(_char_for(op, av))
+            if op == "IN":
+                chars.extend(chr(v) for o, v in av if str(o) == "LITERAL")
+        for child in _children(op, av):
+            chars.extend(alphabet(child))
+    return list(dict.fromkeys(c for c in chars if c))[:MAX_ALPHABET]
+
+
+def nested_quantifier(items, inside: bool = False) -> bool:
+    """Whether a repeating quantifier sits inside another (the classic exponential shape)."""
+    for op, av in items:
+        op = str(op)
+        repeats = op in REPEATS and av[1] > 1
+        if repeats and inside:
+            return True
+        for child in _children(op, av):
+            if nested_quantifier(child, inside or repeats):
+                return True
+    return False
+
+
+def attack_inputs(pattern: re.Pattern) -> dict[str, tuple[str, str, str]]:
+    """Adversarial (prefix, pump, suffix) families for a pattern, by label."""
+    flags = pattern.flags if isinstance(pattern.pattern, str) else 0
+    source = pattern.pattern if isinstance(pattern.pattern, str) else pattern.pattern.decode("latin-1")
+    items = list(sre_parse.parse(source, flags))
+    families = []
+    for before, body in pumps(items):
+        families += [(before, body, suffix) for suffix in FAIL_SUFFIXES]
+    for i in range(1, len(items) + 1):
+        partial = sample(items[:i])
+        if partial:
+            families.append(("", partial, "\0"))
+    families += [("", char, "\0") for char in alphabet(items)]
+    return {_label(*family): family for family in dict.fromkeys(families)}
+
+
+def _label(prefix: str, pump: str, suffix: str) -> str:
+    text = f"{pump!r} * n + {suffix!r}"
+    return f"{prefix!r} + {text}" if prefix else text
+
+
+def build(prefix: str, pump: str, suffix: str, chars: int) -> str:
+    count = max(1, -(-(chars - len(prefix) - len(suffix)) // len(pump)))
+    return prefix + pump * count + suffix
+
+
+# --- Measurement ---
+
+def time_once(run: Callable[[str], object], text: str) -> float:
+    """Best of three to five evaluations (three once they add up to 20ms)."""
+    best = math.inf
+    spent = 0.0
+    for attempt in range(5):
+        start = time.perf_counter()
+        run(text)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        if attempt >= 2 and spent > 0.02:
+            break
+    return best
+
+
+def stress_worker(target: Target, conn) -> None:
+    """Child process: send (label, chars, None) before and (label, chars, seconds)
+    after each measurement, then None."""
+    limit = min(MAX_CHARS, SCOPE_CHARS[target.scope])
+    for label, family in attack_inputs(target.pattern).items():
+        chars = MIN_CHARS
+        while chars <= limit:
+            text = build(*family, chars)
+            conn.send((label, len(text), None))
+            seconds = time_once(target.run, text)
+            conn.send((label, len(text), seconds))
+            if seconds >= SIGNAL_SECONDS:
+                break
+            chars *= 2
+    conn.send(None)
+    conn.close()
+
+
+@dataclass
+class Verdict:
+    """The worst input family found for one target."""
+    target: Target
+    label: str = ""
+    exponent: float = 1.0
+    projected: float = 0.0
+    measured: tuple[int, float] = (0, 0.0)
+    timed_out: bool = False
+
+    @property
+    def catastrophic(self) -> bool:
+        return self.timed_out or self.exponent >= CATASTROPHIC_EXPONENT
+
+
+def project(points: list[tuple[int, float]], scope_chars: int) -> tuple[float, float]:
+    """(growth exponent, projected seconds at scope_chars) from doubling measurements.
+
+    The exponent is the smaller of the last two doublings' (one slow
+    outlier cannot fake growth), from measurements above the noise floor;
+    without enough signal growth is taken as linear.
+    """
+    chars, seconds = points[-1]
+    exponents = [
+        math.log(t2 / t1) / math.log(c2 / c1)
+        for (c1, t1), (c2, t2) in zip(points[-3:], points[-2:])
+        if t1 >= NOISE_FLOOR_SECONDS / 2 and c2 > c1
+    ]
+    exponent = max(1.0, min(exponents)) if exponents else 1.0
+    return exponent, seconds * (scope_chars / chars) ** exponent
+
+
+def judge(target: Target, results: dict[str, list], timed_out_on: tuple[str, int] | None) -> Verdict:
+    """Pick the family with the worst projected cost at the target's scope.
+
+    ``timed_out_on`` is the (label, chars) input still being evaluated when
+    the run was stopped.
+    """
+    if timed_out_on is not None:
+        label, chars = timed_out_on
+        return Verdict(target, label, math.inf, math.inf, (chars, math.inf), timed_out=True)
+    worst = Verdict(target)
+    scope_chars = SCOPE_CHARS[target.scope]
+    for label, points in results.items():
+        exponent, projected = project(points, scope_chars)
+        if projected > worst.projected or not worst.label:
+            worst = Verdict(target, label, exponent, projected, points[-1])
+    return worst
+
+
+def stress(targets: list[Target], jobs: int, timeout: float, on_done: Callable[[Verdict, dict], None]) -> list[Verdict]:
+    """Stress every target, ``jobs`` child processes at a time."""
+    context = multiprocessing.get_context("fork")
+    pending = list(targets)
+    running: dict = {}  # connection -> [target, process, deadline, results, (label, chars) running]
+    verdicts = []
+
+    def finish(conn, timed_out: bool) -> None:
+        target, process, _, results, current = running.pop(conn)
+        if timed_out:
+            process.terminate()
+        process.join()
+        conn.close()
+        verdict = judge(target, results, current if timed_out else None)
+        verdicts.append(verdict)
+        on_done(verdict, results)
+
+    while pending or running:
+        while pending and len(running) < jobs:
+            target = pending.pop(0)
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(target=stress_worker, args=(target, sender), daemon=True)
+            process.start()
+            sender.close()
+            running[receiver] = [target, process, time.monotonic() + timeout, {}, None]
+
+        now = time.monotonic()
+        ready = wait(list(running), timeout=max(0.0, min(state[2] for state in running.values()) - now))
+        for conn in ready:
+            try:
+                message = conn.recv()
+            except EOFError:
+                finish(conn, timed_out=False)
+                continue
+            if message is None:
+                finish(conn, timed_out=False)
+                continue
+            label, chars, seconds = message
+            state = running[conn]
+            if seconds is None:
+                state[4] = (label, chars)
+            else:
+                state[3].setdefault(label, []).append((chars, seconds))
+        now = time.monotonic()
+        for conn in [conn for conn, state in running.items() if state[2] <= now]:
+            finish(conn, timed_out=True)
+    return verdicts
+
+
+def format_seconds(seconds: float) -> str:
+    if math.isinf(seconds):
+        return "never"
+    if seconds < 1:
+        return f"{seconds * 1000:.1f}ms"
+    if seconds < 120:
+        return f"{seconds:.1f}s"
+    if seconds < 7200:
+        return f"{seconds / 60:.0f}min"
+    return f"{seconds / 3600:.0f}h"
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Stress-test every configured regex for catastrophic backtracking")
+    parser.add_argument("--rules-file", type=Path, default=RULES_FILE,
+                        help="Rules file to check instead of governance_rules.json (e.g. a candidate rule)")
+    parser.add_argument("--only", metavar="TEXT",
+                        help="Only stress patterns whose name contains TEXT (e.g. ruleset:, instruction:)")
+    parser.add_argument("--budget", type=float, default=1.0,
+                        help="Most seconds one evaluation may cost at realistic size (default: 1.0)")
+    parser.add_argument("--timeout", type=float, default=20.0,
+                        help="Seconds before a pattern's stress run is stopped as catastrophic (default: 20)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Patterns stressed in parallel (default: CPU count)")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="Show every input family's growth, not just the worst")
+    args = parser.parse_args()
+
+    try:
+        targets = configured_patterns(args.rules_file)
+    except (OSError, ValueError) as e:
+        print(f"{RED}Error: {e}{RESET}")
+        return 1
+    if args.only:
+        targets = [target for target in targets if args.only in target.name]
+
+    print(f"{BOLD}Regex stress test: {len(targets)} patterns, budget {args.budget:g}s per evaluation{RESET}")
+    print(f"Realistic sizes: line {SCOPE_CHARS['line']} chars, head {SCOPE_CHARS['head']}, "
+          f"file {SCOPE_CHARS['file']}\n")
+
+    failed = []
+
+    def on_done(verdict: Verdict, results: dict) -> None:
+        target = verdict.target
+        if verdict.catastrophic or verdict.projected > args.budget:
+            failed.append(verdict)
+            icon = f"{RED}❌"
+        elif verdict.exponent >= POLYNOMIAL_EXPONENT:
+            icon = f"{YELLOW}⚠️ "
+        else:
+            icon = f"{GREEN}✅"
+        if verdict.timed_out:
+            growth = "hangs"
+        elif verdict.exponent < POLYNOMIAL_EXPONENT:
+            growth = "linear"
+        else:
+            growth = f"n^{verdict.exponent:.1f}"
+        cost = format_seconds(verdict.projected)
+        print(f"{icon} {target.name[:40]:40}{RESET} {target.scope:5} {growth:>7} {cost:>9} "
+              f"@ {SCOPE_CHARS[target.scope] // 1024} KiB", flush=True)
+        items = sre_parse.parse(target.pattern.pattern if isinstance(target.pattern.pattern, str)
+                                else target.pattern.pattern.decode("latin-1"))
+        if icon != f"{GREEN}✅" or args.verbose:
+            chars, seconds = verdict.measured
+            if verdict.timed_out:
+                print(f"     worst input: {verdict.label} (still running after {args.timeout:g}s at {chars} chars)")
+            else:
+                print(f"     worst input: {verdict.label} ({format_seconds(seconds)} at {chars} chars)")
+            if nested_quantifier(items):
+                print("     note: a repeating quantifier is nested inside another")
+        if args.verbose:
+            for label, points in results.items():
+                exponent, projected = project(points, SCOPE_CHARS[target.scope])
+                print(f"       n^{exponent:.1f} {format_seconds(projected):>9}  {label}")
+
+    verdicts = stress(targets, max(1, args.jobs), args.timeout, on_done)
+
+    print(f"\n{'=' * 60}")
+    if failed:
+        print(f"{RED}{len(failed)}/{len(verdicts)} patterns can exceed the budget or backtrack catastrophically:{RESET}")
+        for verdict in sorted(failed, key=lambda v: v.target.name):
+            print(f"  - {verdict.target.name}")
+        return 1
+    print(f"{GREEN}All {len(verdicts)} patterns stay within budget on adversarial inputs.{RESET}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
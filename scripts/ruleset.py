@@ -0,0 +1,237 @@
+"""
+Ruleset - Declarative governance rules compiled once into a shared matcher.
+
+The dangerous-command, hardcoded-path and secret rules used by
+warden_audit.py and validate_project.py live in governance_rules.json. Each
+rule has an id, a family, a regex, a severity per file context (code, test,
+markdown, other) and optional allowlists. load_ruleset() compiles the file
+once per process.
+
+Ruleset.scan() first checks each rule's required literal with a substring
+search (far cheaper in CPython than a combined regex alternation, which
+defeats the literal-prefix optimisation); only rules whose literal occurs are
+run as regexes for line numbers and allowlists. The combined alternation,
+Ruleset.pattern(), is what ripgrep/grep prefilters use.
+
+With enable_precise(), dangerous-family rules on .py files are answered by
+the AST tier (ast_scan.py) instead of regexes: only real calls are reported,
+not mentions in comments, docstrings or strings.
+
+    from ruleset import load_ruleset
+
+    for finding in load_ruleset().scan(path, content, families=("path",)):
+        print(finding.rule.id, finding.severity, finding.line)
+"""
+
+import atexit
+import bisect
+import json
+import re
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from ast_scan import PREFILTER, RM_WORD, AstCache, needs_parse
+from instrumentation import PROFILER, RULE_COSTS
+
+RULES_FILE = Path(__file__).with_name("governance_rules.json")
+RULESET_VERSION = 1
+
+SEVERITIES = ("P0", "P1", "P2", "P3")
+CONTEXTS = ("code", "test", "markdown", "other")
+CODE_SUFFIXES = (".py", ".sh", ".js", ".ts")
+NEWLINE = re.compile("\n")
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One compiled rule."""
+    id: str
+    family: str
+    label: str
+    message: str
+    regex: re.Pattern
+    severity: dict[str, str]
+    literal: str = ""
+    file_types: tuple[str, ...] = ()
+    allow_files: frozenset[str] = frozenset()
+    allow_line_contexts: frozenset[str] = frozenset()
+    allow_line_contains: tuple[str, ...] = ()
+
+    def allowed_line(self, context: str, line: str) -> bool:
+        """Whether an allowlisted marker on the line excuses a match."""
+        if context not in self.allow_line_contexts:
+            return False
+        line_lower = line.lower()
+        return any(marker in line_lower for marker in self.allow_line_contains)
+
+
+@dataclass(frozen=True)
+class Finding:
+    """A rule match: one per rule per line."""
+    rule: Rule
+    severity: str
+    line: int
+    text: str
+
+
+def file_context(path: Path) -> str:
+    """Context a file's severities are taken from: code, test, markdown or other."""
+    if path.suffix in CODE_SUFFIXES:
+        if 'test' in path.parts or path.name.startswith('test_'):
+            return "test"
+        return "code"
+    if path.suffix == ".md":
+        return "markdown"
+    return "other"
+
+
+class Ruleset:
+    """Compiled rules shared by every scanner in the process."""
+
+    def __init__(self, rules: list[Rule], skip_files: frozenset[str]):
+        self.rules = rules
+        self.skip_files = skip_files
+        self.precise: AstCache | None = None
+        # File names any rule treats specially (skipped or allowlisted)
+        self.special_names = skip_files.union(*(rule.allow_files for rule in rules))
+
+    def enable_precise(self, cache_path: Path | None = None) -> None:
+        """Use the AST tier for dangerous calls in .py files, caching results at cache_path."""
+        if self.precise is None:
+            self.precise = AstCache(cache_path)
+            atexit.register(self.precise.save)
+
+    def name_key(self, path: Path) -> str:
+        """The file name if any rule treats it specially, else ''.
+
+        Scan results depend on a path only through file_context(), the
+        suffix and this, so callers can memoise scan() per (context, suffix,
+        name_key, content).
+        """
+        name = path.name
+        return name if name in self.special_names else ""
+
+    def families(self) -> set[str]:
+        return {rule.family for rule in self.rules}
+
+    def applicable(self, path: Path, context: str, families=None) -> list[Rule]:
+        """Rules that apply to a file in a context, optionally limited to families."""
+        return [
+            rule for rule in self.rules
+            if context in rule.severity
+            and (families is None or rule.family in families)
+            and (not rule.file_types or path.suffix in rule.file_types)
+            and path.name not in rule.allow_files
+        ]
+
+    def pattern(self, rules: list[Rule] | None = None) -> str:
+        """Alternation of rule patterns, usable by Python, ripgrep and grep -E.
+
+        In precise mode the AST tier's prefilter (substrings and RM_WORD) is
+        included, so aliased calls reach it through external prefilters too.
+        """
+        patterns = [rule.regex.pattern for rule in (self.rules if rules is None else rules)]
+        if self.precise is not None:
+            patterns += [re.escape(needle) for needle in PREFILTER] + [RM_WORD.pattern]
+        return "|".join(f"({pattern})" for pattern in patterns)
+
+    def scan(self, path: Path, content: str, families=None, context: str | None = None) -> list[Finding]:
+        """Match every applicable rule against a file's content."""
+        if path.name in self.skip_files:
+            return []
+        context = context or file_context(path)
+        rules = self.applicable(path, context, families)
+        findings = []
+        line_starts = None
+
+        if self.precise is not None and path.suffix == ".py":
+            dangerous = {rule.id: rule for rule in rules if rule.family == "dangerous"}
+            calls = self.precise.calls(content) if dangerous and needs_parse(content) else []
+            if calls is not None:
+                # The AST answered for the dangerous family; regexes handle the rest
+                rules = [rule for rule in rules if rule.id not in dangerous]
+                if calls:
+                    lines = content.splitlines()
+                    for rule_id, line in calls:
+                        rule = dangerous.get(rule_id)
+                        if rule is not None:
+                            text = lines[line - 1] if line <= len(lines) else ""
+                            findings.append(Finding(rule, rule.severity[context], line, text))
+
+        rules = [rule for rule in rules if rule.literal in content]
+        costs = RULE_COSTS.enabled
+        for rule in rules:
+            PROFILER.count("regex_evals")
+            if costs:
+                started, matches, matched = time.perf_counter(), 0, 0
+            seen_lines = set()
+            for match in rule.regex.finditer(content):
+                if costs:
+                    matches += 1
+                    matched += match.end() - match.start()
+                if line_starts is None:
+                    line_starts = [0] + [m.end() for m in NEWLINE.finditer(content)]
+                # The literal's line: a leading boundary class may have matched the newline before it
+                position = content.find(rule.literal, match.start(), match.end()) if rule.literal else match.start()
+                line = bisect.bisect_right(line_starts, position)
+                if line in seen_lines:
+                    continue
+                seen_lines.add(line)
+                start = line_starts[line - 1]
+                end = content.find("\n", start)
+                text = content[start:end if end != -1 else len(content)]
+                if rule.allowed_line(context, text):
+                    continue
+                findings.append(Finding(rule, rule.severity[context], line, text))
+            if costs:
+                RULE_COSTS.record(rule.id, time.perf_counter() - started, len(content), matches, matched)
+        return findings
+
+
+def compile_rule(spec: dict) -> Rule:
+    """Compile one rule spec from the rules file, validating its fields."""
+    rule_id = spec.get("id", "?")
+    for key in ("id", "family", "pattern", "severity"):
+        if key not in spec:
+            raise ValueError(f"Rule {rule_id}: missing '{key}'")
+    for context, severity in spec["severity"].items():
+        if context not in CONTEXTS:
+            raise ValueError(f"Rule {rule_id}: unknown context '{context}' (expected one of {', '.join(CONTEXTS)})")
+        if severity not in SEVERITIES:
+            raise ValueError(f"Rule {rule_id}: unknown severity '{severity}' (expected one of {', '.join(SEVERITIES)})")
+    try:
+        regex = re.compile(spec["pattern"])
+    except re.error as e:
+        raise ValueError(f"Rule {rule_id}: invalid pattern: {e}") from e
+
+    allow = spec.get("allow", {})
+    return Rule(
+        id=spec["id"],
+        family=spec["family"],
+        label=spec.get("label", spec["id"]),
+        message=spec.get("message", spec["id"]),
+        regex=regex,
+        severity=dict(spec["severity"]),
+        literal=spec.get("literal", ""),
+        file_types=tuple(spec.get("file_types", ())),
+        allow_files=frozenset(allow.get("files", ())),
+        allow_line_contexts=frozenset(allow.get("line_contexts", ())),
+        allow_line_contains=tuple(marker.lower() for marker in allow.get("line_contains", ())),
+    )
+
+
+@lru_cache(maxsize=None)
+def load_ruleset(path: Path = RULES_FILE) -> Ruleset:
+    """Load and compile a rules file (once per process per path)."""
+    data = json.loads(Path(path).read_text())
+    if data.get("version") != RULESET_VERSION:
+        raise ValueError(f"{path}: unsupported ruleset version {data.get('version')!r}")
+
+    rules = [compile_rule(spec) for spec in data.get("rules", [])]
+    ids = [rule.id for rule in rules]
+    duplicates = sorted({rule_id for rule_id in ids if ids.count(rule_id) > 1})
+    if duplicates:
+        raise ValueError(f"{path}: duplicate rule ids: {', '.join(duplicates)}")
+    return Ruleset(rules, frozenset(data.get("skip_files", ())))
@@ -0,0 +1,320 @@
+"""
+Secret Scan - High-entropy values assigned to secret-looking names.
+
+The provider signatures in governance_rules.json (OpenAI, Google, AWS,
+GitHub, Slack, Stripe, JWTs, private key blocks) catch keys whose shape is
+known. Everything else is a random-looking string assigned to something
+named like a credential:
+
+    api_key = "<24 random base62 characters>"
+    "client_secret": "<32 random hex digits>"
+
+Candidates are found in one regex pass over whole names: a name starts
+only where no name character precedes it, must hold one of the NAME_HINT
+letters every credential word has, and is consumed atomically, so the scan
+runs at C speed and never re-enters a name it has rejected. Only names
+followed by ':' or '=' and at least MIN_VALUE_LENGTH value characters are
+matched. Each matched name is then checked for a credential word (key,
+token, secret, password, auth, credential...) that counts only as a whole
+segment of the name, bounded by the name's ends, '_', '-', '.', digits or
+a camelCase hump, so api_key, apiKey and AUTH_TOKEN qualify but monkey,
+author, keyframes and OAuth do not.
+
+Only literal values are measured. A quoted value always is; an unquoted
+one only if it cannot be an identifier (it starts with a digit or holds
+'+', '/', '=' or '-') or follows a bare '=' with no spaces, as in .env and
+shell files. "key = someVariableName42" is code referring to a variable,
+not a secret. A name assigned inside another value (key=token=...) ends
+where the outer value does, so each value is scanned once: a long run
+like key_key_key... or key=key=key... costs linear time, not quadratic. Each value's Shannon entropy is measured over a
+sliding window: the character counts and the sum of c*log2(c) are updated
+as characters enter and leave the window, so a value costs time linear in
+its length however long it is.
+
+A value is reported when it looks random:
+
+- hex values (0-9, a-f) of at least HEX_MIN_LENGTH characters with at
+  least HEX_MIN_ENTROPY bits per character,
+- other values of at least MIN_LENGTH characters that mix upper case, lower
+  case and digits, with entropy at least ENTROPY_RATIO of the maximum the
+  window allows.
+
+Placeholders ("your-api-key-here"), constant names and paths fail these
+tests.
+
+    from secret_scan import iter_entropy_secrets
+
+    for offset, value, entropy in iter_entropy_secrets(content):
+        ...
+"""
+
+import math
+import re
+import string
+from collections import deque
+from typing import Iterator
+
+# Name segments that make a name secret-looking: api_key, AUTH_TOKEN, clientSecret, password...
+CREDENTIAL_WORDS = (
+    "key", "keys", "apikey", "token", "tokens", "secret", "secrets",
+    "password", "passwd", "passphrase", "pwd", "auth", "credential", "credentials",
+)
+NAME_CHAR = r"[\w.-]"
+# The rest of a name after a credential word (api_key_prod, auth.token...)
+NAME_TAIL = re.compile(NAME_CHAR + "*")
+# What follows the name in an assignment: closing quote, operator, opening quote.
+# ":" only when no "=" follows, so ":=" cannot be re-read as ":" before a value "=..."
+OPERATOR = re.compile(r"['\"]?(?P<space_before>[ \t]*)(?P<op>:=|=>|:(?!=)|=)(?P<space_after>[ \t]*)(?P<quote>[\"'`]?)")
+# The assigned value: base64/hex characters
+VALUE = re.compile(r"[A-Za-z0-9+/=_-]*")
+MIN_VALUE_LENGTH = 16
+# Every credential word holds one of these letters (tests check it)
+NAME_HINT = "ktp"
+# A whole name, then an operator and a value long enough to test. The name
+# only matches from its first character (no name character before it) and
+# the rest is read once (the lookahead and backreference keep it from
+# backtracking), so names never overlap and one scan skips everything else
+# in linear time without leaving C; leading with a character class lets the
+# engine skip non-name text fast. A name needs a NAME_HINT letter; whether
+# it holds a credential word as a segment is checked after, once per name.
+_HINT = f"[{NAME_HINT}{NAME_HINT.upper()}]"
+ASSIGNMENT = re.compile(
+    f"{NAME_CHAR}(?<!{NAME_CHAR}{NAME_CHAR})(?:(?<={_HINT})|(?={NAME_CHAR}*?{_HINT}))"
+    + f"(?=(?P<tail>{NAME_CHAR}*))(?P=tail)" + OPERATOR.pattern
+    + f"(?={VALUE.pattern[:-1]}{{{MIN_VALUE_LENGTH}}})"
+)
+# Lower-cases ASCII only, so offsets never shift (credential words are ASCII)
+ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+HEX_VALUE = re.compile(r"[0-9a-fA-F]+")
+# A non-hex value must mix all three kinds
+CHARACTER_KINDS = (string.digits, string.ascii_uppercase, string.ascii_lowercase)
+KIND_PATTERNS = tuple(re.compile(f"[{kind}]") for kind in CHARACTER_KINDS)
+NON_HEX = "".join(sorted(set(string.ascii_letters + "+/=_-") - set(string.hexdigits)))
+# Value characters no identifier holds
+NON_IDENTIFIER = "+/=-"
+
+ENTROPY_WINDOW = 32
+MIN_LENGTH = 20
+ENTROPY_RATIO = 0.8
+HEX_MIN_LENGTH = 32
+HEX_MIN_ENTROPY = 3.0
+# Secrets are short: only a value's head is measured, so a huge blob costs no more
+ENTROPY_SCAN_CHARS = 4096
+# No value passes with fewer bits than this
+LOWEST_FLOOR = min(HEX_MIN_ENTROPY, ENTROPY_RATIO * math.log2(MIN_LENGTH))
+
+# c * log2(c) for every count a window can hold
+_CLOG = [0.0] + [c * math.log2(c) for c in range(1, ENTROPY_WINDOW + 1)]
+
+
+def _window_totals(value: str, size: int) -> Iterator[float]:
+    """sum(c * log2(c)) over the character counts of each ``size`` window, left to right.
+
+    Each total is updated in O(1) as one character enters and one leaves.
+    """
+    counts: dict[str, int] = {}
+    total = 0.0
+    for char in value[:size]:
+        count = counts.get(char, 0)
+        counts[char] = count + 1
+        total += _CLOG[count + 1] - _CLOG[count]
+    yield total
+    for i in range(size, len(value)):
+        # Leave first, so no count ever exceeds the window
+        char = value[i - size]
+        count = counts[char]
+        counts[char] = count - 1
+        total += _CLOG[count - 1] - _CLOG[count]
+        char = value[i]
+        count = counts.get(char, 0)
+        counts[char] = count + 1
+        total += _CLOG[count + 1] - _CLOG[count]
+        yield total
+
+
+def window_entropy(value: str, window: int = ENTROPY_WINDOW) -> float:
+    """Highest Shannon entropy, in bits per character, of any window of ``value``.
+
+    Values no longer than the window are measured whole. Entropy is
+    log2(n) - sum(c * log2(c)) / n over the window's character counts c.
+    """
+    size = min(len(value), window)
+    if size == 0:
+        return 0.0
+    return math.log2(size) - min(_window_totals(value, size)) / size
+
+
+def _plausible(length: int, is_hex: bool, mixed: bool) -> bool:
+    """The length and character-mix tests, which need no entropy."""
+    if is_hex:
+        return length >= HEX_MIN_LENGTH
+    return length >= MIN_LENGTH and mixed
+
+
+def _entropy_floor(length: int, is_hex: bool) -> float:
+    if is_hex:
+        return HEX_MIN_ENTROPY
+    return ENTROPY_RATIO * math.log2(min(length, ENTROPY_WINDOW))
+
+
+def looks_random(value: str) -> float | None:
+    """The value's window entropy if it passes the randomness tests, else None."""
+    is_hex = HEX_VALUE.fullmatch(value) is not None
+    mixed = not is_hex and all(kind.search(value) for kind in KIND_PATTERNS)
+    if not _plausible(len(value), is_hex, mixed):
+        return None
+    floor = _entropy_floor(len(value), is_hex)
+    head = value[:ENTROPY_SCAN_CHARS]
+    # No window holds more distinct characters than the head
+    if math.log2(len(set(head))) < floor:
+        return None
+    entropy = window_entropy(head)
+    return entropy if entropy >= floor else None
+
+
+def _last_of(run: str, chars: str) -> int:
+    """Index of the last character of ``run`` in ``chars``, or -1."""
+    return max(run.rfind(char) for char in chars)
+
+
+def random_suffixes(run: str, starts: list[int]) -> Iterator[tuple[int, float]]:
+    """(start, entropy) for each value ``run[start:]`` that looks random, in order.
+
+    Values assigned inside another value (key=token=...) end where it ends,
+    so they are suffixes of one run. Answering them one by one with
+    looks_random() would re-measure the run per start, quadratic in the run;
+    here one pass gives every window's entropy, a sliding maximum answers
+    each value's head, and the character tests come from the last index of
+    each character kind.
+    """
+    n = len(run)
+    if math.log2(len(set(run))) < LOWEST_FLOOR:
+        return
+    last_kinds = min(_last_of(run, kind) for kind in CHARACTER_KINDS)
+    last_non_hex = _last_of(run, NON_HEX)
+    measured = min(n, starts[-1] + ENTROPY_SCAN_CHARS)
+    entropies = []
+    if measured >= ENTROPY_WINDOW:
+        # entropies[i]: entropy of the window starting at i
+        entropies = [math.log2(ENTROPY_WINDOW) - total / ENTROPY_WINDOW
+                     for total in _window_totals(run[:measured], ENTROPY_WINDOW)]
+    best: deque[int] = deque()  # window starts in range, entropies decreasing
+    added = 0
+
+    for start in starts:
+        length = n - start
+        is_hex = start > last_non_hex
+        mixed = not is_hex and last_kinds >= start
+        if not _plausible(length, is_hex, mixed):
+            continue
+        if length < ENTROPY_WINDOW:
+            entropy = window_entropy(run[start:])
+        else:
+            # Windows of this value's head start in [start, last]
+            last = min(start + ENTROPY_SCAN_CHARS, n) - ENTROPY_WINDOW
+            while added <= last:
+                while best and entropies[best[-1]] <= entropies[added]:
+                    best.pop()
+                best.append(added)
+                added += 1
+            while best[0] < start:
+                best.popleft()
+            entropy = entropies[best[0]]
+        if entropy >= _entropy_floor(length, is_hex):
+            yield start, entropy
+
+
+def is_segment(content: str, start: int, end: int) -> bool:
+    """Whether content[start:end] is a whole segment of the name around it.
+
+    A segment starts at the name's start, after a non-alphanumeric character
+    or at a camelCase hump (an upper-case letter after a lower-case letter
+    or digit), and ends at the name's end, before a non-letter or before a
+    hump.
+    """
+    if start > 0:
+        before = content[start - 1]
+        if before.isalnum() and not (content[start].isupper() and (before.islower() or before.isdigit())):
+            return False
+    if end < len(content):
+        after = content[end]
+        if after.isalpha() and not (after.isupper() and content[end - 1].islower()):
+            return False
+    return True
+
+
+def is_literal(assignment: re.Match, last_non_identifier: int, content: str) -> bool:
+    """Whether the value after an ASSIGNMENT match is a literal rather than an identifier.
+
+    ``last_non_identifier`` is the index of the value run's last
+    NON_IDENTIFIER character, or -1.
+    """
+    if assignment["quote"]:
+        return True
+    value_start = assignment.end()
+    if content[value_start].isdigit() or last_non_identifier >= value_start:
+        return True
+    # NAME=value, as in .env and shell files
+    return assignment["op"] == "=" and not assignment["space_before"] and not assignment["space_after"]
+
+
+def is_credential_name(name: str) -> bool:
+    """Whether a whole name has a credential word as one of its segments."""
+    lower = name.translate(ASCII_LOWER)
+    for word in CREDENTIAL_WORDS:
+        found = lower.find(word)
+        while found != -1:
+            if is_segment(name, found, found + len(word)):
+                return True
+            found = lower.find(word, found + 1)
+    return False
+
+
+def assignment_values(content: str) -> dict[int, int]:
+    """Literal values assigned to credential-named targets: offset -> end offset."""
+    values = {}
+    credential_names: dict[str, bool] = {}  # Names repeat; the answer depends on the name alone
+    # The last value scanned: a value starting anywhere inside it ends where it does
+    run_start = run_end = 0
+    last_non_identifier = -1
+    for match in ASSIGNMENT.finditer(content):
+        name = content[match.start():match.end("tail")]
+        credential = credential_names.get(name)
+        if credential is None:
+            credential = credential_names[name] = is_credential_name(name)
+        if not credential:
+            continue
+        value_start = match.end()
+        if run_start <= value_start < run_end:
+            # Assigned inside a value (key=token=...): no quote or space fits
+            # in a value, so this is NAME=value, a literal
+            values[value_start] = run_end
+            continue
+        run_start, run_end = value_start, VALUE.match(content, value_start).end()
+        last = _last_of(content[run_start:run_end], NON_IDENTIFIER)
+        last_non_identifier = run_start + last if last != -1 else -1
+        if is_literal(match, last_non_identifier, content):
+            values[value_start] = run_end
+    return values
+
+
+def iter_entropy_secrets(content: str) -> Iterator[tuple[int, str, float]]:
+    """Yield (offset, value, entropy) for each random-looking secret assignment, in order.
+
+    Values longer than ENTROPY_SCAN_CHARS are yielded as that long head.
+    """
+    # Values sharing an end are suffixes of one run, measured together. Runs
+    # do not overlap, so run by run, start by start, is offset order.
+    runs: dict[int, list[int]] = {}
+    for offset, end in sorted(assignment_values(content).items()):
+        runs.setdefault(end, []).append(offset)
+    for end, offsets in runs.items():
+        if len(offsets) == 1:
+            entropy = looks_random(content[offsets[0]:end])
+            if entropy is not None:
+                yield offsets[0], content[offsets[0]:min(end, offsets[0] + ENTROPY_SCAN_CHARS)], entropy
+            continue
+        run_start = offsets[0]
+        for start, entropy in random_suffixes(content[run_start:end], [o - run_start for o in offsets]):
+            offset = run_start + start
+            yield offset, content[offset:min(end, offset + ENTROPY_SCAN_CHARS)], entropy
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Skill Manifest - Compiled index of the skills library.
+
+Indexes the four parallel trees of the library in one JSON manifest:
+- claude-skills/<name>/SKILL.md
+- cursor-rules/<name>/RULE.md
+- antigravity-rules/<name>/RULE.md
+- playbooks/<name>/README.md
+
+Each entry records the path, content hash, frontmatter fields, name,
+description, title and **Follow:** target. Rebuilds are incremental: files
+whose size and mtime are unchanged are not re-read, and files whose content
+hash is unchanged are not re-parsed.
+
+Usage:
+    python scripts/skill_manifest.py            # Build or refresh the manifest
+    python scripts/skill_manifest.py --rebuild  # Rebuild from scratch
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+from instrumentation import PROFILER
+
+# ANSI colors
+GREEN = "\033[92m"
+RED = "\033[91m"
+RESET = "\033[0m"
+BOLD = "\033[1m"
+
+MANIFEST_NAME = ".skills-manifest.json"
+MANIFEST_VERSION = 2
+
+# Library tree -> entry file inside each <name>/ directory
+TREES = {
+    "claude-skills": "SKILL.md",
+    "cursor-rules": "RULE.md",
+    "antigravity-rules": "RULE.md",
+    "playbooks": "README.md",
+}
+
+FOLLOW_PATTERN = re.compile(r"\*\*(?:Follow|Canonical playbook):\*\*\s*`?([^`\s]+)`?")
+TITLE_PATTERN = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+# Lines after the frontmatter searched for the title and **Follow:** target
+HEAD_LINES = 40
+HASH_CHUNK = 1 << 16  # Bytes hashed per read
+
+
+def read_frontmatter(lines) -> tuple[dict[str, str] | None, list[str]]:
+    """Parse YAML frontmatter from an iterator of lines.
+
+    Consumes lines only up to the closing '---', so the body of a file
+    opened for reading is never loaded.
+    """
+    errors = []
+
+    # Check for frontmatter delimiters
+    first = next(lines, '')
+    if not first.startswith('---'):
+        errors.append("Missing YAML frontmatter (must start with '---')")
+        return None, errors
+
+    # Collect up to the closing delimiter
+    frontmatter_lines = []
+    opener = first[3:].strip()
+    if opener:
+        frontmatter_lines.append(opener)
+    for line in lines:
+        if line.strip() == '---':
+            break
+        frontmatter_lines.append(line)
+    else:
+        errors.append("Invalid YAML frontmatter (missing closing '---')")
+        return None, errors
+
+    if not any(line.strip() for line in frontmatter_lines):
+        errors.append("Empty YAML frontmatter")
+        return None, errors
+
+    # Parse simple YAML (key: value pairs)
+    frontmatter = {}
+    for line in frontmatter_lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        if ':' in line:
+            key, value = line.split(':', 1)
+            frontmatter[key.strip()] = value.strip()
+
+    return frontmatter, errors
+
+
+def parse_frontmatter(content: str) -> tuple[dict[str, str] | None, list[str]]:
+    """Parse YAML frontmatter from SKILL.md content."""
+    return read_frontmatter(iter(content.splitlines()))
+
+
+def build_entry(file_path: Path, library_root: Path, previous: dict | None = None) -> dict:
+    """Index one entry file, reusing ``previous`` when the file is unchanged."""
+    stat = file_path.stat()
+    PROFILER.count("files_visited")
+    if previous and previous.get("mtime_ns") == stat.st_mtime_ns and previous.get("size") == stat.st_size:
+        PROFILER.skip("unchanged")
+        return previous
+
+    PROFILER.count("files_read")
+    PROFILER.count("bytes_read", stat.st_size)
+    digest = hashlib.sha256()
+    with file_path.open('rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    sha256 = digest.hexdigest()
+    if previous and previous.get("sha256") == sha256:
+        # Touched but not modified: refresh stat only
+        return {**previous, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+    # Frontmatter, title and **Follow:** all live in the head of the file
+    with file_path.open('r', encoding='utf-8', errors='ignore') as f:
+        lines = (line.rstrip('\n') for line in f)
+        frontmatter, errors = read_frontmatter(lines)
+        if frontmatter is None:
+            f.seek(0)
+        head = ''.join(islice(f, HEAD_LINES))
+    follow = FOLLOW_PATTERN.search(head)
+    title = TITLE_PATTERN.search(head)
+
+    return {
+        "name": (frontmatter or {}).get("name"),
+        "description": (frontmatter or {}).get("description"),
+        "title": title.group(1).strip() if title else None,
+        "path": file_path.relative_to(library_root).as_posix(),
+        "sha256": sha256,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "frontmatter": frontmatter,
+        "frontmatter_errors": errors,
+        "follow": follow.group(1) if follow else None,
+    }
+
+
+def index_tree(
+    tree_dir: Path,
+    filename: str,
+    library_root: Path,
+    previous: dict | None = None,
+    jobs: int = 1,
+) -> dict[str, dict]:
+    """Index every <name>/<filename> in one tree.
+
+    Directories without the entry file get ``{"path": None}`` so callers can
+    report them as missing. With ``jobs`` > 1, changed files are read on a
+    thread pool.
+    """
+    previous = previous or {}
+
+    if not tree_dir.is_dir():
+        return {}
+
+    # Skip hidden directories; templates are indexed but flagged by callers
+    names = sorted(item.name for item in tree_dir.iterdir() if item.is_dir() and not item.name.startswith('.'))
+
+    def index_one(name: str) -> dict:
+        entry_file = tree_dir / name / filename
+        if not entry_file.exists():
+            return {"path": None}
+        return build_entry(entry_file, library_root, previous.get(name))
+
+    if jobs > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            return dict(zip(names, pool.map(index_one, names)))
+    return {name: index_one(name) for name in names}
+
+
+def build_manifest(library_root: Path, previous: dict | None = None, jobs: int = 1) -> dict:
+    """Build the manifest for all TREES, reusing unchanged entries from ``previous``."""
+    previous_trees = (previous or {}).get("trees", {})
+    return {
+        "version": MANIFEST_VERSION,
+        "trees": {
+            tree: index_tree(library_root / tree, filename, library_root, previous_trees.get(tree), jobs)
+            for tree, filename in TREES.items()
+        },
+    }
+
+
+def load_manifest(library_root: Path, rebuild: bool = False, save: bool = True, jobs: int = 1) -> dict:
+    """Load the manifest, refreshing stale entries and saving it if anything changed."""
+    manifest_path = library_root / MANIFEST_NAME
+    previous = None
+
+    if not rebuild and manifest_path.exists():
+        try:
+            previous = json.loads(manifest_path.read_text())
+        except (OSError, ValueError):
+            previous = None
+        if previous and previous.get("version") != MANIFEST_VERSION:
+            previous = None
+
+    manifest = build_manifest(library_root, previous, jobs)
+
+    if save and manifest != previous:
+        write_json_atomic(manifest_path, manifest)
+
+    return manifest
+
+
+def write_json_atomic(path: Path, data) -> None:
+    """Write JSON via a temp file so a concurrent reader never sees a partial file."""
+    try:
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=1, sort_keys=True))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Read-only checkout: the in-memory data is still valid
+
+
+def skill_names(manifest: dict) -> list[str]:
+    """All skill names present in any tree, excluding templates."""
+    names = set()
+    for entries in manifest["trees"].values():
+        names.update(name for name, entry in entries.items() if entry["path"] and not name.startswith('_'))
+    return sorted(names)
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build the skills-library manifest")
+    parser.add_argument(
+        '--library-root',
+        type=Path,
+        default=Path(__file__).parent.parent,
+        help="Skills library root (default: this repository)"
+    )
+    parser.add_argument(
+        '--rebuild',
+        action='store_true',
+        help="Ignore the existing manifest and re-index every file"
+    )
+    args = parser.parse_args()
+
+    if not args.library_root.is_dir():
+        print(f"{RED}Error: Library root not found: {args.library_root}{RESET}")
+        return 1
+
+    manifest = load_manifest(args.library_root, rebuild=args.rebuild)
+
+    print(f"\n{BOLD}Skills Manifest{RESET} ({args.library_root / MANIFEST_NAME})")
+    for tree, entries in manifest["trees"].items():
+        indexed = sum(1 for e in entries.values() if e["path"])
+        print(f"  {tree:20} {GREEN}{indexed} indexed{RESET}")
+    print(f"  {'skills':20} {len(skill_names(manifest))} distinct names")
+    print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
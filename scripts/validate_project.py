@@ -6,6 +6,9 @@ Usage:
     ./scripts/validate_project.py [project_name]      # Check specific project
     ./scripts/validate_project.py --all               # Check all projects
     ./scripts/validate_project.py --missing           # List projects without indexes
+    ./scripts/validate_project.py --all --profile     # Report per-phase timing at exit
+    ./scripts/validate_project.py --all --trace t.json  # Chrome/Perfetto trace events
+    ./scripts/validate_project.py --all --archives    # Also scan inside zip/tar archives
 
 This script enforces:
 - Critical Rule #0: Every project must have an index file
@@ -16,12 +19,22 @@ This script enforces:
 
 import sys
 import os
+import time
 from pathlib import Path
 from typing import List, Tuple
 import re
 from scaffold.utils import safe_slug
 from scaffold.alerts import send_discord_alert
 from scaffold.constants import PROTECTED_PROJECTS
+from instrumentation import MEMPROFILER, METRICS, PROFILER, RULE_COSTS, TRACER, pop_memprofile_flag, pop_option, pop_profile_flag
+from archive_scan import ARCHIVES, is_archive, member_path
+from ast_scan import AST_CACHE
+from content_sniff import SNIFFER
+from dedup import DEDUP, FileSource, walk_tree
+from index_catalog import CATALOG
+from records import Defect
+from ruleset import file_context, load_ruleset
+from secret_scan import iter_entropy_secrets
 
 # Configuration
 PROJECTS_ROOT_ENV = os.getenv("PROJECTS_ROOT")
@@ -32,6 +45,8 @@ else:
     PROJECTS_ROOT = Path(PROJECTS_ROOT_ENV).resolve()
 
 REQUIRED_INDEX_PATTERN = r"00_Index_.+\.md"
+# Ruleset families checked by the DNA scan (governance_rules.json)
+DNA_FAMILIES = ("path", "secret")
 SKIP_DIRS = PROTECTED_PROJECTS
 
 # Mandatory files and directories
@@ -50,14 +65,25 @@ MANDATORY_DIRS = [
 
 # YAML frontmatter requirements
 REQUIRED_TAGS = ["map/project", "p/"]  # p/ is a prefix that must exist
-# Regex patterns for required sections (allows for emojis and slight variations)
+# Regex patterns for required sections (allows for emojis and slight variations).
+# One \s, not \s+: .* takes any further spaces, and \s+.* backtracks
+# quadratically on a long heading line (scripts/regex_stress.py)
 REQUIRED_SECTION_PATTERNS = [
     (re.compile(r"^#\s+", re.MULTILINE), "H1 Title"),
-    (re.compile(r"^##\s+.*(Key Components|Project Overview)", re.MULTILINE | re.IGNORECASE), "## Key Components"),
-    (re.compile(r"^##\s+.*Status", re.MULTILINE | re.IGNORECASE), "## Status"),
+    (re.compile(r"^##\s.*(Key Components|Project Overview)", re.MULTILINE | re.IGNORECASE), "## Key Components"),
+    (re.compile(r"^##\s.*Status", re.MULTILINE | re.IGNORECASE), "## Status"),
 ]
 
 
+# Per-file defects from the scans, kept as records.Defect and formatted when reported
+ABSOLUTE_PATH_DEFECT = "DNA Defect: Absolute path found in {path}:{line}"
+SECRET_DEFECT = "Security Defect: Potential secret found in {path}"
+SAFETY_DEFECT = "Safety Defect: {reason} in {path}"
+PLACEHOLDER_DEFECT = "Placeholder Defect: {reason} found in {path}:{line} - {detail}"
+UNREADABLE_FILE_DEFECT = "Scan Defect: Could not read file {path}: {detail}"
+UNREADABLE_ARCHIVE_DEFECT = "Scan Defect: Could not read archive {path}: {detail}"
+
+
 class ValidationError(Exception):
     """Raised when project fails validation."""
     pass
@@ -85,145 +111,167 @@ def has_index_file(project_path: Path) -> Tuple[bool, Path | None]:
 def validate_index_content(index_path: Path) -> List[str]:
     """Validate index file content. Returns list of errors."""
     errors = []
-    content = index_path.read_text()
+    record = CATALOG.get(index_path)
+    if record.decode_error is not None:
+        raise record.decode_error
     
     # Check for YAML frontmatter
-    if not content.startswith("---"):
+    if not record.has_frontmatter:
         errors.append("Missing YAML frontmatter (must start with '---')")
         return errors  # Can't continue without frontmatter
     
-    # Extract frontmatter
-    try:
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            errors.append("Invalid YAML frontmatter (must have closing '---')")
-            return errors
-        
-        frontmatter = parts[1]
-        body = parts[2]
-    except Exception as e:
-        errors.append(f"Failed to parse frontmatter: {e}")
+    if record.frontmatter is None:
+        errors.append("Invalid YAML frontmatter (must have closing '---')")
         return errors
     
     # Check required tags
     for required_tag in REQUIRED_TAGS:
-        if required_tag not in frontmatter:
+        if required_tag not in record.frontmatter:
             errors.append(f"Missing required tag: {required_tag}")
     
     # Check required sections
+    headings = "\n".join(line for _, line in record.headings)
     for pattern, section_name in REQUIRED_SECTION_PATTERNS:
-        if not pattern.search(body):
+        if not RULE_COSTS.searcher(f"section:{section_name}", pattern)(headings):
             errors.append(f"Missing required section: {section_name}")
     
     # Check for 3-sentence summary (heuristic: body should have substance before first ##)
-    if "## Key Components" in body:
-        summary_section = body.split("## Key Components")[0]
+    if record.summary_lines is not None:
         # Should have H1 title and some content
-        if summary_section.count("\n") < 5:
+        if record.summary_lines < 5:
             errors.append("Summary section appears too short (need 3-sentence description)")
     
     return errors
 
 
-def is_documentation_example(line: str) -> bool:
-    """Check if the path mention is a documentation example, not actual usage."""
-    doc_indicators = ['never', 'don\'t', 'avoid', 'example', 'e.g.', 'such as', 'like ']
-    line_lower = line.lower()
-    
-    # Check for doc indicators
-    if any(indicator in line_lower for indicator in doc_indicators):
-        return True
-        
-    # Check for quotes or backticks (common in documentation)
-    if ('"' in line and '/Users/' in line) or ("'" in line and '/Users/' in line) or ('`' in line and '/Users/' in line):
-        return True
-        
-    return False
+# Directories, suffixes and files the DNA scan leaves alone
+DNA_EXCLUDE_DIRS = {
+    ".git", "venv", ".venv", "__pycache__", "node_modules", "data",
+    "library", ".mypy_cache", ".pytest_cache", ".ruff_cache",
+    "htmlcov", ".tox", ".nox", ".cache", "logs", "recovered", "cursor_history",
+    "entries", "insights"
+}
+DNA_SKIP_SUFFIXES = (".png", ".jpg", ".jpeg", ".pyc", ".db", ".zip", ".tar.gz", ".bak", ".xml", ".log", ".pdf", ".json", ".csv")
+DNA_SKIP_FILES = {".env", ".env.example", "full_repo_context.txt", "billing.error.log", "repomix-output.xml", "pandoc"}
 
 
-def validate_dna_integrity(project_path: Path) -> List[str]:
+def validate_dna_integrity(project_path: Path) -> List[Defect]:
     """Scan project for absolute paths and secrets. Returns list of errors."""
     errors = []
     
-    # Patterns to catch absolute paths (using character class to avoid self-detection)
-    path_pattern = re.compile(r"/[U]sers/[a-zA-Z0-9._-]+")
-    # Patterns to catch common secrets (sk-, AIza, etc.)
-    secret_pattern = re.compile(r"(sk-[a-zA-Z0-9]{32,}|AIza[a-zA-Z0-9_-]{35})")
-    
-    # Files to exclude from scan
-    exclude_dirs = {
-        ".git", "venv", ".venv", "__pycache__", "node_modules", "data",
-        "library", ".mypy_cache", ".pytest_cache", ".ruff_cache",
-        "htmlcov", ".tox", ".nox", ".cache", "logs", "recovered", "cursor_history",
-        "entries", "insights"
-    }
-    
-    for root, dirs, files in os.walk(project_path):
+    for root, dirs, files in walk_tree(project_path):
         # Filter directories in-place
-        dirs[:] = [d for d in dirs if d not in exclude_dirs and not d.startswith(".")]
+        dirs[:] = [d for d in dirs if d not in DNA_EXCLUDE_DIRS and not d.startswith(".")]
         
         for file in files:
-            # Skip binary files, known safe files, generated files, and env files
-            if file.endswith((".png", ".jpg", ".jpeg", ".pyc", ".db", ".zip", ".tar.gz", ".bak", ".xml", ".log", ".pdf", ".json", ".csv")) or \
-               file in {".env", ".env.example", "full_repo_context.txt", "billing.error.log", "repomix-output.xml", "pandoc"}:
-                continue
-                
-            file_path = Path(root) / file
-            try:
-                content = file_path.read_text(encoding='utf-8', errors='ignore')
-                
-                # Check for absolute paths
-                if path_pattern.search(content):
-                    # Skip common intentional paths if any (e.g. journal protocol uses absolute paths)
-                    journal_path_str = str(PROJECTS_ROOT / "ai-journal" / "entries")
-                    
-                    # Process line by line for better context filtering
-                    lines = content.splitlines()
-                    for i, line in enumerate(lines):
-                        if path_pattern.search(line):
-                            if journal_path_str in line:
-                                continue
-                            # Skip AGENTS.md absolute paths (they are ecosystem-wide)
-                            if file == "AGENTS.md":
-                                continue
-                            
-                            # NEW: Skip documentation examples
-                            if is_documentation_example(line):
-                                continue
-                                
-                            errors.append(f"DNA Defect: Absolute path found in {file_path.relative_to(project_path)}:{i+1}")
-                
-                # Check for secrets
-                if secret_pattern.search(content):
-                    errors.append(f"Security Defect: Potential secret found in {file_path.relative_to(project_path)}")
-                    
-            except Exception as e:
-                # We log but don't fail the whole scan for one unreadable file
-                errors.append(f"Scan Defect: Could not read file {file_path.relative_to(project_path)}: {e}")
+            PROFILER.count("files_visited")
+            errors.extend(check_file_dna(Path(root), file, project_path))
                 
     return errors
 
 
-def validate_project(project_path: Path, verbose: bool = True) -> bool:
-    """
-    Validate a single project against the Master Compliance Checklist.
+def check_file_dna(root: Path, file: str, project_path: Path, source: FileSource | None = None) -> List[Defect]:
+    """DNA checks for one file found by the walk, skips and read errors included."""
+    # Archives are opened only in archive mode (--archives)
+    if ARCHIVES.enabled and is_archive(file):
+        file_path = root / file
+        try:
+            with TRACER.file_span(file_path, cat="dna"):
+                return scan_archive_dna(file_path, project_path)
+        except Exception as e:
+            return [Defect(UNREADABLE_ARCHIVE_DEFECT, file_path.relative_to(project_path), detail=str(e))]
     
-    Returns:
-        True if valid, False otherwise
+    # Skip binary files, known safe files, generated files, and env files
+    if file.endswith(DNA_SKIP_SUFFIXES) or file in DNA_SKIP_FILES:
+        PROFILER.skip("file_type")
+        return []
+        
+    file_path = root / file
+    try:
+        with TRACER.file_span(file_path, cat="dna"):
+            return scan_file_dna(file_path, project_path, source)
+    except Exception as e:
+        # We log but don't fail the whole scan for one unreadable file
+        return [Defect(UNREADABLE_FILE_DEFECT, file_path.relative_to(project_path), detail=str(e))]
+
+
+def dna_findings(file_path, content: str, context: str) -> tuple:
+    """Path and secret rule matches in one file's content.
+    
+    Returns: (sorted absolute-path line numbers, whether a secret was found)
     """
-    project_name = project_path.name
-    errors = []
+    # Skip common intentional paths if any (e.g. journal protocol uses absolute paths)
+    journal_path_str = str(PROJECTS_ROOT / "ai-journal" / "entries")
     
-    # 1. Check for index file
-    has_index, index_path = has_index_file(project_path)
-    if not has_index:
-        errors.append("Missing index file (00_Index_*.md)")
+    path_lines = set()
+    has_secret = False
+    for finding in load_ruleset().scan(file_path, content, families=DNA_FAMILIES, context=context):
+        if finding.rule.family == "secret":
+            has_secret = True
+        elif journal_path_str not in finding.text:
+            path_lines.add(finding.line)
+    if not has_secret:
+        # Unknown key shapes: random-looking values assigned to credential names
+        start = time.perf_counter()
+        secret = next(iter_entropy_secrets(content), None)
+        has_secret = secret is not None
+        RULE_COSTS.record("secret-entropy", time.perf_counter() - start, len(content),
+                          int(has_secret), len(secret[1]) if has_secret else 0)
+    return tuple(sorted(path_lines)), has_secret
+
+
+def scan_file_dna(file_path: Path, project_path: Path, source: FileSource | None = None) -> List[Defect]:
+    """DNA checks (path and secret rules) for one file. Returns list of errors."""
+    if SNIFFER.skip_reason(file_path):
+        return []  # Binary, generated or oversized content (content_sniff.py)
+    context = file_context(file_path)
+    
+    # Identical files (copies, hardlinks, symlinks) are scanned once per run
+    namespace = ("dna", context, file_path.suffix, load_ruleset().name_key(file_path))
+    if source is not None:
+        read = lambda: source.text(errors='ignore')
     else:
-        # Validate index content
-        index_errors = validate_index_content(index_path)
-        errors.extend(index_errors)
+        read = lambda: PROFILER.read(file_path.read_text(encoding='utf-8', errors='ignore'))
+    path_lines, has_secret = DEDUP.cached(file_path, namespace, read, lambda content: dna_findings(file_path, content, context))
+    if not path_lines and not has_secret:
+        return []
+    
+    rel_path = file_path.relative_to(project_path)
+    errors = [Defect(ABSOLUTE_PATH_DEFECT, rel_path, line) for line in path_lines]
+    if has_secret:
+        errors.append(Defect(SECRET_DEFECT, rel_path))
+    
+    return errors
+
+
+def is_dna_member(inner: str) -> bool:
+    """Whether an archive member is one the DNA walk would have scanned."""
+    *dirs, name = member_path(inner).parts or ("",)
+    if any(d in DNA_EXCLUDE_DIRS or d.startswith(".") for d in dirs):
+        return False
+    return not (name.endswith(DNA_SKIP_SUFFIXES) or name in DNA_SKIP_FILES or is_archive(name))
+
+
+def scan_archive_dna(file_path: Path, project_path: Path) -> List[Defect]:
+    """DNA checks for the members of a zip or tar archive, reported as archive!member."""
+    errors = []
+    rel_path = file_path.relative_to(project_path)
+    
+    for inner, content in ARCHIVES.members(file_path, accept=is_dna_member):
+        inner_path = member_path(inner)
+        path_lines, has_secret = dna_findings(inner_path, content, file_context(inner_path))
+        location = f"{rel_path}!{inner}"
+        errors.extend(Defect(ABSOLUTE_PATH_DEFECT, location, line) for line in path_lines)
+        if has_secret:
+            errors.append(Defect(SECRET_DEFECT, location))
+    
+    return errors
+
+
+def check_mandatory_files(project_path: Path) -> List[str]:
+    """Check for mandatory files and directories. Returns list of errors."""
+    errors = []
     
-    # 2. Check for mandatory files
     for filename in MANDATORY_FILES:
         if not (project_path / filename).exists():
             # Special case: check for README.md in Documents/ if not in root
@@ -231,103 +279,189 @@ def validate_project(project_path: Path, verbose: bool = True) -> bool:
                 continue
             errors.append(f"Missing mandatory file: {filename}")
             
-    # 3. Check for mandatory directories
+    # Check for mandatory directories
     for dirname in MANDATORY_DIRS:
         if not (project_path / dirname).is_dir():
             errors.append(f"Missing mandatory directory: {dirname}")
-            
-    # 4. DNA Integrity Scan (Automated Gate 0)
-    dna_errors = validate_dna_integrity(project_path)
-    errors.extend(dna_errors)
     
-    # 5. Dangerous Command Scan (Automated Gate 1)
-    # Check for banned functions like rm, shutil.rmtree, os.remove
-    dangerous_patterns = [
-        (r"\brm\s+", "rm command found - use 'trash <file>' instead"),
-        (r"shutil\.rmtree\s*\(", "shutil.rmtree() found - use send2trash"),
-        (r"os\.remove\s*\(", "os.remove() found - use send2trash"),
-        (r"os\.unlink\s*\(", "os.unlink() found - use send2trash"),
-    ]
-    
-    # Files to skip for safety scan
-    safety_skip_files = {"validate_project.py", "warden_audit.py"}
-    
-    # 6. Placeholder Scan (Automated Gate 2)
-    # Check for unfilled template placeholders: {{VAR}}
-    placeholder_patterns = [
-        (re.compile(r"\{\{[A-Z0-9_]+\}\}"), "Unfilled double-brace placeholder"),
-    ]
-    
-    # Intentional placeholders that are allowed to remain (e.g. in documentation or examples)
-    ALLOWED_PLACEHOLDERS = {
-        "{{RECIPE_ID}}",
-        "{{BACKGROUND}}",
-        "{{PRIMARY}}",
-        "{{SECONDARY}}",
-        "{{ACCENT}}",
-        "{{PLACEHOLDER}}"
-    }
-    
-    # Files/directories to skip for placeholder scan
-    placeholder_skip_files = {
-        "SILENT_FAILURES_AUDIT.md",
-        "TODO_FORMAT_STANDARD.md",
-        "REVIEWS_AND_GOVERNANCE_PROTOCOL.md",
-        "validate_project.py",
-        "cli.py"
-    }
-    placeholder_skip_dirs = {"templates", "_handoff", "prompts"}
-    
-    for root, dirs, files in os.walk(project_path):
+    return errors
+
+
+# 6. Placeholder Scan (Automated Gate 2)
+# Check for unfilled template placeholders: {{VAR}}
+PLACEHOLDER_PATTERNS = [
+    (re.compile(r"\{\{[A-Z0-9_]+\}\}"), "Unfilled double-brace placeholder"),
+]
+
+# Intentional placeholders that are allowed to remain (e.g. in documentation or examples)
+ALLOWED_PLACEHOLDERS = {
+    "{{RECIPE_ID}}",
+    "{{BACKGROUND}}",
+    "{{PRIMARY}}",
+    "{{SECONDARY}}",
+    "{{ACCENT}}",
+    "{{PLACEHOLDER}}"
+}
+
+# Files/directories to skip for placeholder scan
+PLACEHOLDER_SKIP_FILES = {
+    "SILENT_FAILURES_AUDIT.md",
+    "TODO_FORMAT_STANDARD.md",
+    "REVIEWS_AND_GOVERNANCE_PROTOCOL.md",
+    "validate_project.py",
+    "cli.py"
+}
+PLACEHOLDER_SKIP_DIRS = {"templates", "_handoff", "prompts"}
+SAFETY_SKIP_DIRS = {"venv", ".venv", "__pycache__", "node_modules", ".git"}
+# Check placeholders in Markdown, Python, and Shell scripts
+SAFETY_SUFFIXES = (".md", ".py", ".sh", ".js", ".ts")
+
+
+def scan_safety_and_placeholders(project_path: Path) -> List[Defect]:
+    """Scan for dangerous commands and unfilled placeholders. Returns list of errors."""
+    errors = []
+    
+    for root, dirs, files in walk_tree(project_path):
         # Filter directories in-place
-        dirs[:] = [d for d in dirs if d not in {"venv", ".venv", "__pycache__", "node_modules", ".git"}]
+        dirs[:] = [d for d in dirs if d not in SAFETY_SKIP_DIRS]
         
         rel_root = Path(root).relative_to(project_path)
-        is_in_skip_dir = any(part in placeholder_skip_dirs for part in rel_root.parts)
+        is_in_skip_dir = any(part in PLACEHOLDER_SKIP_DIRS for part in rel_root.parts)
         
         for file in files:
-            # Check placeholders in Markdown, Python, and Shell scripts
-            if not file.endswith((".md", ".py", ".sh", ".js", ".ts")):
-                continue
-            
-            # Skip index files for placeholder check (they pull from other files)
-            if file.startswith("00_Index_") and file.endswith(".md"):
-                is_placeholder_skip_file = True
-            else:
-                is_placeholder_skip_file = file in placeholder_skip_files
-                
-            file_path = Path(root) / file
-            rel_file_path = file_path.relative_to(project_path)
-            
-            try:
-                content = file_path.read_text(encoding='utf-8', errors='ignore')
-                
-                # Check for dangerous patterns (skip if in skip list)
-                if file not in safety_skip_files:
-                    for pattern, reason in dangerous_patterns:
-                        if re.search(pattern, content):
-                            errors.append(f"Safety Defect: {reason} in {rel_file_path}")
-                
-                # Check for unfilled placeholders (skip if in skip list)
-                if not is_in_skip_dir and not is_placeholder_skip_file:
-                    lines = content.splitlines()
-                    for i, line in enumerate(lines):
-                        for pattern, reason in placeholder_patterns:
-                            match = pattern.search(line)
-                            if match:
-                                placeholder = match.group(0)
-                                if placeholder in ALLOWED_PLACEHOLDERS:
-                                    continue
-                                
-                                # Special case: ignore some common single-brace patterns that aren't placeholders
-                                # e.g. f-strings in python or shell variables if they look like placeholders
-                                if file.endswith(".py") and ("f\"" in line or "f'" in line):
-                                    continue
-                                
-                                errors.append(f"Placeholder Defect: {reason} found in {rel_file_path}:{i+1} - {match.group(0)}")
-            except Exception:
-                pass
+            PROFILER.count("files_visited")
+            errors.extend(check_file_safety(Path(root), file, project_path, is_in_skip_dir))
+    
+    return errors
+
 
+def check_file_safety(root: Path, file: str, project_path: Path, is_in_skip_dir: bool,
+                      source: FileSource | None = None) -> List[Defect]:
+    """Dangerous-command and placeholder checks for one file found by the walk."""
+    errors = []
+    if not file.endswith(SAFETY_SUFFIXES):
+        PROFILER.skip("file_type")
+        return errors
+    
+    # 5. Dangerous Command Scan (Automated Gate 1)
+    # Banned functions like rm, shutil.rmtree, os.remove come from the shared
+    # ruleset, which also skips the governance scripts themselves
+    ruleset = load_ruleset()
+    
+    # Skip index files for placeholder check (they pull from other files)
+    if file.startswith("00_Index_") and file.endswith(".md"):
+        is_placeholder_skip_file = True
+    else:
+        is_placeholder_skip_file = file in PLACEHOLDER_SKIP_FILES
+    check_placeholders = not is_in_skip_dir and not is_placeholder_skip_file
+        
+    file_path = root / file
+    if SNIFFER.skip_reason(file_path):
+        return errors
+    context = file_context(file_path)
+    
+    def scan(content: str) -> tuple:
+        # Check for dangerous patterns (one defect per rule per file)
+        messages = []
+        for finding in ruleset.scan(file_path, content, families=("dangerous",), context=context):
+            if finding.rule.message not in messages:
+                messages.append(finding.rule.message)
+        
+        # Check for unfilled placeholders (skip if in skip list)
+        placeholders = []
+        if check_placeholders:
+            lines = content.splitlines()
+            PROFILER.count("regex_evals", len(lines) * len(PLACEHOLDER_PATTERNS))
+            searches = [(RULE_COSTS.searcher(f"placeholder:{reason}", pattern), reason)
+                        for pattern, reason in PLACEHOLDER_PATTERNS]
+            for i, line in enumerate(lines):
+                for search, reason in searches:
+                    match = search(line)
+                    if match:
+                        placeholder = match.group(0)
+                        if placeholder in ALLOWED_PLACEHOLDERS:
+                            continue
+                    
+                        # Special case: ignore some common single-brace patterns that aren't placeholders
+                        # e.g. f-strings in python or shell variables if they look like placeholders
+                        if file.endswith(".py") and ("f\"" in line or "f'" in line):
+                            continue
+                    
+                        placeholders.append((i + 1, reason, placeholder))
+        return tuple(messages), tuple(placeholders)
+    
+    # Identical files (copies, hardlinks, symlinks) are scanned once per run
+    namespace = ("safety", context, file_path.suffix, ruleset.name_key(file_path), check_placeholders)
+    if source is not None:
+        read = lambda: source.text(errors='ignore')
+    else:
+        read = lambda: PROFILER.read(file_path.read_text(encoding='utf-8', errors='ignore'))
+    with TRACER.file_span(file_path, cat="safety_placeholders"):
+        try:
+            messages, placeholders = DEDUP.cached(file_path, namespace, read, scan)
+        except Exception:
+            return errors
+    if not messages and not placeholders:
+        return errors
+    
+    rel_file_path = file_path.relative_to(project_path)
+    for message in messages:
+        errors.append(Defect(SAFETY_DEFECT, rel_file_path, reason=message))
+    for line_num, reason, placeholder in placeholders:
+        errors.append(Defect(PLACEHOLDER_DEFECT, rel_file_path, line_num, reason, placeholder))
+    return errors
+
+
+def error_rule(error: str) -> str:
+    """Metric rule name for an error, e.g. 'DNA Defect: ...' -> 'dna_defect'."""
+    head = re.split(r"[:(]", error, maxsplit=1)[0]
+    return "_".join(re.findall(r"[a-z0-9]+", head.lower())) or "other"
+
+
+def validate_project(project_path: Path, verbose: bool = True, scanned: List[Defect] | None = None) -> bool:
+    """
+    Validate a single project against the Master Compliance Checklist.
+    
+    ``scanned`` holds DNA, safety and placeholder errors already collected by
+    a shared walk (governance_check.py); the project is then not walked again.
+    
+    Returns:
+        True if valid, False otherwise
+    """
+    project_name = project_path.name
+    errors = []
+    
+    # 1. Check for index file
+    with PROFILER.phase("index"):
+        has_index, index_path = has_index_file(project_path)
+        if not has_index:
+            errors.append("Missing index file (00_Index_*.md)")
+        else:
+            # Validate index content
+            index_errors = validate_index_content(index_path)
+            errors.extend(index_errors)
+    
+    # 2-3. Check for mandatory files and directories
+    with PROFILER.phase("mandatory_files"):
+        errors.extend(check_mandatory_files(project_path))
+    
+    if scanned is not None:
+        errors.extend(scanned)
+    else:
+        # 4. DNA Integrity Scan (Automated Gate 0)
+        with PROFILER.phase("dna"):
+            dna_errors = validate_dna_integrity(project_path)
+        errors.extend(dna_errors)
+        
+        # 5-6. Safety and placeholder scans
+        with PROFILER.phase("safety_placeholders"):
+            errors.extend(scan_safety_and_placeholders(project_path))
+    
+    MEMPROFILER.track("errors", errors)
+    if METRICS.enabled:
+        for error in errors:
+            METRICS.finding("error", error_rule(str(error)))
+    
     if errors:
         if verbose:
             status_icon = "⚠️ " if has_index else "❌ "
@@ -350,13 +484,73 @@ def validate_project(project_path: Path, verbose: bool = True) -> bool:
     return True
 
 
+def validate_all(projects: List[Path], scanned: dict[Path, List[Defect]] | None = None) -> int:
+    """Validate every project and print the summary. Returns the --all exit code."""
+    valid_count = 0
+    invalid_count = 0
+    
+    for project in projects:
+        with TRACER.span(project.name, cat="project"), METRICS.project(project.name):
+            is_valid = validate_project(project, verbose=True, scanned=None if scanned is None else scanned[project])
+        if is_valid:
+            valid_count += 1
+        else:
+            invalid_count += 1
+        print()  # Blank line between projects
+    
+    # Summary
+    total = valid_count + invalid_count
+    print(f"{'='*60}")
+    print(f"Summary: {valid_count}/{total} projects valid ({invalid_count} need attention)")
+    
+    if invalid_count > 0:
+        print(f"\n⚠️  {invalid_count} projects need index files or fixes")
+        print("Run with --missing to see which projects need indexes")
+        return 1
+    print("\n✅ All projects have valid index files!")
+    return 0
+
+
 def main() -> None:
     """Main validation logic."""
+    profile_format = pop_profile_flag(sys.argv)
+    if profile_format:
+        PROFILER.enable(profile_format)
+    trace_path = pop_option(sys.argv, "--trace")
+    if trace_path:
+        TRACER.enable(Path(trace_path), float(pop_option(sys.argv, "--trace-slow-ms") or 5.0))
+    metrics_path = pop_option(sys.argv, "--metrics-file")
+    if metrics_path:
+        METRICS.enable(Path(metrics_path), "validate_project")
+    memprofile_top = pop_memprofile_flag(sys.argv)
+    if memprofile_top:
+        MEMPROFILER.enable(memprofile_top)
+    if "--precise" in sys.argv:
+        sys.argv.remove("--precise")
+        load_ruleset().enable_precise(PROJECTS_ROOT / AST_CACHE)
+    if "--archives" in sys.argv:
+        sys.argv.remove("--archives")
+        ARCHIVES.enable()
+    if "--no-sniff" in sys.argv:
+        sys.argv.remove("--no-sniff")
+        SNIFFER.enabled = False
+    if "--rule-costs" in sys.argv:
+        sys.argv.remove("--rule-costs")
+        RULE_COSTS.enable()
+    
     if len(sys.argv) < 2 or sys.argv[1] in ["--help", "-h"]:
         print("Usage:")
         print("  ./scripts/validate_project.py [project_name]  # Check specific project")
         print("  ./scripts/validate_project.py --all           # Check all projects")
         print("  ./scripts/validate_project.py --missing       # List missing indexes")
+        print("  Add --profile [table|json] to report per-phase timing at exit")
+        print("  Add --trace FILE [--trace-slow-ms N] to write Chrome trace events")
+        print("  Add --metrics-file FILE to write OpenMetrics/Prometheus textfile output")
+        print("  Add --memprofile [TOP] to report tracemalloc memory per phase at exit")
+        print("  Add --precise to check .py files for real dangerous calls (AST) instead of text matches")
+        print("  Add --archives to also check members of .zip/.tar(.gz/.bz2/.xz) archives, streamed without extraction")
+        print("  Add --no-sniff to also check binary, generated, minified and oversized files")
+        print("  Add --rule-costs to report time and cost per matched character for every rule at exit")
         sys.exit(0 if len(sys.argv) > 1 else 1)
     
     arg = sys.argv[1]
@@ -364,31 +558,9 @@ def main() -> None:
     if arg == "--all":
         # Validate all projects
         print("Validating all projects...\n")
-        projects = find_projects(PROJECTS_ROOT)
-        
-        valid_count = 0
-        invalid_count = 0
-        
-        for project in projects:
-            is_valid = validate_project(project, verbose=True)
-            if is_valid:
-                valid_count += 1
-            else:
-                invalid_count += 1
-            print()  # Blank line between projects
-        
-        # Summary
-        total = valid_count + invalid_count
-        print(f"{'='*60}")
-        print(f"Summary: {valid_count}/{total} projects valid ({invalid_count} need attention)")
-        
-        if invalid_count > 0:
-            print(f"\n⚠️  {invalid_count} projects need index files or fixes")
-            print("Run with --missing to see which projects need indexes")
-            sys.exit(1)
-        else:
-            print("\n✅ All projects have valid index files!")
-            sys.exit(0)
+        with PROFILER.phase("discovery"):
+            projects = find_projects(PROJECTS_ROOT)
+        sys.exit(validate_all(projects))
     
     elif arg == "--missing":
         # List projects without indexes
@@ -437,7 +609,8 @@ def main() -> None:
             sys.exit(1)
         
         print(f"Validating: {project_path.name}\n")
-        is_valid = validate_project(project_path, verbose=True)
+        with TRACER.span(project_path.name, cat="project"), METRICS.project(project_path.name):
+            is_valid = validate_project(project_path, verbose=True)
         
         if not is_valid:
             print(f"\n❌ Validation failed for {project_path.name}")
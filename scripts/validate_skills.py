@@ -6,13 +6,20 @@ Specification: https://agentskills.io/specification
 
 Usage:
     python scripts/validate_skills.py
+    python scripts/validate_skills.py --rules    # Also validate cursor/antigravity rules
+    python scripts/validate_skills.py --jobs 8   # Read changed files in parallel
     python scripts/validate_skills.py --fix  # Auto-fix issues (future)
 """
 
+import argparse
+import json
 import re
 import sys
 from pathlib import Path
 
+from instrumentation import MEMPROFILER, PROFILER, add_memprofile_argument, add_profile_argument
+from skill_manifest import TREES, load_manifest, parse_frontmatter, write_json_atomic
+
 # ANSI colors
 GREEN = "\033[92m"
 RED = "\033[91m"
@@ -20,6 +27,13 @@ YELLOW = "\033[93m"
 RESET = "\033[0m"
 BOLD = "\033[1m"
 
+# Per-file results cached by content hash; bump the version when rules change
+VALIDATION_CACHE = ".validate-cache.json"
+VALIDATOR_VERSION = 1
+
+# **Follow:** targets are written relative to the projects root
+LIBRARY_PREFIX = "agent-skills-library/"
+
 
 def validate_name(name: str, directory_name: str) -> list[str]:
     """Validate the 'name' field according to spec."""
@@ -71,40 +85,6 @@ def validate_description(description: str) -> list[str]:
     return errors
 
 
-def parse_frontmatter(content: str) -> tuple[dict[str, str] | None, list[str]]:
-    """Parse YAML frontmatter from SKILL.md content."""
-    errors = []
-    
-    # Check for frontmatter delimiters
-    if not content.startswith('---'):
-        errors.append("Missing YAML frontmatter (must start with '---')")
-        return None, errors
-    
-    # Find the closing delimiter
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        errors.append("Invalid YAML frontmatter (missing closing '---')")
-        return None, errors
-    
-    frontmatter_text = parts[1].strip()
-    if not frontmatter_text:
-        errors.append("Empty YAML frontmatter")
-        return None, errors
-    
-    # Parse simple YAML (key: value pairs)
-    frontmatter = {}
-    for line in frontmatter_text.split('\n'):
-        line = line.strip()
-        if not line or line.startswith('#'):
-            continue
-        
-        if ':' in line:
-            key, value = line.split(':', 1)
-            frontmatter[key.strip()] = value.strip()
-    
-    return frontmatter, errors
-
-
 def validate_skill_file(skill_path: Path) -> tuple[bool, list[str]]:
     """Validate a single SKILL.md file."""
     errors = []
@@ -126,61 +106,143 @@ def validate_skill_file(skill_path: Path) -> tuple[bool, list[str]]:
     if frontmatter is None:
         return False, errors
     
-    # Validate required fields
+    errors.extend(validate_frontmatter(frontmatter, directory_name))
+    
+    return len(errors) == 0, errors
+
+
+def validate_frontmatter(frontmatter: dict[str, str], directory_name: str) -> list[str]:
+    """Validate the required frontmatter fields."""
+    errors = []
     name = frontmatter.get('name', '')
     description = frontmatter.get('description', '')
     
     errors.extend(validate_name(name, directory_name))
     errors.extend(validate_description(description))
     
-    return len(errors) == 0, errors
+    return errors
 
 
-def validate_all_skills(skills_dir: Path) -> tuple[int, int, dict[str, list[str]]]:
-    """Validate all skills in the directory."""
+def validate_entry(tree: str, name: str, entry: dict) -> list[str]:
+    """Validate one manifest entry's own content (cacheable by content hash)."""
+    errors = []
+    
+    if tree == "cursor-rules":
+        # Cursor rules are plain markdown: frontmatter is optional
+        if entry["title"] is None:
+            errors.append("Missing '# Title' heading")
+        if entry["frontmatter"] is not None:
+            errors.extend(validate_frontmatter(entry["frontmatter"], name))
+        return errors
+    
+    errors.extend(entry["frontmatter_errors"])
+    if entry["frontmatter"] is not None:
+        errors.extend(validate_frontmatter(entry["frontmatter"], name))
+    
+    return errors
+
+
+def validate_follow_target(entry: dict, library_root: Path) -> list[str]:
+    """Check that an adapter's **Follow:** playbook exists in this library."""
+    target = entry.get("follow")
+    if not target or not target.startswith(LIBRARY_PREFIX):
+        return []
+    if not (library_root / target[len(LIBRARY_PREFIX):]).exists():
+        return [f"**Follow:** target not found: {target}"]
+    return []
+
+
+def load_validation_cache(library_root: Path) -> dict[str, list[str]]:
+    """Load cached per-file results, discarding them if the validator changed."""
+    try:
+        cache = json.loads((library_root / VALIDATION_CACHE).read_text())
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != VALIDATOR_VERSION:
+        return {}
+    return cache.get("results", {})
+
+
+def validate_tree(
+    library_root: Path,
+    tree: str,
+    jobs: int = 1,
+    cache: dict[str, list[str]] | None = None,
+) -> tuple[int, int, dict[str, list[str]]]:
+    """Validate every entry of one library tree.
+
+    Frontmatter comes from the skills manifest, so only files that changed
+    since the last run are re-read. Per-file results in ``cache`` are keyed
+    by content hash, so unchanged entries are not re-validated; the tree's
+    keys that were not looked up (old revisions, removed entries) are dropped.
+    """
     passed = 0
     failed = 0
     all_errors: dict[str, list[str]] = {}
+    looked_up = set()
     
-    for skill_dir in sorted(skills_dir.iterdir()):
-        if not skill_dir.is_dir():
-            continue
-        
-        # Skip hidden and template directories
-        if skill_dir.name.startswith('.') or skill_dir.name.startswith('_'):
+    with PROFILER.phase("manifest"):
+        manifest = load_manifest(library_root, jobs=jobs)
+    MEMPROFILER.track("manifest", manifest)
+    entries = manifest["trees"].get(tree, {})
+    filename = TREES.get(tree, "SKILL.md")
+    
+    for name, entry in entries.items():
+        # Skip template directories
+        if name.startswith('_'):
             continue
         
-        skill_file = skill_dir / "SKILL.md"
-        
-        if not skill_file.exists():
+        if entry["path"] is None:
             failed += 1
-            all_errors[skill_dir.name] = [f"Missing SKILL.md file"]
+            all_errors[name] = [f"Missing {filename} file"]
             continue
         
-        is_valid, errors = validate_skill_file(skill_file)
+        key = f"{tree}/{name}:{entry['sha256']}"
+        looked_up.add(key)
+        if cache is not None and key in cache:
+            PROFILER.count("cache_hits")
+            errors = list(cache[key])
+        else:
+            PROFILER.count("cache_misses")
+            errors = validate_entry(tree, name, entry)
+            if cache is not None:
+                cache[key] = list(errors)
+        
+        # Depends on other files, so never cached
+        errors.extend(validate_follow_target(entry, library_root))
         
-        if is_valid:
+        if not errors:
             passed += 1
         else:
             failed += 1
-            all_errors[skill_dir.name] = errors
+            all_errors[name] = errors
+    
+    if cache is not None:
+        prefix = f"{tree}/"
+        for key in [k for k in cache if k.startswith(prefix) and k not in looked_up]:
+            del cache[key]
     
     return passed, failed, all_errors
 
 
-def print_report(passed: int, failed: int, all_errors: dict[str, list[str]]) -> None:
+def validate_all_skills(skills_dir: Path) -> tuple[int, int, dict[str, list[str]]]:
+    """Validate all skills in the directory."""
+    return validate_tree(skills_dir.parent, skills_dir.name)
+
+
+def print_report(passed: int, failed: int, all_errors: dict[str, list[str]], label: str = "skills") -> None:
     """Print validation report."""
     total = passed + failed
     
-    print(f"\n{BOLD}Agent Skills Validation Report{RESET}")
+    print(f"\n{BOLD}Agent Skills Validation Report ({label}){RESET}")
     print(f"{'=' * 50}")
     print(f"Specification: https://agentskills.io/specification")
     print(f"{'=' * 50}\n")
     
     if failed == 0:
-        print(f"{GREEN}✅ All {total} skills pass validation!{RESET}\n")
+        print(f"{GREEN}✅ All {total} {label} pass validation!{RESET}\n")
     else:
-        print(f"{RED}❌ {failed}/{total} skills have issues{RESET}\n")
+        print(f"{RED}❌ {failed}/{total} {label} have issues{RESET}\n")
         
         for skill_name, errors in all_errors.items():
             print(f"{RED}• {skill_name}/{RESET}")
@@ -196,6 +258,32 @@ def print_report(passed: int, failed: int, all_errors: dict[str, list[str]]) ->
 
 def main() -> int:
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Validate Agent Skills against the specification")
+    parser.add_argument(
+        '--rules',
+        action='store_true',
+        help="Also validate cursor-rules/*/RULE.md and antigravity-rules/*/RULE.md"
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help="Read changed files on N threads (default: 1)"
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Re-validate every file instead of reusing cached results"
+    )
+    add_profile_argument(parser)
+    add_memprofile_argument(parser)
+    args = parser.parse_args()
+    
+    if args.profile:
+        PROFILER.enable(args.profile)
+    if args.memprofile:
+        MEMPROFILER.enable(args.memprofile)
+    
     # Find the claude-skills directory
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
@@ -205,12 +293,30 @@ def main() -> int:
         print(f"{RED}Error: claude-skills directory not found at {skills_dir}{RESET}")
         return 1
     
-    print(f"Validating skills in: {skills_dir}")
-    
-    passed, failed, all_errors = validate_all_skills(skills_dir)
-    print_report(passed, failed, all_errors)
-    
-    return 0 if failed == 0 else 1
+    return validate_library(project_root, rules=args.rules, jobs=args.jobs, use_cache=not args.no_cache)
+
+
+def validate_library(project_root: Path, rules: bool = False, jobs: int = 1, use_cache: bool = True) -> int:
+    """Validate and report the library's trees. Returns the exit code."""
+    trees = ["claude-skills"]
+    if rules:
+        trees += ["cursor-rules", "antigravity-rules"]
+    
+    cache = load_validation_cache(project_root) if use_cache else None
+    total_failed = 0
+    
+    for tree in trees:
+        print(f"Validating {tree} in: {project_root / tree}")
+        with PROFILER.phase("validation"):
+            passed, failed, all_errors = validate_tree(project_root, tree, jobs=jobs, cache=cache)
+        with PROFILER.phase("reporting"):
+            print_report(passed, failed, all_errors, label="skills" if tree == "claude-skills" else "rules")
+        total_failed += failed
+    
+    if cache is not None:
+        write_json_atomic(project_root / VALIDATION_CACHE, {"version": VALIDATOR_VERSION, "results": cache})
+    
+    return 0 if total_failed == 0 else 1
 
 
 if __name__ == "__main__":
@@ -1,10 +1,36 @@
 import pathlib
 import logging
+import math
+import os
+import random
+import re
 import sys
 import subprocess
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
+from instrumentation import (
+    MEMPROFILER,
+    METRICS,
+    PROFILER,
+    RULE_COSTS,
+    TRACER,
+    add_memprofile_argument,
+    add_metrics_argument,
+    add_profile_argument,
+    add_rule_costs_argument,
+    add_trace_arguments,
+)
+from archive_scan import ARCHIVES, is_archive, member_path
+from ast_scan import AST_CACHE, PREFILTER
+from content_sniff import SNIFFER
+from dedup import DEDUP, FileSource, walk_tree
+from index_catalog import CATALOG
+from records import Issue
+from ruleset import file_context, load_ruleset
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
@@ -22,33 +48,11 @@ def is_tier_1_project(index_path: pathlib.Path) -> bool:
     if not index_path.exists():
         return False
     
-    tech_languages = {'python', 'javascript', 'java', 'c++', 'ruby', 'php', 'typescript', 'rust', 'go'}
-    
     try:
-        with index_path.open('r') as f:
-            content = f.read()
-            content_lower = content.lower()
-            
-        # 1. Explicit tags
-        if '#type/code' in content_lower or '#type/project' in content_lower:
-            return True
-            
-        if any(f'tech/{lang}' in content_lower for lang in tech_languages):
-            return True
-
-        # 2. Check headers and list items in the first 50 lines
-        lines = content.split('\n')
-        for line in lines[:50]:
-            line_strip = line.strip().lower()
-            if not line_strip:
-                continue
-                
-            # If it's a header or a list item
-            if line_strip.startswith('#') or line_strip.startswith('- ') or line_strip.startswith('* '):
-                if any(lang in line_strip for lang in tech_languages):
-                    return True
-                    
-        return False
+        record = CATALOG.get(index_path)
+        if record.decode_error is not None:
+            raise record.decode_error
+        return record.tier_1
         
     except Exception as e:
         logger.error(f"Error reading file {index_path}: {e}")
@@ -63,200 +67,541 @@ def check_dependencies(project_root: pathlib.Path) -> bool:
     return False
 
 
+SKIP_DIRS = ['venv', '.venv', 'node_modules', '.git', '__pycache__']
+
+
+def count_lines(content: str) -> int:
+    """Count lines the way iterating over the open text file would."""
+    return content.count('\n') + (1 if content and not content.endswith('\n') else 0)
+
+
+def read_text(file_path: pathlib.Path, errors: str = 'strict') -> str:
+    """Read a file inside its trace span, recording bytes read when profiling."""
+    with TRACER.file_span(file_path), file_path.open('r', errors=errors) as f:
+        return PROFILER.read(f.read())
+
+
+# Files counted by the doc ratio: code lines and markdown doc lines
+CODE_EXTENSIONS = ['.py', '.js', '.ts', '.jsx', '.tsx', '.go', '.rs', '.java', '.rb']
+
+
 def check_doc_ratio(project_root: pathlib.Path) -> tuple:
     """Check documentation to code ratio.
 
     Returns: (ratio, severity) where severity is None if healthy, P2 if warning, P1 if critical
     """
-    code_extensions = ['*.py', '*.js', '*.ts', '*.jsx', '*.tsx', '*.go', '*.rs', '*.java', '*.rb']
-    skip_dirs = ['venv', '.venv', 'node_modules', '.git', '__pycache__']
-
     code_lines = 0
     doc_lines = 0
 
-    # Count code lines
-    for ext in code_extensions:
-        for file_path in project_root.rglob(ext):
-            if any(part in file_path.parts for part in skip_dirs):
+    # One walk for code and docs; copies and hardlinks are counted without re-reading
+    for root, dirs, files in walk_tree(project_root):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            PROFILER.count("files_visited")
+            file_path = pathlib.Path(root) / name
+            is_doc = file_path.suffix == '.md'
+            if not is_doc and file_path.suffix not in CODE_EXTENSIONS:
+                PROFILER.skip("file_type")
+                continue
+            if SNIFFER.skip_reason(file_path):
                 continue
             try:
-                with file_path.open('r', errors='ignore') as f:
-                    code_lines += sum(1 for _ in f)
+                lines = DEDUP.cached(file_path, ("lines",), lambda: read_text(file_path, errors='ignore'), count_lines)
             except Exception:
-                pass
+                PROFILER.skip("unreadable")
+                continue
+            if is_doc:
+                doc_lines += lines
+            else:
+                code_lines += lines
 
-    # Count doc lines
-    for file_path in project_root.rglob('*.md'):
-        if any(part in file_path.parts for part in skip_dirs):
-            continue
-        try:
-            with file_path.open('r', errors='ignore') as f:
-                doc_lines += sum(1 for _ in f)
-        except Exception:
-            pass
+    return doc_ratio_severity(code_lines, doc_lines)
 
+
+def doc_ratio_severity(code_lines: int, doc_lines: int) -> tuple:
+    """Doc ratio and its severity for a project's line counts."""
     # Avoid division by zero - if no code, docs are fine
     if code_lines == 0:
         return (0.0, None)
 
     ratio = doc_lines / code_lines
+    return (ratio, ratio_severity(ratio))
+
 
+def ratio_severity(ratio: float):
+    """Severity of a doc ratio: None if healthy, else a Severity."""
     if ratio > 5.0:
-        return (ratio, Severity.P2)  # Extreme bloat - warning only
+        return Severity.P2  # Extreme bloat - warning only
     elif ratio > 0.5:
-        return (ratio, Severity.P2)  # Warning - docs > 50% of code
+        return Severity.P2  # Warning - docs > 50% of code
     elif ratio > 0.2:
-        return (ratio, Severity.P2)  # Warning - docs 20-50% of code
+        return Severity.P2  # Warning - docs 20-50% of code
     else:
-        return (ratio, None)  # Healthy
+        return None  # Healthy
+
+
+# Doc ratio estimate (--estimate-docs): files sampled per extension, and the
+# two-sided 95% normal quantile for its confidence interval
+MIN_STRATUM_SAMPLE = 30
+STRATUM_SAMPLE_FRACTION = 0.05
+CONFIDENCE_Z = 1.96
+
+
+def estimate_doc_ratio(project_root: pathlib.Path) -> tuple | None:
+    """Estimate the doc ratio from file sizes and a sample of line counts.
+
+    Every code and markdown file is stat'ed, but only a random sample per
+    extension (stratum) is read. Each stratum's lines are estimated as its
+    total bytes times the sample's lines per byte (a ratio estimator), with
+    the usual finite-population variance; strata are independent, and the
+    variance of docs/code follows by the delta method. The sample is seeded
+    by the project path, so repeated runs agree.
+
+    Returns: (ratio, severity, margin) with margin the half-width of the 95%
+    interval, or None when the interval spans a severity threshold (or the
+    project has no code) and only an exact count can decide.
+    """
+    strata: dict[str, list[tuple[pathlib.Path, int]]] = {}
+    for root, dirs, files in walk_tree(project_root):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            PROFILER.count("files_visited")
+            suffix = os.path.splitext(name)[1]
+            if suffix != '.md' and suffix not in CODE_EXTENSIONS:
+                PROFILER.skip("file_type")
+                continue
+            file_path = pathlib.Path(root) / name
+            try:
+                size = os.stat(file_path).st_size
+            except OSError:
+                continue
+            if SNIFFER.enabled and size > SNIFFER.max_file_bytes:
+                continue  # Skipped unread by the exact count too
+            strata.setdefault(suffix, []).append((file_path, size))
+
+    rng = random.Random(os.fspath(project_root))
+    totals = {True: [0.0, 0.0], False: [0.0, 0.0]}  # is_doc -> [lines, variance]
+    for suffix, population in sorted(strata.items()):
+        population.sort()
+        n_total = len(population)
+        n_sample = min(n_total, max(MIN_STRATUM_SAMPLE, math.ceil(STRATUM_SAMPLE_FRACTION * n_total)))
+        sample = population if n_sample == n_total else rng.sample(population, n_sample)
+
+        sizes, lines = [], []
+        for file_path, size in sample:
+            count = 0
+            if not SNIFFER.skip_reason(file_path):
+                try:
+                    count = DEDUP.cached(file_path, ("lines",), lambda: read_text(file_path, errors='ignore'), count_lines)
+                except Exception:
+                    PROFILER.skip("unreadable")
+            sizes.append(size)
+            lines.append(count)
+        PROFILER.count("doc_ratio_sampled", n_sample)
+
+        total = totals[suffix == '.md']
+        sample_bytes = sum(sizes)
+        if n_sample == n_total:
+            total[0] += sum(lines)  # Read in full: exact
+            continue
+        if sample_bytes == 0:
+            total[1] = math.inf  # Only empty files sampled: no lines per byte to go on
+            continue
+        lines_per_byte = sum(lines) / sample_bytes
+        total[0] += lines_per_byte * sum(size for _, size in population)
+        residuals = sum((y - lines_per_byte * x) ** 2 for x, y in zip(sizes, lines)) / (n_sample - 1)
+        total[1] += n_total ** 2 * (1 - n_sample / n_total) * residuals / n_sample
+
+    (doc_lines, doc_var), (code_lines, code_var) = totals[True], totals[False]
+    if code_lines <= 0 or math.isinf(doc_var + code_var):
+        return None
+    ratio = doc_lines / code_lines
+    # Delta method: Var(D/C) ~ (Var(D) + ratio^2 Var(C)) / C^2
+    margin = CONFIDENCE_Z * math.sqrt(doc_var + ratio ** 2 * code_var) / code_lines
+    severity = ratio_severity(ratio)
+    if ratio_severity(max(ratio - margin, 0.0)) != severity or ratio_severity(ratio + margin) != severity:
+        PROFILER.count("doc_ratio_exact_fallbacks")
+        return None
+    return (ratio, severity, margin)
+
+# File types the warden scans; the ruleset decides per-context severity
+SCAN_SUFFIXES = ['.py', '.sh', '.js', '.ts', '.md']
+
+
+def scan_file(file_path: pathlib.Path, source: FileSource | None = None) -> list:
+    """Matches one file against the shared ruleset, once per distinct file per run.
+
+    ``source`` shares one read of the file with other checks in the same walk.
+
+    Returns: List of Issue records (file_path, pattern, severity), one per rule
+    """
+    if SNIFFER.skip_reason(file_path):
+        return []  # Binary, generated or oversized content (content_sniff.py)
+    ruleset = load_ruleset()
+    context = file_context(file_path)
+
+    def scan(content: str) -> tuple:
+        hits = {}
+        for finding in ruleset.scan(file_path, content, context=context):
+            hits.setdefault(finding.rule.label, finding.severity)
+        return tuple(hits.items())
+
+    namespace = ("warden", context, file_path.suffix, ruleset.name_key(file_path))
+    read = source.text if source is not None else lambda: read_text(file_path)
+    hits = DEDUP.cached(file_path, namespace, read, scan)
+    return [Issue(file_path, label, Severity[severity]) for label, severity in hits]
 
 def check_dangerous_functions(project_root: pathlib.Path) -> list:
-    """Greps for dangerous file removal functions.
+    """Scans code and markdown for dangerous calls, hardcoded paths and secrets.
+    
+    Rules come from governance_rules.json (see ruleset.py).
     
-    Returns: List of (file_path, pattern, severity) tuples
+    Returns: List of Issue records (file_path, pattern, severity)
     """
-    dangerous_code_patterns = [
-        'os.remove', 'os.unlink', 'shutil.rmtree',  # Dangerous functions
-        'rm -rf', 'rm -r', 'subprocess.run([\'rm\'',  # Dangerous shell commands
-        'subprocess.run(["rm"', 'subprocess.call(["rm"', 'subprocess.call([\'rm\'',
-    ]
-    hardcoded_path_patterns = [
-        '/Us' + 'ers/', '/ho' + 'me/',  # macOS/Linux absolute paths
-        'C:\\' + '\\', 'C:/'       # Windows absolute paths
-    ]
+    skip_files = load_ruleset().skip_files
     found_issues = []
     
     # Simple walk and check to avoid external dependency for basic audit
-    for file_path in project_root.rglob('*'):
+    for root, dirs, files in walk_tree(project_root):
         # Skip certain directories (including .venv)
-        if any(part in file_path.parts for part in ['venv', '.venv', 'node_modules', '.git', '__pycache__']):
-            continue
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            PROFILER.count("files_visited")
+            file_path = pathlib.Path(root) / name
             
-        if file_path.name == 'warden_audit.py' or file_path.name == 'validate_project.py':
-            continue
+            if name in skip_files:
+                PROFILER.skip("self")
+                continue
+
+            if file_path.suffix not in SCAN_SUFFIXES:
+                PROFILER.skip("file_type")
+                continue
+
+            try:
+                found_issues.extend(scan_file(file_path))
+            except Exception as e:
+                logger.warning(f"Could not read file {file_path}: {e}")
+                found_issues.append(Issue(file_path, f"READ_ERROR: {e}", Severity.P3))
+            
+    return found_issues
+
+def scan_archive(file_path: pathlib.Path) -> list:
+    """Matches the members of one zip or tar archive against the shared ruleset.
 
-        is_code_file = file_path.suffix in ['.py', '.sh', '.js', '.ts']
-        is_markdown_file = file_path.suffix == '.md'
+    Members are streamed, never extracted (see archive_scan.py).
 
-        if not (is_code_file or is_markdown_file):
+    Returns: List of Issue records (path, pattern, severity), the path naming
+    archive!member:line
+    """
+    ruleset = load_ruleset()
+    found_issues = []
+
+    def accept(inner: str) -> bool:
+        inner_path = member_path(inner)
+        return inner_path.suffix in SCAN_SUFFIXES and inner_path.name not in ruleset.skip_files
+
+    with TRACER.file_span(file_path, cat="archive"):
+        for inner, content in ARCHIVES.members(file_path, accept):
+            seen = set()
+            for finding in ruleset.scan(member_path(inner), content):
+                if finding.rule.label in seen:
+                    continue
+                seen.add(finding.rule.label)
+                location = pathlib.Path(f"{file_path}!{inner}:{finding.line}")
+                found_issues.append(Issue(location, finding.rule.label, Severity[finding.severity]))
+    return found_issues
+
+def check_archives(project_root: pathlib.Path) -> list:
+    """Scans every zip and tar archive in a project with scan_archive().
+
+    Returns: List of Issue records (path, pattern, severity)
+    """
+    found_issues = []
+    for root, dirs, files in walk_tree(project_root):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            if not is_archive(name):
+                continue
+            file_path = pathlib.Path(root) / name
+            try:
+                found_issues.extend(scan_archive(file_path))
+            except Exception as e:
+                logger.warning(f"Could not read archive {file_path}: {e}")
+                found_issues.append(Issue(file_path, f"READ_ERROR: {e}", Severity.P3))
+
+    return found_issues
+
+# What `rg --type py --type sh --type js --type ts --type md` selects by name
+RG_TYPE_SUFFIXES = {
+    '.py', '.pyi',
+    '.sh', '.bash', '.zsh', '.ksh', '.csh', '.tcsh',
+    '.js', '.jsx', '.mjs', '.cjs', '.vue',
+    '.ts', '.tsx', '.mts', '.cts',
+    '.md', '.markdown', '.mdown', '.mdwn', '.mkd', '.mkdn', '.mdx',
+}
+RG_TYPE_NAMES = {'zshrc', 'zshenv', 'zprofile', 'zlogin', 'zlogout'}
+# The fast path's --glob exclusions; hidden entries are skipped as rg skips them
+RG_EXCLUDE_DIRS = {'venv', 'node_modules'}
+
+
+def iter_rg_files(project_root: pathlib.Path):
+    """Yields the files `rg --type ... -l` would search under project_root.
+
+    Entries are listed with os.scandir: hidden files and directories and the
+    excluded directories are skipped, symlinks are not followed, and files
+    are kept by rg's type globs. Ignore files (.gitignore, .ignore) are not
+    read.
+    """
+    stack = [os.fspath(project_root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
             continue
+        subdirs = []
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in RG_EXCLUDE_DIRS:
+                        subdirs.append(entry.path)
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+            except OSError:
+                continue
+            PROFILER.count("files_visited")
+            if os.path.splitext(entry.name)[1] in RG_TYPE_SUFFIXES or entry.name in RG_TYPE_NAMES:
+                yield pathlib.Path(entry.path)
+            else:
+                PROFILER.skip("file_type")
+        stack.extend(reversed(subdirs))
+
 
-        is_test_file = 'test' in file_path.parts or file_path.name.startswith('test_')
+def _read_candidate(file_path: pathlib.Path) -> bytes | OSError | None:
+    """A file's bytes (read on a pool thread), None if too large to scan, or the read error."""
+    try:
+        if SNIFFER.enabled and file_path.stat().st_size > SNIFFER.max_file_bytes:
+            return None  # scan_file() skips it without reading
+        return file_path.read_bytes()
+    except OSError as e:
+        return e
+
+
+def check_dangerous_functions_parallel(project_root: pathlib.Path, jobs: int | None = None) -> list:
+    """In-process stand-in for check_dangerous_functions_fast() when rg and grep are absent.
+
+    Files are enumerated as rg enumerates them (iter_rg_files) and read on a
+    bounded thread pool; file reads release the GIL. Matching stays on the
+    calling thread. A file goes through scan_file(), for the same findings
+    and severities as the rg path, only if it contains some rule's required
+    literal: a bytes substring search, far cheaper than running the combined
+    pattern the way rg does. That pattern is only consulted for files that
+    fail to decode, which rg lists only if it matches.
+    """
+    ruleset = load_ruleset()
+    literals = {rule.literal.encode() for rule in ruleset.rules}
+    if ruleset.precise is not None:
+        literals.update(needle.encode() for needle in PREFILTER)
+        literals.add(b"rm")  # RM_WORD's literal
+    combined = None
+    jobs = jobs or min(32, (os.cpu_count() or 1) + 4)
+    found_issues = []
 
+    def scan(file_path: pathlib.Path, data) -> None:
+        nonlocal combined
+        if data is None:
+            return
+        if isinstance(data, OSError):
+            logger.warning(f"Could not read file {file_path}: {data}")
+            return  # rg reports unreadable files on stderr and lists nothing
+        PROFILER.read(data)
+        if file_path.name in ruleset.skip_files or not any(literal in data for literal in literals):
+            return
         try:
-            with file_path.open('r') as f:
-                content = f.read()
-
-                # Hardcoded paths: P1 in code, P2 in markdown
-                for pattern in hardcoded_path_patterns:
-                    if pattern in content:
-                        severity = Severity.P1 if is_code_file else Severity.P2
-                        found_issues.append((file_path, pattern, severity))
-
-                # Dangerous functions: only check code files
-                if is_code_file:
-                    for pattern in dangerous_code_patterns:
-                        if pattern in content:
-                            severity = Severity.P2 if is_test_file else Severity.P0
-                            found_issues.append((file_path, pattern, severity))
-                            
+            found_issues.extend(scan_file(file_path, FileSource(file_path, data)))
         except Exception as e:
+            if isinstance(e, UnicodeDecodeError):
+                combined = combined or re.compile(ruleset.pattern().encode())
+                if not combined.search(data):
+                    return
             logger.warning(f"Could not read file {file_path}: {e}")
-            found_issues.append((file_path, f"READ_ERROR: {e}", Severity.P3))
-            
+            found_issues.append(Issue(file_path, f"READ_ERROR: {e}", Severity.P3))
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        # At most a few reads per worker in flight, so memory stays bounded
+        pending = deque()
+        for file_path in iter_rg_files(project_root):
+            pending.append((file_path, pool.submit(_read_candidate, file_path)))
+            if len(pending) >= jobs * 4:
+                file_path, future = pending.popleft()
+                scan(file_path, future.result())
+        while pending:
+            file_path, future = pending.popleft()
+            scan(file_path, future.result())
+
     return found_issues
 
+
 def check_dangerous_functions_fast(project_root: pathlib.Path) -> list:
     """Fast grep-based scanner for pre-commit hooks.
 
-    Uses ripgrep (rg) or grep for sub-second performance.
-    Falls back to regular scan if grep not available.
+    Uses ripgrep (rg) or grep for sub-second performance: one search for the
+    combined ruleset pattern lists candidate files, and only those are read
+    and matched rule by rule.
+    Without either, files are read on a thread pool and matched in-process
+    (check_dangerous_functions_parallel), with the rg path's findings.
     """
     # Check if ripgrep or grep available
     grep_cmd = 'rg' if shutil.which('rg') else 'grep' if shutil.which('grep') else None
 
     if grep_cmd is None:
-        logger.warning("grep/ripgrep not found, falling back to regular scan")
-        return check_dangerous_functions(project_root)
-
-    dangerous_code_patterns = [
-        'os.remove', 'os.unlink', 'shutil.rmtree',
-        'rm -rf', 'rm -r', 'subprocess.run([\'rm\'',
-        'subprocess.run(["rm"', 'subprocess.call(["rm"', 'subprocess.call([\'rm\'',
-    ]
-    hardcoded_path_patterns = [
-        '/Us' + 'ers/', '/ho' + 'me/',
-        'C:\\' + '\\', 'C:/'
-    ]
-    found_issues = []
+        logger.info("grep/ripgrep not found, scanning in-process on a thread pool")
+        return check_dangerous_functions_parallel(project_root)
 
-    # Check dangerous code patterns only in code files
-    for pattern in dangerous_code_patterns:
-        try:
-            if grep_cmd == 'rg':
-                # ripgrep: --type for multiple types, exclude directories
-                cmd = ['rg', '--type', 'py', '--type', 'sh', '--type', 'js', '--type', 'ts',
-                       '--glob', '!.venv/', '--glob', '!venv/', '--glob', '!node_modules/',
-                       '-l', pattern, str(project_root)]
-            else:
-                # grep: -r (recursive), -l (files), --include (code files), --exclude-dir
-                cmd = ['grep', '-r', '-l', 
-                       '--include=*.py', '--include=*.sh', '--include=*.js', '--include=*.ts',
-                       '--exclude-dir=venv', '--exclude-dir=.venv', '--exclude-dir=node_modules',
-                       pattern, str(project_root)]
+    ruleset = load_ruleset()
+    pattern = ruleset.pattern()
+    found_issues = []
 
+    try:
+        if grep_cmd == 'rg':
+            # ripgrep: --type for multiple types, exclude directories
+            cmd = ['rg', '--type', 'py', '--type', 'sh', '--type', 'js', '--type', 'ts', '--type', 'md',
+                   '--glob', '!.venv/', '--glob', '!venv/', '--glob', '!node_modules/',
+                   '-l', '-e', pattern, str(project_root)]
+        else:
+            # grep: -r (recursive), -l (files), -E (extended regex), --include, --exclude-dir
+            cmd = ['grep', '-r', '-l', '-E',
+                   '--include=*.py', '--include=*.sh', '--include=*.js', '--include=*.ts', '--include=*.md',
+                   '--exclude-dir=venv', '--exclude-dir=.venv', '--exclude-dir=node_modules',
+                   '-e', pattern, str(project_root)]
+
+        PROFILER.count("subprocesses")
+        with PROFILER.phase("subprocess"):
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=2, check=False)
 
-            if result.returncode == 0:  # Matches found
-                for file_path in result.stdout.strip().split('\n'):
-                    if file_path:  # Skip empty lines
-                        path_obj = pathlib.Path(file_path)
-                        if path_obj.name == 'warden_audit.py' or path_obj.name == 'validate_project.py':
-                            continue
-                        
-                        is_test_file = 'test' in path_obj.parts or path_obj.name.startswith('test_')
-                        severity = Severity.P2 if is_test_file else Severity.P0
-                        found_issues.append((path_obj, pattern, severity))
-
-        except subprocess.TimeoutExpired:
-            logger.warning(f"Fast scan timeout for pattern: {pattern}")
-        except Exception as e:
-            logger.warning(f"Fast scan error: {e}")
+        if result.returncode == 0:  # Matches found
+            for file_path in result.stdout.strip().split('\n'):
+                if not file_path:  # Skip empty lines
+                    continue
+                path_obj = pathlib.Path(file_path)
+                if path_obj.name in ruleset.skip_files:
+                    continue
+                try:
+                    found_issues.extend(scan_file(path_obj))
+                except Exception as e:
+                    logger.warning(f"Could not read file {path_obj}: {e}")
+                    found_issues.append(Issue(path_obj, f"READ_ERROR: {e}", Severity.P3))
+
+    except subprocess.TimeoutExpired:
+        logger.warning("Fast scan timeout")
+    except Exception as e:
+        logger.warning(f"Fast scan error: {e}")
+
+    return found_issues
+
+def audit_project(index_path: pathlib.Path, root_dir: pathlib.Path, use_fast: bool = False, index=None,
+                  estimate_docs: bool = False) -> tuple:
+    """Audits one project and logs its findings.
+
+    With a warm index (warden_daemon.WardenIndex), tiering, line counts and
+    findings come from memory instead of the filesystem. With estimate_docs
+    the doc ratio is estimated from a sample (estimate_doc_ratio()).
+
+    Returns: (p0_issues, p1_issues, p2_issues)
+    """
+    p0_issues = 0  # Critical
+    p1_issues = 0  # Error
+    p2_issues = 0  # Warning
+    
+    project_root = index_path.parent
+    project_name = project_root.name
+    
+    with PROFILER.phase("tiering"):
+        is_tier_1 = index.is_tier_1(index_path) if index is not None else is_tier_1_project(index_path)
+    tier_label = "Tier 1 (Code)" if is_tier_1 else "Tier 2 (Other)"
     
-    # Check hardcoded paths: P1 in code files, P2 in markdown
-    for pattern in hardcoded_path_patterns:
+    logger.info(f"Auditing Project: {project_name} [{tier_label}]")
+    
+    # Tier 1 Dependency Check
+    if is_tier_1:
+        with PROFILER.phase("dependencies"):
+            has_manifest = check_dependencies(project_root)
+        if not has_manifest:
+            logger.warning(f"[P2-WARNING] {project_name}: Missing dependency manifest")
+            METRICS.finding(Severity.P2.name, "dependency_manifest")
+            p2_issues += 1
+
+    # Documentation Hygiene Check (All Tiers)
+    with PROFILER.phase("doc_ratio"):
+        estimate = estimate_doc_ratio(project_root) if estimate_docs and index is None else None
+        if estimate is not None:
+            doc_ratio, doc_severity, margin = estimate
+        else:
+            doc_ratio, doc_severity = index.doc_ratio(project_root) if index is not None else check_doc_ratio(project_root)
+            margin = 0.0
+    # An estimate states its 95% interval; an exact count states nothing extra
+    spread = f" (estimated ±{margin:.1%})" if margin else ""
+    if doc_severity is not None:
+        METRICS.finding(doc_severity.name, "doc_ratio")
+    if doc_severity == Severity.P1:
+        logger.error(f"[P1-ERROR] {project_name}: Doc bloat critical - docs are {doc_ratio:.0%} of codebase{spread} (>50%)")
+        p1_issues += 1
+    elif doc_severity == Severity.P2:
+        logger.warning(f"[P2-WARNING] {project_name}: Doc ratio high - docs are {doc_ratio:.0%} of codebase{spread} (>20%)")
+        p2_issues += 1
+
+    # Safety Check (All Tiers)
+    with PROFILER.phase("dangerous_functions"):
+        if index is not None:
+            dangerous_usage = index.dangerous_functions(project_root)
+        elif use_fast:
+            dangerous_usage = check_dangerous_functions_fast(project_root)
+        else:
+            dangerous_usage = check_dangerous_functions(project_root)
+    if ARCHIVES.enabled and index is None:
+        with PROFILER.phase("archives"):
+            dangerous_usage += check_archives(project_root)
+    MEMPROFILER.track("dangerous_usage", dangerous_usage)
+    for file_path, pattern, severity in dangerous_usage:
         try:
-            if grep_cmd == 'rg':
-                cmd = ['rg', '--type', 'py', '--type', 'sh', '--type', 'js', '--type', 'ts', '--type', 'md',
-                       '--glob', '!.venv/', '--glob', '!venv/', '--glob', '!node_modules/',
-                       '-l', pattern, str(project_root)]
-            else:
-                cmd = ['grep', '-r', '-l',
-                       '--include=*.py', '--include=*.sh', '--include=*.js', '--include=*.ts', '--include=*.md',
-                       '--exclude-dir=venv', '--exclude-dir=.venv', '--exclude-dir=node_modules',
-                       pattern, str(project_root)]
+            rel_path = file_path.relative_to(root_dir)
+        except ValueError:
+            rel_path = file_path
+        
+        severity_label = f"[{severity.name}-{severity.value}]"
+        METRICS.finding(severity.name, "read_error" if pattern.startswith("READ_ERROR") else pattern)
+        if severity == Severity.P0:
+            logger.error(f"{severity_label} {project_name}: '{pattern}' found in {rel_path}")
+            p0_issues += 1
+        elif severity == Severity.P1:
+            logger.error(f"{severity_label} {project_name}: '{pattern}' found in {rel_path}")
+            p1_issues += 1
+        elif severity == Severity.P2:
+            logger.warning(f"{severity_label} {project_name}: '{pattern}' found in {rel_path}")
+            p2_issues += 1
+        else:
+            logger.info(f"{severity_label} {project_name}: '{pattern}' in {rel_path}")
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=2, check=False)
+    return (p0_issues, p1_issues, p2_issues)
 
-            if result.returncode == 0:
-                for file_path in result.stdout.strip().split('\n'):
-                    if file_path:
-                        path_obj = pathlib.Path(file_path)
-                        if path_obj.name == 'warden_audit.py' or path_obj.name == 'validate_project.py':
-                            continue
-                        # P1 for code, P2 for markdown
-                        severity = Severity.P1 if path_obj.suffix in ['.py', '.sh', '.js', '.ts'] else Severity.P2
-                        found_issues.append((path_obj, pattern, severity))
-
-        except subprocess.TimeoutExpired:
-            logger.warning(f"Fast scan timeout for pattern: {pattern}")
-        except Exception as e:
-            logger.warning(f"Fast scan error: {e}")
+INDEX_GLOB = '00_Index_*.md'
+# Index files under these directories are not projects
+INDEX_SKIP_PARTS = ['templates', 'venv', '.git']
 
-    return found_issues
 
-def run_audit(root_dir: pathlib.Path, use_fast: bool = False) -> bool:
-    """Crawls the ecosystem and performs the audit."""
+def is_project_index(index_path: pathlib.Path) -> bool:
+    """Whether a 00_Index_*.md file marks a project (not a template or vendored copy)."""
+    return not any(part in index_path.parts for part in INDEX_SKIP_PARTS)
+
+def run_audit(root_dir: pathlib.Path, use_fast: bool = False, index=None, estimate_docs: bool = False) -> bool:
+    """Crawls the ecosystem and performs the audit.
+
+    With a warm index the project list and per-project results come from it
+    (see warden_daemon.py).
+    """
     logger.info(f"Starting Warden Audit in: {root_dir}")
     
     projects_found = 0
@@ -265,55 +610,21 @@ def run_audit(root_dir: pathlib.Path, use_fast: bool = False) -> bool:
     p2_issues = 0  # Warning
     
     # Find all project roots by looking for 00_Index_*.md files
-    for index_path in root_dir.rglob('00_Index_*.md'):
+    with PROFILER.phase("discovery"):
+        index_paths = index.index_paths() if index is not None else list(root_dir.rglob(INDEX_GLOB))
+    
+    for index_path in index_paths:
         # Skip indices in templates
-        if any(part in index_path.parts for part in ['templates', 'venv', '.git']):
+        if not is_project_index(index_path):
             continue
             
         projects_found += 1
-        project_root = index_path.parent
-        project_name = project_root.name
-        
-        is_tier_1 = is_tier_1_project(index_path)
-        tier_label = "Tier 1 (Code)" if is_tier_1 else "Tier 2 (Other)"
-        
-        logger.info(f"Auditing Project: {project_name} [{tier_label}]")
-        
-        # Tier 1 Dependency Check
-        if is_tier_1:
-            if not check_dependencies(project_root):
-                logger.warning(f"[P2-WARNING] {project_name}: Missing dependency manifest")
-                p2_issues += 1
-
-        # Documentation Hygiene Check (All Tiers)
-        doc_ratio, doc_severity = check_doc_ratio(project_root)
-        if doc_severity == Severity.P1:
-            logger.error(f"[P1-ERROR] {project_name}: Doc bloat critical - docs are {doc_ratio:.0%} of codebase (>50%)")
-            p1_issues += 1
-        elif doc_severity == Severity.P2:
-            logger.warning(f"[P2-WARNING] {project_name}: Doc ratio high - docs are {doc_ratio:.0%} of codebase (>20%)")
-            p2_issues += 1
-
-        # Safety Check (All Tiers)
-        dangerous_usage = check_dangerous_functions_fast(project_root) if use_fast else check_dangerous_functions(project_root)
-        for file_path, pattern, severity in dangerous_usage:
-            try:
-                rel_path = file_path.relative_to(root_dir)
-            except ValueError:
-                rel_path = file_path
-            
-            severity_label = f"[{severity.name}-{severity.value}]"
-            if severity == Severity.P0:
-                logger.error(f"{severity_label} {project_name}: '{pattern}' found in {rel_path}")
-                p0_issues += 1
-            elif severity == Severity.P1:
-                logger.error(f"{severity_label} {project_name}: '{pattern}' found in {rel_path}")
-                p1_issues += 1
-            elif severity == Severity.P2:
-                logger.warning(f"{severity_label} {project_name}: '{pattern}' found in {rel_path}")
-                p2_issues += 1
-            else:
-                logger.info(f"{severity_label} {project_name}: '{pattern}' in {rel_path}")
+        project_name = index_path.parent.name
+        with TRACER.span(project_name, cat="project"), METRICS.project(project_name):
+            p0, p1, p2 = audit_project(index_path, root_dir, use_fast, index, estimate_docs)
+        p0_issues += p0
+        p1_issues += p1
+        p2_issues += p2
                     
     logger.info("--- Audit Summary ---")
     logger.info(f"Projects scanned: {projects_found}")
@@ -330,14 +641,65 @@ if __name__ == "__main__":
     parser.add_argument("--root", default=".", help="Root directory to scan (default: .)")
     parser.add_argument("--fast", action="store_true",
                        help="Fast scan mode for pre-commit hooks (<1s target)")
+    parser.add_argument("--precise", action="store_true",
+                       help="Parse .py files and report only real dangerous calls (AST, cached by content hash)")
+    parser.add_argument("--archives", action="store_true",
+                       help="Also scan members of .zip and .tar(.gz/.bz2/.xz) archives, streamed without extraction")
+    parser.add_argument("--estimate-docs", action="store_true",
+                       help="Estimate the doc ratio from file sizes and a sample of files; count exactly only near a threshold")
+    parser.add_argument("--no-sniff", action="store_true",
+                       help="Scan every file of a scanned type, even binary, generated, minified or oversized ones")
+    parser.add_argument("--serve", action="store_true",
+                       help="Run as a daemon keeping a warm index of --root, answering --query over a Unix socket")
+    parser.add_argument("--poll", action="store_true",
+                       help="With --serve: re-stat the tree at query time instead of using inotify")
+    parser.add_argument("--query", action="store_true",
+                       help="Ask the --serve daemon for the audit; scans in-process if none is running")
+    add_profile_argument(parser)
+    add_trace_arguments(parser)
+    add_metrics_argument(parser)
+    add_memprofile_argument(parser)
+    add_rule_costs_argument(parser)
     args = parser.parse_args()
     
+    if args.profile:
+        PROFILER.enable(args.profile)
+    if args.trace:
+        TRACER.enable(args.trace, args.trace_slow_ms)
+    if args.metrics_file:
+        METRICS.enable(args.metrics_file, "warden_audit")
+    if args.memprofile:
+        MEMPROFILER.enable(args.memprofile)
+    if args.rule_costs:
+        RULE_COSTS.enable()
+    
     # Standardize to pathlib.Path and relative path if possible
     root_path = pathlib.Path(args.root).resolve()
     try:
         root_path = root_path.relative_to(pathlib.Path.cwd())
     except ValueError:
         pass # Keep absolute if not under CWD, but preference is relative
-        
-    success = run_audit(root_path, use_fast=args.fast)
+    
+    if args.precise:
+        load_ruleset().enable_precise(root_path / AST_CACHE)
+    if args.archives:
+        ARCHIVES.enable()
+    if args.no_sniff:
+        SNIFFER.enabled = False
+    
+    if args.serve:
+        from warden_daemon import serve
+        with PROFILER.phase("total"):
+            serve(root_path, poll=args.poll)
+        sys.exit(0)
+    if args.query:
+        from warden_daemon import query
+        answer = query(root_path, {"command": "audit"})
+        if answer is not None and "log" in answer:
+            for level, message in answer["log"]:
+                logger.log(level, message)
+            sys.exit(0 if answer["success"] else 1)
+
+    with PROFILER.phase("total"):
+        success = run_audit(root_path, use_fast=args.fast, estimate_docs=args.estimate_docs)
     sys.exit(0 if success else 1)
@@ -0,0 +1,535 @@
+"""
+Warden Daemon - A long-running warden that keeps a warm in-memory index.
+
+Every commit hook that runs warden_audit.py starts cold. It rediscovers
+projects with rglob('00_Index_*.md') and reads and rescans every file.
+`warden_audit.py --serve` keeps the following in memory for one
+ecosystem root instead:
+
+- the project map: index files and each project's tier,
+- per-file findings and doc-ratio line counts, keyed by (mtime, size).
+
+inotify events keep the index current: changed paths are re-stat'ed and
+only files whose (mtime, size) moved are read again. Where inotify is not
+available (not Linux, a network filesystem, or the watch limit reached),
+the index is re-walked at query time. That walk only stats files, so it
+is still far cheaper than a cold scan.
+
+Hooks run `warden_audit.py --query`. The audit is computed by the daemon,
+sent back over a Unix domain socket, and logged exactly as an in-process
+audit would log it. If no daemon answers, --query scans in-process. The
+daemon answers with the scan options it was started with (--precise,
+--archives); a client's own options apply only to the fallback.
+
+    python scripts/warden_audit.py --root . --serve &
+    python scripts/warden_audit.py --root . --fast --query
+"""
+
+import ctypes
+import ctypes.util
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import select
+import signal
+import socket
+import stat
+import struct
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import warden_audit
+from archive_scan import ARCHIVES, is_archive
+from content_sniff import SNIFFER
+from dedup import DEDUP, FileSource, walk_tree
+from instrumentation import PROFILER
+from records import Issue
+from ruleset import load_ruleset
+from warden_audit import (
+    CODE_EXTENSIONS,
+    INDEX_GLOB,
+    SCAN_SUFFIXES,
+    SKIP_DIRS,
+    Severity,
+    count_lines,
+    doc_ratio_severity,
+    is_project_index,
+    is_tier_1_project,
+    read_text,
+    run_audit,
+    scan_archive,
+    scan_file,
+)
+
+logger = logging.getLogger(__name__)
+
+SOCKET_NAME = ".warden.sock"
+# sun_path holds 108 bytes on Linux and 104 on macOS
+MAX_SOCKET_PATH = 100
+QUERY_TIMEOUT = 60.0
+PING_TIMEOUT = 1.0
+
+# inotify(7) event bits
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+# struct inotify_event: wd, mask, cookie, len, then len bytes of NUL-padded name
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def socket_path(root: Path) -> Path:
+    """Where the daemon for an ecosystem root listens."""
+    root = root.resolve()
+    path = root / SOCKET_NAME
+    if len(os.fsencode(path)) <= MAX_SOCKET_PATH:
+        return path
+    # Too long for sun_path: fall back to a per-root name in the temp dir
+    digest = hashlib.sha1(os.fsencode(root)).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f"warden-{digest}.sock"
+
+
+class InotifyWatcher:
+    """Directory watches through inotify(7), called via ctypes (Linux only)."""
+
+    name = "inotify"
+
+    def __init__(self):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = (ctypes.c_int, ctypes.c_int)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1: {os.strerror(errno)}")
+        # One watch per inode; a symlinked directory shares its target's watch
+        self._paths: dict[int, set[str]] = {}
+
+    def fileno(self) -> int:
+        return self.fd
+
+    def watch(self, dirpath: str) -> None:
+        wd = self._add_watch(self.fd, os.fsencode(dirpath), WATCH_MASK | IN_ONLYDIR)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch: {os.strerror(errno)}", dirpath)
+        self._paths.setdefault(wd, set()).add(dirpath)
+
+    def forget(self, prefix: str) -> None:
+        """Drop watches for a directory and everything below it."""
+        below = prefix + os.sep
+        for wd, paths in list(self._paths.items()):
+            paths -= {path for path in paths if path == prefix or path.startswith(below)}
+            if not paths:
+                del self._paths[wd]
+                self._rm_watch(self.fd, wd)  # Fails harmlessly if the kernel already dropped it
+
+    def changes(self) -> set[str] | None:
+        """Paths touched since the last call; None if the kernel queue overflowed."""
+        changed: set[str] | None = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    changed = None
+                elif mask & IN_IGNORED:
+                    self._paths.pop(wd, None)
+                elif changed is not None:
+                    for dirpath in self._paths.get(wd, ()):
+                        changed.add(os.path.join(dirpath, name) if name else dirpath)
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Fallback without events: every refresh re-walks the tree and re-stats files."""
+
+    name = "polling"
+
+    def fileno(self) -> None:
+        return None
+
+    def watch(self, dirpath: str) -> None:
+        pass
+
+    def forget(self, prefix: str) -> None:
+        pass
+
+    def changes(self) -> None:
+        return None
+
+    def close(self) -> None:
+        pass
+
+
+def make_watcher(poll: bool = False):
+    """An inotify watcher, or the polling fallback where inotify is unavailable."""
+    if not poll:
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError) as e:
+            logger.warning(f"inotify unavailable ({e}); polling at query time instead")
+    return PollingWatcher()
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """What the audit needs from one file, valid while its (mtime, size) holds."""
+    stamp: tuple[int, int]
+    lines: int | None
+    is_doc: bool
+    is_archive: bool
+    issues: tuple
+
+
+class WardenIndex:
+    """The warden's view of an ecosystem root, updated path by path.
+
+    Provides what run_audit() and audit_project() read from disk:
+    index_paths(), is_tier_1(), doc_ratio() and dangerous_functions().
+    """
+
+    def __init__(self, root: Path, watcher):
+        self.root = root
+        self._root = os.fspath(root)
+        self.watcher = watcher
+        self.files: dict[str, dict[str, FileEntry]] = {}  # dirpath -> name -> entry
+        self.indexes: set[str] = set()
+        self._projects: dict[str, tuple] = {}  # project root -> (doc ratio, issues)
+        self.pending: set[str] | None = set()
+
+    def build(self) -> None:
+        self._walk(self._root)
+
+    def add(self, dirpath: str, name: str, source: FileSource | None = None) -> None:
+        """Index one file found by someone else's walk, reusing its read if given."""
+        self._update_file(dirpath, name, source)
+
+    def file_count(self) -> int:
+        return sum(len(entries) for entries in self.files.values())
+
+    # --- queries (same answers as the filesystem scans in warden_audit.py) ---
+
+    def index_paths(self) -> list[Path]:
+        return [Path(path) for path in sorted(self.indexes)]
+
+    def is_tier_1(self, index_path: Path) -> bool:
+        return is_tier_1_project(index_path)  # Parsed once per (mtime, size) by the index catalog
+
+    def doc_ratio(self, project_root: Path) -> tuple:
+        return self._project(os.fspath(project_root))[0]
+
+    def dangerous_functions(self, project_root: Path) -> list:
+        return list(self._project(os.fspath(project_root))[1])
+
+    def _project(self, project_root: str) -> tuple:
+        cached = self._projects.get(project_root)
+        if cached is not None:
+            return cached
+        code_lines = doc_lines = 0
+        issues, archive_issues = [], []
+        below = project_root + os.sep
+        real_root = os.path.realpath(project_root)
+        for dirpath in sorted(self.files):
+            if dirpath != project_root and not dirpath.startswith(below):
+                continue
+            # A walk from the project root does not follow symlinks out of the project
+            if os.path.commonpath([real_root, os.path.realpath(dirpath)]) != real_root:
+                continue
+            entries = self.files[dirpath]
+            for name in sorted(entries):
+                entry = entries[name]
+                if entry.lines is not None:
+                    if entry.is_doc:
+                        doc_lines += entry.lines
+                    else:
+                        code_lines += entry.lines
+                (archive_issues if entry.is_archive else issues).extend(entry.issues)
+        cached = self._projects[project_root] = (doc_ratio_severity(code_lines, doc_lines), issues + archive_issues)
+        return cached
+
+    # --- updates ---
+
+    def collect(self) -> None:
+        """Move pending watcher events into the refresh queue."""
+        changes = self.watcher.changes()
+        if changes is None:
+            self.pending = None
+        elif self.pending is not None:
+            self.pending |= changes
+
+    def refresh(self) -> None:
+        """Bring the index up to date with everything collected so far."""
+        self.collect()
+        pending, self.pending = self.pending, set()
+        ARCHIVES.reset_budget()
+        SNIFFER.clear()  # Verdicts of files edited since would only accumulate
+        with PROFILER.phase("index_refresh"):
+            if pending is None:
+                self._rescan()
+            else:
+                for path in sorted(pending):
+                    self._refresh_path(path)
+
+    def _refresh_path(self, path: str) -> None:
+        if self._skipped(path):
+            return
+        if os.path.isdir(path):
+            if self._inside_root(path):
+                self._walk(path)
+            return
+        dirpath, name = os.path.split(path)
+        if os.path.isfile(path):
+            self._update_file(dirpath, name)
+        else:
+            self._drop_file(dirpath, name)
+            self._drop_tree(path)
+
+    def _rescan(self) -> None:
+        """Re-walk the whole root, re-reading only files whose (mtime, size) changed."""
+        seen = set()
+        for dirpath, dirnames, filenames in walk_tree(self._root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            seen.add(dirpath)
+            self._watch(dirpath)
+            for name in set(self.files.get(dirpath, ())) - set(filenames):
+                self._drop_file(dirpath, name)
+            for name in filenames:
+                self._update_file(dirpath, name)
+        for dirpath in set(self.files) - seen:
+            self._drop_tree(dirpath)
+
+    def _walk(self, top: str) -> None:
+        for dirpath, dirnames, filenames in walk_tree(top):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            self._watch(dirpath)
+            for name in filenames:
+                self._update_file(dirpath, name)
+
+    def _watch(self, dirpath: str) -> None:
+        try:
+            self.watcher.watch(dirpath)
+        except OSError as e:
+            # Typically the inotify watch limit; polling still sees every change
+            logger.warning(f"Cannot watch {dirpath} ({e}); switching to polling")
+            self.watcher.close()
+            self.watcher = PollingWatcher()
+            self.pending = None
+
+    def _update_file(self, dirpath: str, name: str, source: FileSource | None = None) -> None:
+        if not self._tracked(name):
+            return
+        path = os.path.join(dirpath, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._drop_file(dirpath, name)
+            return
+        if not stat.S_ISREG(st.st_mode):
+            self._drop_file(dirpath, name)
+            return
+        stamp = (st.st_mtime_ns, st.st_size)
+        entries = self.files.setdefault(dirpath, {})
+        entry = entries.get(name)
+        if entry is not None and entry.stamp == stamp:
+            return
+        entries[name] = self._scan(Path(path), stamp, source)
+        self._changed(path)
+        if fnmatch.fnmatch(name, INDEX_GLOB) and is_project_index(Path(path)):
+            self.indexes.add(path)
+
+    def _scan(self, file_path: Path, stamp: tuple[int, int], source: FileSource | None = None) -> FileEntry:
+        """Line count and findings for one file, as check_doc_ratio() and the scanners compute them."""
+        suffix = file_path.suffix
+        is_doc = suffix == '.md'
+        lines = None
+        if (is_doc or suffix in CODE_EXTENSIONS) and not SNIFFER.skip_reason(file_path):
+            try:
+                text = source.text(errors='ignore') if source is not None else read_text(file_path, errors='ignore')
+                lines = count_lines(text)
+            except Exception:
+                PROFILER.skip("unreadable")
+
+        issues = ()
+        archive = False
+        try:
+            if file_path.name in load_ruleset().skip_files:
+                PROFILER.skip("self")
+            elif suffix in SCAN_SUFFIXES:
+                issues = tuple(scan_file(file_path, source))
+            elif ARCHIVES.enabled and is_archive(file_path.name):
+                archive = True
+                issues = tuple(scan_archive(file_path))
+        except Exception as e:
+            logger.warning(f"Could not read file {file_path}: {e}")
+            issues = (Issue(file_path, f"READ_ERROR: {e}", Severity.P3),)
+        return FileEntry(stamp, lines, is_doc, archive, issues)
+
+    def _drop_file(self, dirpath: str, name: str) -> None:
+        entries = self.files.get(dirpath)
+        if entries is None or name not in entries:
+            return
+        del entries[name]
+        path = os.path.join(dirpath, name)
+        self.indexes.discard(path)
+        self._changed(path)
+
+    def _drop_tree(self, top: str) -> None:
+        below = top + os.sep
+        for dirpath in [d for d in self.files if d == top or d.startswith(below)]:
+            for name in list(self.files[dirpath]):
+                self._drop_file(dirpath, name)
+            del self.files[dirpath]
+        self.watcher.forget(top)
+
+    def _changed(self, path: str) -> None:
+        """Forget the aggregates of every project containing path."""
+        for project_root in [root for root in self._projects if path.startswith(root + os.sep)]:
+            del self._projects[project_root]
+
+    def _tracked(self, name: str) -> bool:
+        suffix = os.path.splitext(name)[1]
+        return (suffix == '.md' or suffix in CODE_EXTENSIONS or suffix in SCAN_SUFFIXES
+                or (ARCHIVES.enabled and is_archive(name)))
+
+    def _skipped(self, path: str) -> bool:
+        rel = os.path.relpath(path, self._root)
+        parts = rel.split(os.sep)
+        return parts[0] == os.pardir or any(part in SKIP_DIRS for part in parts)
+
+    def _inside_root(self, path: str) -> bool:
+        real_root = os.path.realpath(self._root)
+        return os.path.commonpath([real_root, os.path.realpath(path)]) == real_root
+
+
+class _LogCapture(logging.Handler):
+    """Collects the audit's log records so the client can replay them."""
+
+    def __init__(self):
+        super().__init__()
+        self.records: list[tuple[int, str]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append((record.levelno, record.getMessage()))
+
+
+def audit(index: WardenIndex) -> dict:
+    """Run the audit against the warm index, capturing what it logs."""
+    capture = _LogCapture()
+    audit_logger = warden_audit.logger
+    audit_logger.addHandler(capture)
+    audit_logger.propagate = False
+    try:
+        success = run_audit(index.root, index=index)
+    finally:
+        audit_logger.removeHandler(capture)
+        audit_logger.propagate = True
+    return {"success": success, "log": capture.records}
+
+
+def handle(conn: socket.socket, index: WardenIndex) -> bool:
+    """Answer one request. Returns False when asked to stop."""
+    with conn:
+        conn.settimeout(QUERY_TIMEOUT)
+        with conn.makefile("rb") as f:
+            line = f.readline()
+        try:
+            command = json.loads(line or b"{}").get("command")
+        except ValueError:
+            command = None
+        if command == "audit":
+            index.refresh()
+            reply = audit(index)
+        elif command in ("ping", "stop"):
+            reply = {"ok": True, "watcher": index.watcher.name, "files": index.file_count()}
+        else:
+            reply = {"error": f"unknown command {command!r}"}
+        conn.sendall(json.dumps(reply).encode() + b"\n")
+    return command != "stop"
+
+
+def serve(root: Path, poll: bool = False) -> None:
+    """Index root, then answer queries on its socket until stopped."""
+    root = root.resolve()
+    path = socket_path(root)
+    if query(root, {"command": "ping"}, timeout=PING_TIMEOUT) is not None:
+        logger.error(f"A warden daemon is already serving {root} on {path}")
+        sys.exit(1)
+    path.unlink(missing_ok=True)  # Left behind by a daemon that died
+
+    # The index is the long-lived memo; a run-scoped one would only grow
+    DEDUP.enabled = False
+    index = WardenIndex(root, make_watcher(poll))
+    with PROFILER.phase("index_build"):
+        index.build()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(os.fspath(path))
+    server.listen(8)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    logger.info(f"Warden daemon serving {root} on {path}: "
+                f"{index.file_count()} files, {len(index.indexes)} index files, {index.watcher.name}")
+    try:
+        running = True
+        while running:
+            watcher_fd = index.watcher.fileno()
+            fds = [server] if watcher_fd is None else [server, watcher_fd]
+            readable, _, _ = select.select(fds, [], [])
+            if watcher_fd in readable:
+                index.refresh()  # Apply edits as they happen so queries find a warm index
+            if server in readable:
+                conn, _ = server.accept()
+                try:
+                    running = handle(conn, index)
+                except OSError as e:
+                    logger.warning(f"Query failed: {e}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        index.watcher.close()
+        path.unlink(missing_ok=True)
+
+
+def query(root: Path, request: dict, timeout: float = QUERY_TIMEOUT) -> dict | None:
+    """Send one request to the daemon serving root; None if none answers."""
+    path = socket_path(root)
+    if not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(os.fspath(path))
+            client.sendall(json.dumps(request).encode() + b"\n")
+            with client.makefile("rb") as f:
+                line = f.readline()
+        return json.loads(line)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,6 @@
+"""Put scripts/ on sys.path, as running a script from it does."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
@@ -0,0 +1,40 @@
+"""Tests pinning what the shared governance rules match."""
+
+from pathlib import Path
+
+import pytest
+
+from ruleset import load_ruleset
+
+
+def rm_findings(path, source):
+    findings = load_ruleset().scan(Path(path), source, families=("dangerous",))
+    return [(f.rule.id, f.severity) for f in findings if f.rule.id == "rm-command"]
+
+
+@pytest.mark.parametrize("source", [
+    'os.system("rm -rf build")\n',
+    'os.system("rm -r build")\n',
+    'os.system("rm file.txt")\n',
+    'CLEAN = "rm -f *.pyc"\n',
+])
+def test_any_rm_command_in_code_is_p0(source):
+    assert rm_findings("src/build.py", source) == [("rm-command", "P0")]
+
+
+@pytest.mark.parametrize("path, severity", [
+    ("tests/test_build.py", "P2"),
+    ("README.md", "P3"),
+])
+def test_rm_outside_code_is_downgraded(path, severity):
+    assert rm_findings(path, "rm file.txt\n") == [("rm-command", severity)]
+
+
+@pytest.mark.parametrize("source", [
+    "rm_file(path)\n",
+    'os.system("format -r disk")\n',
+    'os.system("farm -r")\n',
+    "shutil.rmtree(path)\n",
+])
+def test_rm_inside_words_is_not_matched(source):
+    assert rm_findings("src/build.py", source) == []
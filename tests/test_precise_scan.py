@@ -0,0 +1,46 @@
+"""Tests for the AST tier behind the warden's --precise mode."""
+
+from pathlib import Path
+
+import pytest
+
+from ast_scan import find_dangerous_calls, needs_parse
+from ruleset import Ruleset, load_ruleset
+
+
+@pytest.fixture
+def precise():
+    shared = load_ruleset()
+    ruleset = Ruleset(shared.rules, shared.skip_files)
+    ruleset.enable_precise()
+    return ruleset
+
+
+def dangerous(ruleset, source):
+    return [(f.rule.id, f.severity, f.line) for f in ruleset.scan(Path("src/build.py"), source, families=("dangerous",))]
+
+
+@pytest.mark.parametrize("source", [
+    'import subprocess\nsubprocess.run("cd /tmp && rm -rf build", shell=True)\n',
+    'import os\nos.system("make clean; rm -rf dist")\n',
+    'import os\nos.system(" rm -rf dist")\n',
+])
+def test_chained_shell_rm_is_parsed_and_reported(precise, source):
+    assert needs_parse(source)
+    assert dangerous(precise, source) == [("rm-command", "P0", 2)]
+
+
+def test_absolute_rm_argv_is_reported(precise):
+    source = 'import subprocess as sp\nsp.run(["/bin/rm", "-rf", "build"])\n'
+    assert needs_parse(source)
+    assert dangerous(precise, source) == [("subprocess-rm", "P0", 2)]
+
+
+def test_rm_outside_calls_is_not_reported(precise):
+    source = '# rm -rf build when done\nHELP = "run rm -rf build by hand"\n'
+    assert find_dangerous_calls(source) == []
+    assert dangerous(precise, source) == []
+
+
+def test_files_without_rm_or_removal_names_are_not_parsed():
+    assert not needs_parse("import platform\nprint(platform.system())  # format\n")
@@ -0,0 +1,58 @@
+"""Tests for the credential-assignment heuristic in secret_scan."""
+
+import pytest
+
+from secret_scan import CREDENTIAL_WORDS, NAME_HINT, assignment_values, iter_entropy_secrets
+
+
+def secrets(content: str) -> list[str]:
+    return [value for _, value, _ in iter_entropy_secrets(content)]
+
+
+@pytest.mark.parametrize("line", [
+    "author: JohnSmithTheDeveloper2024",
+    "monkey = BananaRepublic1999Forever",
+    "keyframes = useAnimationKeyframes2Value",
+    "primaryKeyColumn = userAccountIdentifier42",
+    "auth_callback = handleOAuth2CallbackForGoogleProvider",
+    "token = getAccessTokenFromRequest2024x",
+])
+def test_ordinary_code_is_not_a_secret(line):
+    assert secrets(line) == []
+
+
+@pytest.mark.parametrize("line, value", [
+    ('api_key = "aB3dE5gH7jK9mN1pQ3sT5vX7"', "aB3dE5gH7jK9mN1pQ3sT5vX7"),
+    ("API_KEY=aB3dE5gH7jK9mN1pQ3sT5vX7", "aB3dE5gH7jK9mN1pQ3sT5vX7"),
+    ('"client_secret": "9f8e7d6c5b4a39281706f5e4d3c2b1a0"', "9f8e7d6c5b4a39281706f5e4d3c2b1a0"),
+    ('apiKey: "Zq8Xw7Vu6Ts5Rq4Po3Nm2Lk1"', "Zq8Xw7Vu6Ts5Rq4Po3Nm2Lk1"),
+    ("AUTH_TOKEN = 7Hq2Lm9Xw4Rt8Yp3Zs6Kv1B", "7Hq2Lm9Xw4Rt8Yp3Zs6Kv1B"),
+    ("db_password = aB3dE5gH7/K9mN1pQ3sT5vX7", "aB3dE5gH7/K9mN1pQ3sT5vX7"),
+])
+def test_literal_credential_is_a_secret(line, value):
+    assert secrets(line) == [value]
+
+
+@pytest.mark.parametrize("name", ["monkey", "keyframes", "donkey_id", "authorName", "tokenizer"])
+def test_credential_word_inside_a_segment_is_ignored(name):
+    assert assignment_values(f'{name} = "aB3dE5gH7jK9mN1pQ3sT5vX7"') == {}
+
+
+@pytest.mark.parametrize("name", ["api_key", "api-key", "apiKey", "APIKey", "key2", "SECRET"])
+def test_credential_word_as_a_segment_is_found(name):
+    content = f'{name} = "aB3dE5gH7jK9mN1pQ3sT5vX7"'
+    assert list(assignment_values(content)) == [content.index('"') + 1]
+
+
+def test_short_values_are_ignored():
+    assert secrets('api_key = "short"') == []
+
+
+def test_every_credential_word_holds_a_name_hint_letter():
+    # ASSIGNMENT skips names without one, so a word lacking them would never be found
+    assert [word for word in CREDENTIAL_WORDS if not set(word) & set(NAME_HINT)] == []
+
+
+def test_nested_assignments_share_the_outer_value_end():
+    content = "key=token=aB3dE5gH7jK9mN1pQ3sT5vX7"
+    assert assignment_values(content) == {4: len(content), 10: len(content)}
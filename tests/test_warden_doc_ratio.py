@@ -0,0 +1,72 @@
+"""Tests for the sampled doc ratio estimate in warden_audit."""
+
+import random
+import types
+
+import pytest
+
+import warden_audit
+from warden_audit import MIN_STRATUM_SAMPLE, check_doc_ratio, estimate_doc_ratio
+
+
+def write_files(directory, suffix, line_counts, rng):
+    """One file per line count, with lines of varying width."""
+    directory.mkdir(parents=True, exist_ok=True)
+    for i, lines in enumerate(line_counts):
+        body = "".join("x" * rng.randint(1, 80) + "\n" for _ in range(lines))
+        (directory / f"f{i:04d}{suffix}").write_text(body)
+
+
+def make_project(root, code_files, doc_ratio, seed=0):
+    """code_files .py files of random length, and 10 .md files totalling doc_ratio of their lines."""
+    rng = random.Random(seed)
+    line_counts = [rng.randint(5, 120) for _ in range(code_files)]
+    write_files(root / "src", ".py", line_counts, rng)
+    write_files(root / "docs", ".md", [round(doc_ratio * sum(line_counts) / 10)] * 10, rng)
+    return root
+
+
+def test_strata_up_to_min_sample_are_counted_exactly(tmp_path):
+    project = make_project(tmp_path, MIN_STRATUM_SAMPLE, 1.5)
+    ratio, severity, margin = estimate_doc_ratio(project)
+    assert margin == 0
+    assert (ratio, severity) == check_doc_ratio(project)
+
+
+def test_larger_stratum_is_sampled(tmp_path):
+    project = make_project(tmp_path, MIN_STRATUM_SAMPLE + 1, 1.5)
+    estimate = estimate_doc_ratio(project)
+    assert estimate is not None
+    assert estimate[2] > 0
+
+
+@pytest.fixture
+def sample_seed(monkeypatch):
+    """Seed the sample with a fixed value instead of the (temporary) project path."""
+    def seed(value):
+        monkeypatch.setattr(warden_audit, "random", types.SimpleNamespace(Random=lambda _: random.Random(value)))
+    return seed
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_interval_contains_exact_ratio(tmp_path, sample_seed, seed):
+    # 600 code files are sampled; docs at 1.5x code sit well inside one severity band
+    project = make_project(tmp_path, 600, 1.5, seed)
+    sample_seed(seed)
+    ratio, severity, margin = estimate_doc_ratio(project)
+    exact_ratio, exact_severity = check_doc_ratio(project)
+    assert 0 < margin < 0.5
+    assert abs(ratio - exact_ratio) <= margin
+    assert severity == exact_severity
+
+
+def test_interval_across_threshold_falls_back_to_exact(tmp_path, sample_seed):
+    project = make_project(tmp_path, 600, 0.2)
+    sample_seed(0)
+    assert check_doc_ratio(project)[0] == pytest.approx(0.2, abs=0.005)
+    assert estimate_doc_ratio(project) is None
+
+
+def test_no_code_falls_back_to_exact(tmp_path):
+    write_files(tmp_path, ".md", [10, 20], random.Random(0))
+    assert estimate_doc_ratio(tmp_path) is None